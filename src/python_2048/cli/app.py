@@ -1,17 +1,43 @@
 """Module of the CLI application."""
 
+import importlib
 import logging
 
 import typer
+import typer.core
+import typer.main
 import typing_extensions
 
-from python_2048.cli.commands.run import app as run_command
-from python_2048.cli.commands.version import app as version_command
 from python_2048.configurations import log_utils
 
-app = typer.Typer()
-app.add_typer(run_command)
-app.add_typer(version_command)
+COMMAND_MODULES = {
+    "profile": "python_2048.cli.commands.profile",
+    "replay": "python_2048.cli.commands.replay",
+    "run": "python_2048.cli.commands.run",
+    "simulate": "python_2048.cli.commands.simulate",
+    "train": "python_2048.cli.commands.train",
+    "version": "python_2048.cli.commands.version",
+}
+"""The modules of the commands by their names, each of which has a single-command `app`."""
+
+
+class _LazyCommandGroup(typer.core.TyperGroup):
+    """A group that only imports the module of a command once it is invoked or listed,
+    so that a command does not pay for the imports of the others, e.g. of LLM clients."""
+
+    # the parameters are typed by the base class, whose `click` is vendored by `typer`
+    def list_commands(self, ctx) -> list[str]:
+        return sorted({*super().list_commands(ctx), *COMMAND_MODULES})
+
+    def get_command(self, ctx, cmd_name: str):
+        if cmd_name in COMMAND_MODULES:
+            module = importlib.import_module(COMMAND_MODULES[cmd_name])
+            return typer.main.get_command(module.app)
+
+        return super().get_command(ctx, cmd_name)
+
+
+app = typer.Typer(cls=_LazyCommandGroup)
 
 
 @app.callback()
@@ -0,0 +1,112 @@
+"""Module of the `profile` command."""
+
+import cProfile
+import io
+import pathlib
+import pstats
+import typing
+
+import typer
+
+from python_2048.cli.commands import simulate
+from python_2048.cli.lib import profiling
+from python_2048.game.lib import random_utils
+from python_2048.players import exceptions, expectimax, ntuple
+
+NUM_TOP_FUNCTIONS = 15
+"""The number of functions with the most self time that are printed."""
+
+app = typer.Typer()
+
+
+@app.command()
+def profile(
+    num_games: typing.Annotated[
+        int,
+        typer.Option("-n", "--games", min=1, help="The number of games to play."),
+    ] = 10,
+    player_kind: typing.Annotated[
+        simulate.PlayerKind,
+        typer.Option("-p", "--player", help="The player of the games, an n-tuple needs weights."),
+    ] = simulate.PlayerKind.RANDOM,
+    time_budget: typing.Annotated[
+        float,
+        typer.Option(
+            "--time-budget",
+            min=0,
+            help="The number of seconds that the expectimax player may search for each move.",
+        ),
+    ] = expectimax.DEFAULT_TIME_BUDGET,
+    weights_path: typing.Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--weights",
+            exists=True,
+            dir_okay=False,
+            resolve_path=True,
+            help="The path to the weights file of the n-tuple player, as written by `train`.",
+        ),
+    ] = None,
+    seed: typing.Annotated[
+        int,
+        typer.Option(
+            help="An integer that configures the random number generator, "
+            "the same seed plays the same games as `simulate`.",
+        ),
+    ] = 0,
+    pstats_path: typing.Annotated[
+        pathlib.Path,
+        typer.Option(
+            "--pstats",
+            dir_okay=False,
+            resolve_path=True,
+            help="The path to write the statistics to, for `pstats` or `snakeviz`.",
+        ),
+    ] = pathlib.Path("profile.pstats"),
+    collapsed_path: typing.Annotated[
+        pathlib.Path,
+        typer.Option(
+            "--collapsed",
+            dir_okay=False,
+            resolve_path=True,
+            help="The path to write the collapsed stacks to, for `flamegraph.pl` or `speedscope`.",
+        ),
+    ] = pathlib.Path("profile.collapsed"),
+):
+    """Play seeded games without rendering under cProfile, and write flamegraph-ready stacks."""
+
+    if player_kind is simulate.PlayerKind.NTUPLE:
+        if weights_path is None:
+            print("The n-tuple player requires --weights.")
+            raise typer.Exit(1)
+
+        try:
+            ntuple.NTupleNetwork.load(weights_path).close()
+        except exceptions.InvalidWeightsFile as error:
+            print(error)
+            raise typer.Exit(1)
+
+    # the games are played in this process by the worker functions of `simulate`
+    simulate._init_worker(simulate._PlayerOptions(player_kind, time_budget, weights_path, None))
+    master_seed = random_utils.create_master_seed(seed)
+
+    profiler = cProfile.Profile()
+    results = profiler.runcall(simulate._play_games, master_seed, range(num_games))
+
+    profiler.dump_stats(pstats_path)
+    stats = pstats.Stats(profiler)
+    profiling.write_collapsed_stacks(collapsed_path, stats)
+
+    output = io.StringIO()
+    stats.stream = output  # type: ignore[attr-defined]
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(NUM_TOP_FUNCTIONS)
+
+    print(
+        f"Games: {len(results)}"
+        f" | Moves: {sum(result.num_moves for result in results)}"
+        f" | Total time: {stats.total_tt:.3f}s"  # type: ignore[attr-defined]
+    )
+    print(output.getvalue().strip())
+    print()
+    print(f"Wrote the statistics: {pstats_path}")
+    print(f"Wrote the collapsed stacks: {collapsed_path}")
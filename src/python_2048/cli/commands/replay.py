@@ -0,0 +1,157 @@
+"""Module of the `replay` command."""
+
+import hashlib
+import io
+import pathlib
+import sys
+import time
+import typing
+
+import typer
+
+from python_2048.cli.lib import rendering
+from python_2048.game import exceptions, replay
+
+KEYFRAMES_SUFFIX = ".keyframes"
+"""The suffix of the keyframes file, which is kept next to its replay file."""
+
+app = typer.Typer()
+
+
+@app.command("replay")
+def replay_(
+    replay_path: typing.Annotated[
+        pathlib.Path,
+        typer.Argument(
+            exists=True,
+            dir_okay=False,
+            resolve_path=True,
+            help="The path to a replay, as recorded by `run --record` or `simulate --record-dir`.",
+        ),
+    ],
+    verify: typing.Annotated[
+        bool,
+        typer.Option(
+            "--verify",
+            help="Whether to check that every recorded spawn is drawn by the recorded seed.",
+        ),
+    ] = False,
+    view: typing.Annotated[
+        bool,
+        typer.Option(
+            "--view",
+            help="Whether to step through the game interactively, rather than at full speed.",
+        ),
+    ] = False,
+    keyframe_interval: typing.Annotated[
+        int,
+        typer.Option(
+            "--keyframe-interval",
+            min=1,
+            help="The number of moves between two keyframes of the viewer, "
+            "i.e. the most moves that a seek plays.",
+        ),
+    ] = replay.KEYFRAME_INTERVAL,
+):
+    """Play back a recorded game at full speed and print its final board, or view it."""
+
+    started_at = time.perf_counter()
+
+    try:
+        data = replay_path.read_bytes()
+        recorded = replay.read_replay(io.BytesIO(data))
+
+        if view:
+            keyframes = _load_keyframes(replay_path, data, recorded, keyframe_interval)
+            _view(replay.ReplayCursor(recorded, verify=verify), keyframes)
+            return
+
+        result = replay.play_back(recorded, verify=verify)
+    except exceptions.ReplayError as error:
+        print(error)
+        raise typer.Exit(1)
+
+    elapsed = time.perf_counter() - started_at
+
+    rendering.print_board_and_score(result.board)
+    print(
+        f"Moves: {result.num_moves}"
+        f" | Max tile: {result.max_tile}"
+        f" | Moves/sec: {result.num_moves / elapsed:.1f}"
+    )
+
+    if verify:
+        print("Verified every spawn against the seed.")
+
+
+def _load_keyframes(
+    replay_path: pathlib.Path, data: bytes, recorded: replay.Replay, interval: int
+) -> replay.Keyframes:
+    """Read the keyframes next to the replay file, or build them if they are missing or stale."""
+
+    keyframes_path = replay_path.with_name(replay_path.name + KEYFRAMES_SUFFIX)
+    digest = hashlib.blake2b(data, digest_size=16).hexdigest()
+
+    try:
+        with keyframes_path.open() as file:
+            keyframes = replay.read_keyframes(file, replay_digest=digest)
+
+        if keyframes.interval == interval:
+            return keyframes
+    except (OSError, exceptions.InvalidReplay):
+        pass
+
+    keyframes = replay.build_keyframes(recorded, interval=interval)
+
+    # the keyframes are only a cache, so that a read-only directory merely makes seeks slower
+    try:
+        with keyframes_path.open("w") as file:
+            replay.write_keyframes(file, keyframes, replay_digest=digest)
+    except OSError:
+        pass
+
+    return keyframes
+
+
+def _view(cursor: replay.ReplayCursor, keyframes: replay.Keyframes):
+    """Step through the replay at the `cursor` by keystrokes, until the user quits."""
+
+    rendering.print_replay_manual()
+
+    while True:
+        rendering.print_replay_position(cursor.move_index, cursor.num_moves)
+        rendering.print_board_and_score(cursor.board)
+
+        match option := _prompt_for_option().lower():
+            case "n":
+                if not cursor.step():
+                    print("This is the last move.")
+            case "b":
+                if cursor.move_index == 0:
+                    print("This is the first move.")
+                else:
+                    cursor.seek(cursor.move_index - 1, keyframes)
+            case "j":
+                move_index = input(f"Jump to the move (0-{cursor.num_moves}): ").strip()
+
+                if move_index.isdigit():
+                    cursor.seek(int(move_index), keyframes)
+                else:
+                    print(f"Not a move: {move_index}")
+            case "q":
+                return
+            case _:
+                print(f"Unrecognized option: {option}")
+
+
+def _prompt_for_option() -> str:
+    """Prompt the user for a single-character option."""
+
+    print("Select an option: ", end="")
+    sys.stdout.flush()
+
+    option = typer.getchar(echo=True)
+    print()
+    print()
+
+    return option
@@ -1,23 +1,33 @@
 """Module of the `run` command."""
 
+import contextlib
+import enum
 import pathlib
 import random
 import typing
 
-import pydantic_ai.providers
 import typer
-from pydantic_ai.models import openai
+import typing_extensions
 
 from python_2048.cli.lib import renderer
+from python_2048.cli.lib import rendering as cli_rendering
 from python_2048.configurations import exceptions as configuration_exceptions
 from python_2048.configurations import file_utils
-from python_2048.game import engine, exceptions, rendering, state
-from python_2048.players import human_local, llm
+from python_2048.game import engine, exceptions, rendering, replay, state, timing
+from python_2048.game.lib import random_utils
+from python_2048.players import base, expectimax, human_local
 
 OLLAMA_PROVIDER = "openai"
 OLLAMA_LOCAL_BASE_URL = "http://localhost:11434/v1"
 
 
+class Assistant(str, enum.Enum):
+    """The kinds of AI assistant that can suggest moves, or play the game."""
+
+    LLM = "llm"
+    EXPECTIMAX = "expectimax"
+
+
 app = typer.Typer()
 
 
@@ -42,9 +52,25 @@ def run(
         bool,
         typer.Option(
             "--impersonate",
-            help="Whether the `model` would impersonate as the player to play the game.",
+            help="Whether the `assistant` would impersonate as the player to play the game.",
         ),
     ] = False,
+    assistant_kind: typing.Annotated[
+        Assistant,
+        typer.Option(
+            "-a",
+            "--assistant",
+            help="The AI assistant that suggests moves, an LLM requires a `model`.",
+        ),
+    ] = Assistant.LLM,
+    time_budget: typing.Annotated[
+        float,
+        typer.Option(
+            "--time-budget",
+            min=0,
+            help="The number of seconds that the expectimax assistant may search for each move.",
+        ),
+    ] = expectimax.DEFAULT_TIME_BUDGET,
     base_url: typing.Annotated[
         str,
         typer.Option(
@@ -69,6 +95,23 @@ def run(
             help="The LLM model identifier, as recognizable by pydantic-ai.",
         ),
     ] = None,
+    record_path: typing.Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--record",
+            dir_okay=False,
+            writable=True,
+            resolve_path=True,
+            help="The path to write a replay of the game to, for the `replay` command.",
+        ),
+    ] = None,
+    profile_phases: typing.Annotated[
+        bool,
+        typer.Option(
+            "--profile-phases",
+            help="Whether to time every phase of the game loop, and print the times at the end.",
+        ),
+    ] = False,
     game_snapshot_path: typing.Annotated[
         pathlib.Path | None,
         typer.Argument(
@@ -85,25 +128,31 @@ def run(
 ):
     """Start a new 2048 game."""
 
-    random.seed(seed)
+    # a recorded game draws from a counter-based generator, whose state fits in its replay
+    rng = random_utils.CounterRandom(seed) if record_path else random.Random(seed)
 
     try:
         board = file_utils.read_game_snapshot(game_snapshot_path) if game_snapshot_path else None
-        state_ = state.GameState(board, num_initial_tiles=None)  # random number of initial tiles
-        game = engine.GameEngine(state_)
-        renderer_ = rendering.DO_NOT_RENDER if silent else renderer.CONSOLE_RENDERER
-
-        provider = (
-            pydantic_ai.providers.infer_provider_class(provider_name)(base_url=base_url)  # type: ignore
-            if provider_name
-            else None
+        state_ = state.GameState(
+            board,
+            num_initial_tiles=None,  # random number of initial tiles
+            rng=rng,
         )
+        renderer_ = rendering.DO_NOT_RENDER if silent else renderer.CONSOLE_RENDERER
 
-        model = (
-            openai.OpenAIModel(model_name, provider=provider) if model_name and provider else None
-        )
+        assistant: base.Player | None
 
-        assistant = llm.LlmPlayer(model) if model else None
+        match assistant_kind:
+            case Assistant.EXPECTIMAX:
+                assistant = expectimax.ExpectimaxPlayer(time_budget=time_budget)
+            case Assistant.LLM:
+                assistant = (
+                    _create_llm_player(model_name, provider_name, base_url)
+                    if model_name and provider_name
+                    else None
+                )
+            case _:  # pragma: no cover
+                typing_extensions.assert_never(assistant_kind)
 
         player = (
             assistant
@@ -111,10 +160,38 @@ def run(
             else human_local.LocalHumanPlayer(assistant=assistant)
         )
 
-        game.start(player, renderer=renderer_)
+        phase_timer = timing.PhaseTimer() if profile_phases else None
+
+        with contextlib.ExitStack() as stack:
+            recorder = (
+                replay.ReplayRecorder(
+                    stack.enter_context(record_path.open("wb")), state_.board, rng=rng
+                )
+                if record_path
+                else None
+            )
+
+            if phase_timer is not None:
+                stack.callback(lambda: cli_rendering.print_phase_timings(phase_timer.timings()))
+
+            engine.GameEngine(state_, recorder=recorder, phase_timer=phase_timer).start(
+                player, renderer=renderer_
+            )
     except exceptions.GameError:
         print("The game ran into an invalid state, exiting...")
         raise typer.Exit(1)
     except configuration_exceptions.GameSnapshotError:
         print("There is an error in the game snapshot file, exiting...")
         raise typer.Exit(1)
+
+
+def _create_llm_player(model_name: str, provider_name: str, base_url: str) -> base.Player:
+    """Create an LLM player, importing `pydantic-ai` and its model clients only when requested."""
+
+    import pydantic_ai.providers
+    from pydantic_ai.models import openai
+
+    from python_2048.players import llm
+
+    provider = pydantic_ai.providers.infer_provider_class(provider_name)(base_url=base_url)  # type: ignore
+    return llm.LlmPlayer(openai.OpenAIModel(model_name, provider=provider))
@@ -0,0 +1,213 @@
+"""Module of the `simulate` command."""
+
+import concurrent.futures
+import enum
+import os
+import pathlib
+import time
+import typing
+
+import typer
+import typing_extensions
+
+from python_2048.game import simulation
+from python_2048.game.lib import random_utils
+from python_2048.players import base, exceptions, expectimax, ntuple, random_moves
+
+DEFAULT_GAMES_PER_TASK = 10
+"""The default number of games that a worker plays in one go."""
+
+
+class PlayerKind(str, enum.Enum):
+    """The players that can play simulated games."""
+
+    RANDOM = "random"
+    EXPECTIMAX = "expectimax"
+    NTUPLE = "ntuple"
+
+
+class _PlayerOptions(typing.NamedTuple):
+    """The options to create a player in a worker process."""
+
+    kind: PlayerKind
+    """The kind of the player."""
+
+    time_budget: float
+    """The number of seconds that an expectimax player may search for each move."""
+
+    weights_path: pathlib.Path | None
+    """The path to the weights file of an n-tuple player."""
+
+    record_dir: pathlib.Path | None
+    """The directory to write a replay of every game to, if any."""
+
+
+_worker_options: _PlayerOptions | None = None
+_worker_network: ntuple.NTupleNetwork | None = None
+
+
+app = typer.Typer()
+
+
+@app.command()
+def simulate(
+    num_games: typing.Annotated[
+        int,
+        typer.Option("-n", "--games", min=1, help="The number of games to play."),
+    ] = 100,
+    num_workers: typing.Annotated[
+        int | None,
+        typer.Option(
+            "-w",
+            "--workers",
+            min=1,
+            show_default="The number of CPUs",
+            help="The number of worker processes.",
+        ),
+    ] = None,
+    games_per_task: typing.Annotated[
+        int,
+        typer.Option(
+            "--games-per-task", min=1, help="The number of games that a worker plays in one go."
+        ),
+    ] = DEFAULT_GAMES_PER_TASK,
+    player_kind: typing.Annotated[
+        PlayerKind,
+        typer.Option("-p", "--player", help="The player of the games, an n-tuple needs weights."),
+    ] = PlayerKind.RANDOM,
+    time_budget: typing.Annotated[
+        float,
+        typer.Option(
+            "--time-budget",
+            min=0,
+            help="The number of seconds that the expectimax player may search for each move.",
+        ),
+    ] = expectimax.DEFAULT_TIME_BUDGET,
+    weights_path: typing.Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--weights",
+            exists=True,
+            dir_okay=False,
+            resolve_path=True,
+            help="The path to the weights file of the n-tuple player, as written by `train`.",
+        ),
+    ] = None,
+    seed: typing.Annotated[
+        int | None,
+        typer.Option(
+            help="An integer that configures the random number generator, "
+            "the same seed will always produce the same games.",
+        ),
+    ] = None,
+    record_dir: typing.Annotated[
+        pathlib.Path | None,
+        typer.Option(
+            "--record-dir",
+            file_okay=False,
+            resolve_path=True,
+            help="The directory to write a replay of every game to, named by its index.",
+        ),
+    ] = None,
+):
+    """Play many games without rendering, and print their aggregate statistics."""
+
+    if player_kind is PlayerKind.NTUPLE:
+        if weights_path is None:
+            print("The n-tuple player requires --weights.")
+            raise typer.Exit(1)
+
+        # validate the weights once, rather than failing in every worker
+        try:
+            ntuple.NTupleNetwork.load(weights_path).close()
+        except exceptions.InvalidWeightsFile as error:
+            print(error)
+            raise typer.Exit(1)
+
+    if record_dir is not None:
+        record_dir.mkdir(parents=True, exist_ok=True)
+
+    master_seed = random_utils.create_master_seed(seed)
+    options = _PlayerOptions(player_kind, time_budget, weights_path, record_dir)
+    started_at = time.perf_counter()
+
+    with concurrent.futures.ProcessPoolExecutor(
+        num_workers or os.cpu_count() or 1, initializer=_init_worker, initargs=(options,)
+    ) as executor:
+        futures = [
+            executor.submit(
+                _play_games, master_seed, range(start, min(start + games_per_task, num_games))
+            )
+            for start in range(0, num_games, games_per_task)
+        ]
+
+        results = [result for future in futures for result in future.result()]
+
+    elapsed = time.perf_counter() - started_at
+    summary = simulation.summarize(results)
+
+    print(
+        f"Games: {summary.num_games}"
+        f" | Win rate: {summary.win_rate:.1%}"
+        f" | Moves: {summary.num_moves}"
+        f" | Moves/sec: {summary.num_moves / elapsed:.1f}"
+    )
+    print(
+        "Score percentiles: "
+        + " | ".join(f"p{p} {score}" for p, score in summary.score_percentiles.items())
+    )
+    print(
+        "Max tiles: "
+        + " | ".join(
+            f"{tile} {count / summary.num_games:.1%}" for tile, count in summary.max_tiles.items()
+        )
+    )
+
+
+def _init_worker(options: _PlayerOptions):
+    """Keep the player options in a worker process, and map the n-tuple weights once."""
+
+    global _worker_options, _worker_network
+    _worker_options = options
+
+    if options.kind is PlayerKind.NTUPLE:
+        assert options.weights_path is not None
+        _worker_network = ntuple.NTupleNetwork.load(options.weights_path)
+
+
+def _play_games(master_seed: int, game_indices: range) -> list[simulation.GameResult]:
+    """Play the games at `game_indices` in a worker process.
+
+    Every game derives its own streams of spawns and moves from the `master_seed`,
+    so that its outcome does not depend on the sharding or the order of the games.
+    The spawns are counter-based, so that a replay records their seed rather than every draw.
+    """
+
+    assert _worker_options is not None
+    record_dir = _worker_options.record_dir
+
+    return [
+        simulation.play_game(
+            _create_player(random_utils.derive_seed(master_seed, index, "player")),
+            rng=random_utils.create_counter_rng(master_seed, index),
+            record_path=record_dir / f"{index}.replay" if record_dir is not None else None,
+        )
+        for index in game_indices
+    ]
+
+
+def _create_player(seed: int) -> base.Player:
+    """Create a fresh player for a game, so that earlier games do not affect its moves."""
+
+    assert _worker_options is not None
+
+    match _worker_options.kind:
+        case PlayerKind.RANDOM:
+            return random_moves.RandomPlayer(seed=seed)
+        case PlayerKind.EXPECTIMAX:
+            return expectimax.ExpectimaxPlayer(time_budget=_worker_options.time_budget)
+        case PlayerKind.NTUPLE:
+            assert _worker_network is not None
+            return ntuple.NTuplePlayer(_worker_network)
+        case _:  # pragma: no cover
+            typing_extensions.assert_never(_worker_options.kind)
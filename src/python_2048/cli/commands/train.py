@@ -0,0 +1,179 @@
+"""Module of the `train` command."""
+
+import concurrent.futures
+import json
+import pathlib
+import random
+import time
+import typing
+
+import typer
+
+from python_2048.game.lib import random_utils
+from python_2048.players import exceptions, ntuple, td_learning
+
+DEFAULT_GAMES_PER_TASK = 10
+"""The default number of games that a worker plays between two merges of weight updates."""
+
+_worker_network: ntuple.NTupleNetwork | None = None
+
+
+app = typer.Typer()
+
+
+@app.command()
+def train(
+    weights_path: typing.Annotated[
+        pathlib.Path,
+        typer.Argument(
+            dir_okay=False,
+            resolve_path=True,
+            help="The path to the weights file, which is checkpointed while training.",
+        ),
+    ],
+    num_games: typing.Annotated[
+        int,
+        typer.Option("-n", "--games", min=1, help="The total number of games to train with."),
+    ] = 1000,
+    num_workers: typing.Annotated[
+        int,
+        typer.Option("-w", "--workers", min=1, help="The number of worker processes."),
+    ] = 1,
+    games_per_task: typing.Annotated[
+        int,
+        typer.Option(
+            "--games-per-task",
+            min=1,
+            help="The number of games that a worker plays between two merges of weight updates.",
+        ),
+    ] = DEFAULT_GAMES_PER_TASK,
+    learning_rate: typing.Annotated[
+        float,
+        typer.Option("--learning-rate", min=0, help="The step size of the TD updates."),
+    ] = td_learning.DEFAULT_LEARNING_RATE,
+    checkpoint_interval: typing.Annotated[
+        int,
+        typer.Option(
+            "--checkpoint-interval",
+            min=1,
+            help="The number of games between two checkpoints of the weights.",
+        ),
+    ] = 1000,
+    patterns: typing.Annotated[
+        list[str] | None,
+        typer.Option(
+            "-t",
+            "--tuple",
+            help="An n-tuple of comma-separated row-major tile indices, e.g. 0,1,2,3; "
+            "can be repeated, and defaults to four 6-tuples.",
+        ),
+    ] = None,
+    resume: typing.Annotated[
+        bool,
+        typer.Option("--resume", help="Whether to continue from the checkpoint at `weights_path`."),
+    ] = False,
+    seed: typing.Annotated[
+        int | None,
+        typer.Option(help="An integer that configures the random number generator."),
+    ] = None,
+):
+    """Train an n-tuple network by TD self-play, for the `NTuplePlayer`."""
+
+    progress_path = weights_path.with_name(weights_path.name + ".json")
+    num_played = 0
+
+    if resume:
+        try:
+            num_played = json.loads(progress_path.read_text())["num_games"]
+        except (OSError, ValueError, KeyError):
+            print(f"There is no checkpoint to resume from: {weights_path}")
+            raise typer.Exit(1)
+    else:
+        try:
+            network = ntuple.NTupleNetwork(
+                [[int(tile) for tile in pattern.split(",")] for pattern in patterns]
+                if patterns
+                else ntuple.DEFAULT_PATTERNS
+            )
+        except ValueError:
+            print(f"Invalid n-tuples: {patterns}")
+            raise typer.Exit(1)
+
+        network.save(weights_path)
+        del network
+
+    try:
+        network = ntuple.NTupleNetwork.load(weights_path, writable=True)
+    except exceptions.InvalidWeightsFile as error:
+        print(error)
+        raise typer.Exit(1)
+
+    master_seed = random_utils.create_master_seed(seed)
+    next_checkpoint = num_played + checkpoint_interval
+
+    with concurrent.futures.ProcessPoolExecutor(
+        num_workers, initializer=_init_worker, initargs=(weights_path,)
+    ) as executor:
+        while num_played < num_games:
+            started_at = time.perf_counter()
+            round_games = min(num_games - num_played, num_workers * games_per_task)
+
+            futures = [
+                executor.submit(
+                    _play_training_games,
+                    min(games_per_task, round_games - start),
+                    learning_rate,
+                    # keyed by the index of the first game, so that a resume continues the stream
+                    random_utils.derive_seed(master_seed, num_played + start),
+                )
+                for start in range(0, round_games, games_per_task)
+            ]
+
+            results = [future.result() for future in futures]
+
+            # the workers are idle, while their updates are merged into the shared weights
+            for result in results:
+                td_learning.apply_updates(network, result.updates)
+
+            num_played += round_games
+            elapsed = time.perf_counter() - started_at
+
+            print(
+                f"Games: {num_played}"
+                f" | Games/sec: {round_games / elapsed:.1f}"
+                f" | Average score: {sum(r.total_score for r in results) / round_games:.1f}"
+                f" | Max tile: {max(r.max_tile for r in results)}"
+            )
+
+            if num_played >= next_checkpoint or num_played >= num_games:
+                _checkpoint(network, progress_path, num_played)
+                next_checkpoint = num_played + checkpoint_interval
+
+    network.close()
+
+
+def _checkpoint(network: ntuple.NTupleNetwork, progress_path: pathlib.Path, num_played: int):
+    """Flush the weights to their file, and record the progress next to it."""
+
+    network.flush()
+    progress_path.write_text(json.dumps({"num_games": num_played}))
+    print(f"Checkpointed after {num_played} games.")
+
+
+def _init_worker(weights_path: pathlib.Path):
+    """Map the shared weights read-only in a worker process."""
+
+    global _worker_network
+    _worker_network = ntuple.NTupleNetwork.load(weights_path)
+
+
+def _play_training_games(
+    num_games: int, learning_rate: float, seed: int
+) -> td_learning.TrainingResult:
+    """Play a batch of training games in a worker process."""
+
+    assert _worker_network is not None
+
+    return td_learning.play_training_games(
+        _worker_network, num_games, learning_rate=learning_rate, rng=random.Random(seed)
+    )
@@ -0,0 +1,81 @@
+"""Module that converts `cProfile` statistics into collapsed stacks, for flamegraph tools.
+
+`cProfile` records the time of every caller-callee edge rather than full stacks, so that the
+time of a function called along several paths is split among them by the time of each edge.
+"""
+
+import collections
+import functools
+import pathlib
+import pstats
+import sys
+
+MIN_STACK_SECONDS = 1e-6
+"""The least time of a stack to be expanded further, which bounds the number of stacks."""
+
+_Function = tuple[str, int, str]
+
+
+def collapse_stats(stats: pstats.Stats) -> dict[str, int]:
+    """Get the self time in microseconds of every stack, as semicolon-joined frames from its root."""
+
+    raw_stats: dict[_Function, tuple] = stats.stats  # type: ignore[attr-defined]
+    callees: dict[_Function, dict[_Function, float]] = collections.defaultdict(dict)
+
+    for function, (*_, callers) in raw_stats.items():
+        for caller, (*_, cumulative_time) in callers.items():
+            callees[caller][function] = cumulative_time
+
+    stacks: collections.Counter[str] = collections.Counter()
+    pending: list[tuple[_Function, tuple[_Function, ...], float]] = [
+        (function, (), 1.0) for function, (*_, callers) in raw_stats.items() if not callers
+    ]
+
+    while pending:
+        function, path, share = pending.pop()
+        self_time = raw_stats[function][2]
+        frames = (*path, function)
+
+        stacks[";".join(map(_format_function, frames))] += self_time * share
+
+        for callee, edge_time in callees[function].items():
+            callee_time = raw_stats[callee][3]
+            callee_share = share * edge_time / callee_time if callee_time else 0.0
+
+            # a recursive call is already accounted for by the frame of its first call
+            if callee not in frames and callee_time * callee_share >= MIN_STACK_SECONDS:
+                pending.append((callee, frames, callee_share))
+
+    return {
+        stack: microseconds
+        for stack, seconds in sorted(stacks.items())
+        if (microseconds := round(seconds * 1e6))
+    }
+
+
+def write_collapsed_stacks(path: pathlib.Path, stats: pstats.Stats):
+    """Write the collapsed stacks of `stats`, one `frame;frame;frame microseconds` per line."""
+
+    with path.open("w") as file:
+        for stack, microseconds in collapse_stats(stats).items():
+            file.write(f"{stack} {microseconds}\n")
+
+
+@functools.cache
+def _format_function(function: _Function) -> str:
+    """Format a function as `path:line:name`, with its path relative to `sys.path`."""
+
+    filename, line_number, name = function
+
+    if filename == "~":  # a built-in function
+        return name
+
+    path = pathlib.Path(filename)
+    roots = [
+        root for root in map(pathlib.Path, sys.path) if root.parts and path.is_relative_to(root)
+    ]
+
+    if roots:
+        path = path.relative_to(max(roots, key=lambda root: len(root.parts)))
+
+    return f"{path.as_posix()}:{line_number}:{name}"
@@ -1,12 +1,18 @@
-"""Module that exposes console-based game rendering utilities."""
+"""Module that exposes console-based game rendering utilities.
 
-import rich
-import rich.table
-import tabulate
+`rich` and `tabulate` are only imported once something is rendered,
+so that commands and games without rendering do not pay for their imports.
+"""
+
+import functools
+import typing
 
-from python_2048.game import types
+from python_2048.game import timing, types
 from python_2048.game.lib import board_utils
 
+if typing.TYPE_CHECKING:
+    import rich.console
+
 _BANNER = """
 ░▒▓███████▓▒░ ░▒▓████████▓▒░░▒▓█▓▒░░▒▓█▓▒░ ░▒▓██████▓▒░
        ░▒▓█▓▒░░▒▓█▓▒░░▒▓█▓▒░░▒▓█▓▒░░▒▓█▓▒░░▒▓█▓▒░░▒▓█▓▒░
@@ -29,12 +35,20 @@ _RULES = """
 """
 
 
-console = rich.console.Console()
+@functools.cache
+def get_console() -> "rich.console.Console":
+    """Get the console to render on."""
+
+    import rich.console
+
+    return rich.console.Console()
 
 
 def print_introduction():
     """Print an introduction to the game."""
 
+    console = get_console()
+
     console.print(_BANNER, highlight=False)
     console.print("--------------- Welcome to the 2048 Game ----------------")
     console.print(_RULES, highlight=False)
@@ -42,9 +56,13 @@ def print_introduction():
     console.print()
 
 
-def print_board_and_score(board: types.GameBoard):
+def print_board_and_score(board: types.ReadOnlyGameBoard):
     """Print the board and the latest score on screen."""
 
+    import tabulate
+
+    console = get_console()
+
     console.print(tabulate.tabulate(board, tablefmt="rounded_grid"), highlight=False)
     console.print()
     console.print(f"[bold]Score[/bold]: {board_utils.get_score(board)}")
@@ -54,6 +72,8 @@ def print_board_and_score(board: types.GameBoard):
 def print_user_manual():
     """Print the user manual."""
 
+    import rich.table
+
     table = rich.table.Table()
 
     table.add_column("Keystroke", style="cyan")
@@ -67,12 +87,65 @@ def print_user_manual():
     table.add_row("p", "Save the game")
     table.add_row("q", "Give up")
 
-    console.print(table)
+    get_console().print(table)
+
+
+def print_replay_manual():
+    """Print the manual of the replay viewer."""
+
+    import rich.table
+
+    table = rich.table.Table()
+
+    table.add_column("Keystroke", style="cyan")
+    table.add_column("Description", style="magenta")
+
+    table.add_row("n", "Next move")
+    table.add_row("b", "Previous move")
+    table.add_row("j", "Jump to a move")
+    table.add_row("q", "Quit")
+
+    get_console().print(table)
+
+
+def print_replay_position(move_index: int, num_moves: int):
+    """Print the position of the replay viewer."""
+
+    get_console().print(f"[bold]Move[/bold]: {move_index}/{num_moves}")
+
+
+def print_phase_timings(timings: dict[timing.Phase, timing.PhaseTiming]):
+    """Print the times of every phase of the game loop."""
+
+    import rich.table
+
+    table = rich.table.Table(title="Phase timings")
+
+    table.add_column("Phase", style="cyan")
+    table.add_column("Calls", justify="right")
+    table.add_column("Wall (ms)", justify="right")
+    table.add_column("CPU (ms)", justify="right")
+    table.add_column("p50 (µs)", justify="right")
+    table.add_column("p99 (µs)", justify="right")
+
+    for phase, phase_timing in timings.items():
+        table.add_row(
+            phase.value,
+            str(phase_timing.num_calls),
+            f"{phase_timing.wall_time * 1e3:.3f}",
+            f"{phase_timing.cpu_time * 1e3:.3f}",
+            f"≤{phase_timing.percentile(50) / 1e3:g}",
+            f"≤{phase_timing.percentile(99) / 1e3:g}",
+        )
+
+    get_console().print(table)
 
 
 def print_player_decision(decision: types.PlayerDecision):
     """Print a prompt for the player's next move."""
 
+    console = get_console()
+
     console.print(f"You selected: {decision.direction.name}")
 
     if decision.reason:
@@ -84,10 +157,10 @@ def print_player_decision(decision: types.PlayerDecision):
 def print_win_message():
     """Congratulate the player for winning the game."""
 
-    console.print("Congratulations, you win!")
+    get_console().print("Congratulations, you win!")
 
 
 def print_lose_message():
     """Congratulate the player for losing the game."""
 
-    console.print("Game over!")
+    get_console().print("Game over!")
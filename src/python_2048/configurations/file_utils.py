@@ -28,7 +28,7 @@ def read_game_snapshot(file_path: pathlib.Path) -> types.GameBoard:
         raise exceptions.GameSnapshotParseError(file_path) from cause
 
 
-def try_write_game_snapshot(board: types.GameBoard, file_path: pathlib.Path) -> bool:
+def try_write_game_snapshot(board: types.ReadOnlyGameBoard, file_path: pathlib.Path) -> bool:
     """
     Write the game board to the `file_path`.
 
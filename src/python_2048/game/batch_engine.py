@@ -0,0 +1,425 @@
+"""Module of `BatchGameEngine`, which requires the optional `numpy` dependency."""
+
+import bisect
+import functools
+import itertools
+import random
+import typing
+
+try:
+    import numpy as np
+except ImportError as cause:  # pragma: no cover
+    raise ImportError(
+        "The batch engine requires numpy, install it with: pip install 'python-2048[numpy]'"
+    ) from cause
+
+from python_2048.game import constants, exceptions, types
+from python_2048.game.lib import bitboard_utils, tile_utils
+
+DIRECTIONS: tuple[types.SlideDirection, ...] = tuple(types.SlideDirection)
+"""The slide directions, whose indices are accepted as direction codes by `BatchGameEngine`."""
+
+_BOARD_SIZE = bitboard_utils.BOARD_SIZE
+_MAX_TABLE_EXPONENT = 0xF
+_WINNING_EXPONENT = 11
+_DIRECTION_CODES = {direction: code for code, direction in enumerate(DIRECTIONS)}
+
+
+class BatchMoveResult(typing.NamedTuple):
+    """The per-board outcomes of `BatchGameEngine.move`."""
+
+    moved: np.ndarray
+    """Whether each board has been effectively moved."""
+
+    rewards: np.ndarray
+    """The sum of all tiles created by merges on each board."""
+
+
+class BatchStepResult(typing.NamedTuple):
+    """The per-board outcomes of `BatchGameEngine.step`."""
+
+    moved: np.ndarray
+    """Whether each board has been effectively moved, and thus has spawned a new tile."""
+
+    rewards: np.ndarray
+    """The sum of all tiles created by merges on each board."""
+
+    score_deltas: np.ndarray
+    """The change of each score in `BatchGameEngine.scores`, i.e. the value of the new tile."""
+
+    won: np.ndarray
+    """Whether each board has a tile of 2048 after the step."""
+
+    lost: np.ndarray
+    """Whether each board is out of moves after the step."""
+
+
+class BatchGameEngine:
+    """A game engine that plays many 4x4 games at once with vectorized NumPy operations.
+
+    Boards are held in one `(N, 4, 4)` array of log2 exponents, as in `bitboard_utils`,
+    and every move, merge and spawn is applied to all of them in a single call.
+
+    Moves and merges match `board_utils` exactly. Lines with tiles up to `2 ** 15` are moved
+    with table lookups, while the rare lines holding larger tiles fall back to `tile_utils`.
+    """
+
+    def __init__(
+        self,
+        num_boards: int,
+        *,
+        seed: int | None = None,
+        num_initial_tiles: int = constants.DEFAULT_NUMBER_OF_INITIAL_TILES,
+        new_tiles: typing.Sequence[types.NewTile] = constants.DEFAULT_NEW_TILES,
+        python_rng: random.Random | None = None,
+    ):
+        """
+        Args:
+            num_boards: the number of new games to be played at once.
+            seed: a seed of the random number generator for reproducible spawns.
+            num_initial_tiles: the number of initial tiles to be populated on each board.
+            new_tiles: the content and weights used to spawn new random tiles;
+                every value must be a power of two.
+            python_rng: if provided, spawns are drawn from this generator board by board
+                instead, with the same draws as `board_utils.spawn_new_tile`; this is slower,
+                but a game replays exactly as on `GameState` for the same seed.
+
+        Raises:
+            ValueError: if both `seed` and `python_rng` are provided.
+        """
+
+        if seed is not None and python_rng is not None:
+            raise ValueError("Expected either a seed or a python_rng, not both")
+
+        values, weights = zip(*new_tiles)
+
+        self._rng = np.random.default_rng(seed)
+        self._python_rng = python_rng
+        self._new_tile_values: tuple[int, ...] = values
+        self._new_tile_cum_weights = tuple(itertools.accumulate(weights))
+        self._new_tile_exponents = np.array([v.bit_length() - 1 for v in values], dtype=np.uint8)
+        self._new_tile_probabilities = np.array(weights, dtype=np.float64) / sum(weights)
+        self._exponents = np.zeros((num_boards, _BOARD_SIZE, _BOARD_SIZE), dtype=np.uint8)
+
+        for _ in range(num_initial_tiles):
+            self.spawn(np.ones(num_boards, dtype=np.bool_))
+
+    @classmethod
+    def from_boards(
+        cls,
+        boards: typing.Sequence[types.GameBoard],
+        *,
+        seed: int | None = None,
+        new_tiles: typing.Sequence[types.NewTile] = constants.DEFAULT_NEW_TILES,
+        python_rng: random.Random | None = None,
+    ) -> typing.Self:
+        """Create a batch engine that continues from existing game boards.
+
+        Tiles may grow beyond `bitboard_utils.MAX_ENCODABLE_TILE` as the games go on,
+        but the initial `boards` must be encodable, as in `GameState`.
+
+        Raises:
+            BoardNotEncodable: if any of the `boards` cannot be packed into 4-bit tiles.
+        """
+
+        for board in boards:
+            if not bitboard_utils.can_encode(board):
+                raise exceptions.BoardNotEncodable(board)
+
+        engine = cls(
+            0,
+            seed=seed,
+            num_initial_tiles=0,
+            new_tiles=new_tiles,
+            python_rng=python_rng,
+        )
+        engine._exponents = np.array(
+            [[[_to_exponent(tile) for tile in row] for row in board] for board in boards],
+            dtype=np.uint8,
+        ).reshape(-1, _BOARD_SIZE, _BOARD_SIZE)
+
+        return engine
+
+    def __len__(self) -> int:
+        return len(self._exponents)
+
+    @property
+    def exponents(self) -> np.ndarray:
+        """A read-only `(N, 4, 4)` view of the log2 exponents of all tiles."""
+
+        view = self._exponents.view()
+        view.flags.writeable = False
+        return view
+
+    @property
+    def scores(self) -> np.ndarray:
+        """The score of each board, consistent with `board_utils.get_score`."""
+
+        exponents = self._exponents.astype(np.int64)
+        return np.where(exponents > 0, 1 << exponents, 0).sum(axis=(1, 2))
+
+    def get_board(self, index: int) -> types.GameBoard:
+        """Get a copy of a single board in the 2d-matrix representation."""
+
+        return [[1 << int(e) if e else None for e in row] for row in self._exponents[index]]
+
+    def has_won(self) -> np.ndarray:
+        """Whether each board has a tile of 2048."""
+
+        return (self._exponents == _WINNING_EXPONENT).any(axis=(1, 2))
+
+    def is_out_of_moves(self) -> np.ndarray:
+        """Whether each board has no more possible moves."""
+
+        exponents = self._exponents
+        has_empty_tiles = (exponents == 0).any(axis=(1, 2))
+        is_empty_board = ~exponents.any(axis=(1, 2))
+
+        horizontally_mergeable = (exponents[:, :, 1:] == exponents[:, :, :-1]).any(axis=(1, 2))
+        vertically_mergeable = (exponents[:, 1:, :] == exponents[:, :-1, :]).any(axis=(1, 2))
+
+        return np.where(
+            has_empty_tiles,
+            is_empty_board,
+            ~(horizontally_mergeable | vertically_mergeable),
+        )
+
+    def step(
+        self,
+        directions: typing.Sequence[types.SlideDirection] | np.ndarray,
+    ) -> BatchStepResult:
+        """Slide each board towards its direction, then spawn a new tile on every moved board.
+
+        Args:
+            directions: a `SlideDirection` for each board, or their codes in `DIRECTIONS`.
+
+        Returns:
+            The per-board outcomes of the step.
+        """
+
+        moved, rewards = self.move(directions)
+        score_deltas = self.spawn(moved)
+
+        return BatchStepResult(
+            moved=moved,
+            rewards=rewards,
+            score_deltas=score_deltas,
+            won=self.has_won(),
+            lost=self.is_out_of_moves(),
+        )
+
+    def move(
+        self,
+        directions: typing.Sequence[types.SlideDirection] | np.ndarray,
+    ) -> BatchMoveResult:
+        """Move and merge the tiles on each board towards its direction, without spawning.
+
+        Args:
+            directions: a `SlideDirection` for each board, or their codes in `DIRECTIONS`.
+
+        Returns:
+            The per-board outcomes of the move.
+        """
+
+        codes = _to_direction_codes(directions)
+
+        if codes.shape != (len(self),):
+            raise ValueError(f"Expected {len(self)} directions, got an array of {codes.shape}")
+
+        moved = np.zeros(len(self), dtype=np.bool_)
+        rewards = np.zeros(len(self), dtype=np.int64)
+
+        for code, direction in enumerate(DIRECTIONS):
+            selected = np.flatnonzero(codes == code)
+
+            if not selected.size:
+                continue
+
+            is_vertical = direction in (types.SlideDirection.UP, types.SlideDirection.DOWN)
+            towards_end = direction in (types.SlideDirection.DOWN, types.SlideDirection.RIGHT)
+
+            boards = self._exponents[selected]
+            lines = boards.transpose(0, 2, 1) if is_vertical else boards
+
+            new_lines, line_rewards = _move_lines(lines, towards_end)
+            new_boards = new_lines.transpose(0, 2, 1) if is_vertical else new_lines
+
+            self._exponents[selected] = new_boards
+            moved[selected] = (new_boards != boards).any(axis=(1, 2))
+            rewards[selected] = line_rewards
+
+        return BatchMoveResult(moved=moved, rewards=rewards)
+
+    def spawn(self, mask: np.ndarray) -> np.ndarray:
+        """Spawn a new tile at a random empty tile on each board selected by `mask`.
+
+        Random draws are made for every board, so that the outcome of a seeded engine
+        does not depend on which boards are selected. With a `python_rng`, draws are
+        only made for the selected boards instead, as on `GameState`.
+
+        Returns:
+            The value of the new tile on each board, or 0 if none is spawned.
+
+        Raises:
+            ValueError: if the shape of `mask` does not match the number of boards.
+        """
+
+        mask = np.asarray(mask, dtype=np.bool_)
+
+        if mask.shape != (len(self),):
+            raise ValueError(f"Expected a mask of {len(self)} boards, got an array of {mask.shape}")
+
+        tiles = self._exponents.reshape(len(self), _BOARD_SIZE * _BOARD_SIZE)
+        empty_tiles = tiles == 0
+
+        if self._python_rng is not None:
+            return self._spawn_with_python_rng(tiles, empty_tiles, mask)
+        num_empty_tiles = empty_tiles.sum(axis=1)
+
+        picks = (self._rng.random(len(self)) * num_empty_tiles).astype(np.int64)
+        new_tile_exponents = self._rng.choice(
+            self._new_tile_exponents,
+            size=len(self),
+            p=self._new_tile_probabilities,
+        )
+
+        spawned = np.flatnonzero(mask & (num_empty_tiles > 0))
+        positions = np.argmax(
+            np.cumsum(empty_tiles[spawned], axis=1) > picks[spawned, None], axis=1
+        )
+        tiles[spawned, positions] = new_tile_exponents[spawned]
+
+        score_deltas = np.zeros(len(self), dtype=np.int64)
+        score_deltas[spawned] = 1 << new_tile_exponents[spawned].astype(np.int64)
+
+        return score_deltas
+
+    def _spawn_with_python_rng(
+        self,
+        tiles: np.ndarray,
+        empty_tiles: np.ndarray,
+        mask: np.ndarray,
+    ) -> np.ndarray:
+        """Spawn new tiles board by board, with the same draws as `board_utils.spawn_new_tile`."""
+
+        rng = typing.cast(random.Random, self._python_rng)
+        values = self._new_tile_values
+        cum_weights = self._new_tile_cum_weights
+        score_deltas = np.zeros(len(self), dtype=np.int64)
+
+        for index in np.flatnonzero(mask):
+            positions = np.flatnonzero(empty_tiles[index])
+
+            if not positions.size:
+                continue
+
+            position = positions[rng.randrange(positions.size)]
+            new_tile = values[
+                bisect.bisect(cum_weights, rng.random() * cum_weights[-1], 0, len(values) - 1)
+            ]
+
+            tiles[index, position] = new_tile.bit_length() - 1
+            score_deltas[index] = new_tile
+
+        return score_deltas
+
+
+def _to_exponent(tile: int | None) -> int:
+    """Convert a tile to its log2 exponent, where 0 denotes an empty tile."""
+
+    return tile.bit_length() - 1 if tile else 0
+
+
+def _to_direction_codes(
+    directions: typing.Sequence[types.SlideDirection] | np.ndarray,
+) -> np.ndarray:
+    """Convert `directions` to their codes in `DIRECTIONS`.
+
+    Raises:
+        ValueError: if any of the `directions` is neither a `SlideDirection` nor a valid code.
+    """
+
+    if isinstance(directions, np.ndarray) and np.issubdtype(directions.dtype, np.integer):
+        codes = directions
+    else:
+        codes = np.fromiter(
+            (_DIRECTION_CODES[types.SlideDirection(direction)] for direction in directions),
+            dtype=np.int8,
+            count=len(directions),
+        )
+
+    if ((codes < 0) | (codes >= len(DIRECTIONS))).any():
+        raise ValueError(f"Expected direction codes between 0 and {len(DIRECTIONS) - 1}")
+
+    return codes
+
+
+def _move_lines(lines: np.ndarray, towards_end: bool) -> tuple[np.ndarray, np.ndarray]:
+    """Move and merge each line of 4 exponents in an `(N, 4, 4)` array with a table lookup.
+
+    Lines holding a tile beyond the table, i.e. larger than `2 ** 15`,
+    are moved with `tile_utils.get_line_transitions` instead.
+
+    Returns:
+        The moved lines, and the sum of all tiles created by merges on each board.
+    """
+
+    moved_lines, line_rewards = _get_line_tables()
+
+    weights = np.array([1 << (4 * i) for i in range(_BOARD_SIZE)], dtype=np.int64)
+    line_codes = (lines.astype(np.int64) & _MAX_TABLE_EXPONENT) @ weights
+    table_index = int(towards_end)
+
+    new_lines = moved_lines[table_index][line_codes]
+    rewards = line_rewards[table_index][line_codes]
+
+    transitions = tile_utils.get_line_transitions(towards_end)
+
+    for board_index, line_index in np.argwhere((lines > _MAX_TABLE_EXPONENT).any(axis=2)):
+        line = tuple(1 << int(e) if e else None for e in lines[board_index, line_index])
+        transition = transitions[line]
+
+        new_lines[board_index, line_index] = [_to_exponent(tile) for tile in transition.tiles]
+        rewards[board_index, line_index] = transition.reward
+
+    return new_lines, rewards.sum(axis=1)
+
+
+@functools.cache
+def _get_line_tables() -> tuple[np.ndarray, np.ndarray]:
+    """Build the lookup tables from every encoded line to its moved line and merge reward.
+
+    The tables are indexed by `[towards_end][line_code]`, where a line code packs the
+    4 exponents into 4-bit nibbles, as in a `Bitboard` row.
+    """
+
+    line_codes = np.arange(1 << (4 * _BOARD_SIZE), dtype=np.int64)
+    lines = (line_codes[:, None] >> (4 * np.arange(_BOARD_SIZE))) & 0xF
+
+    lines_towards_start, rewards_towards_start = _slide_towards_start(lines)
+    lines_towards_end, rewards_towards_end = _slide_towards_start(lines[:, ::-1])
+
+    return (
+        np.stack((lines_towards_start, lines_towards_end[:, ::-1])).astype(np.uint8),
+        np.stack((rewards_towards_start, rewards_towards_end)),
+    )
+
+
+def _slide_towards_start(lines: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Move and merge every line of exponents towards its start."""
+
+    # compress the non-empty tiles towards the start, in their original order
+    order = np.argsort(lines == 0, axis=1, kind="stable")
+    tiles = np.take_along_axis(lines, order, axis=1)
+    rewards = np.zeros(len(lines), dtype=np.int64)
+
+    # merge each pair of equal tiles greedily from the start, then close the gap
+    for i in range(_BOARD_SIZE - 1):
+        merged = (tiles[:, i] != 0) & (tiles[:, i] == tiles[:, i + 1])
+
+        tiles[merged, i] += 1
+        rewards[merged] += 1 << tiles[merged, i]
+        tiles[merged, i + 1 : -1] = tiles[merged, i + 2 :]
+        tiles[merged, -1] = 0
+
+    return tiles, rewards
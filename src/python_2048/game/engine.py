@@ -1,14 +1,29 @@
 """Module of `GameEngine`."""
 
-from python_2048.game import rendering, state
+from python_2048.game import rendering, replay, state, timing
 from python_2048.players import base
 
 
 class GameEngine:
     """The game engine of 2048."""
 
-    def __init__(self, state_: state.GameState | None = None):
+    def __init__(
+        self,
+        state_: state.GameState | None = None,
+        *,
+        recorder: replay.ReplayRecorder | None = None,
+        phase_timer: timing.PhaseTimer | None = None,
+    ):
+        """
+        Args:
+            state_: the game state to continue from, where a new one would be created if null.
+            recorder: the recorder to append every effective move to, if any.
+            phase_timer: the timer of every phase of the game loop, if any.
+        """
+
         self._state = state_ or state.GameState()
+        self._recorder = recorder
+        self._phase_timer = phase_timer
 
     def start(self, player: base.Player, *, renderer: rendering.GameRenderingProtocol) -> bool:
         """Start the game loop, until a win/lose is determined.
@@ -21,23 +36,47 @@ class GameEngine:
             `True` if the player wins the game, `False` otherwise.
         """
 
+        state_ = self._state
+
+        # the phases are bound once, so that they are only wrapped by a timer if there is one
+        on_start = renderer.on_start
+        has_won = state_.has_won
+        is_out_of_moves = state_.is_out_of_moves
+        legal_moves = state_.legal_moves
+        get_next_move = player.get_next_move
+        after_next_move = renderer.after_next_move
+        slide = state_.slide
+
+        if (timer := self._phase_timer) is not None:
+            on_start = timer.wrap(timing.Phase.ON_START, on_start)
+            has_won = timer.wrap(timing.Phase.HAS_WON, has_won)
+            is_out_of_moves = timer.wrap(timing.Phase.IS_OUT_OF_MOVES, is_out_of_moves)
+            legal_moves = timer.wrap(timing.Phase.LEGAL_MOVES, legal_moves)
+            get_next_move = timer.wrap(timing.Phase.GET_NEXT_MOVE, get_next_move)
+            after_next_move = timer.wrap(timing.Phase.AFTER_NEXT_MOVE, after_next_move)
+            slide = timer.wrap(timing.Phase.SLIDE, slide)
+
         renderer.on_init()
 
         while True:
-            renderer.on_start(self._state.board)
+            on_start(state_.board)
 
-            if self._state.has_won():
+            if has_won():
                 renderer.on_win()
                 return True
 
-            if self._state.is_out_of_moves():
+            if is_out_of_moves():
                 renderer.on_lose()
                 return False
 
             renderer.before_next_move()
 
-            player_move = player.get_next_move(self._state.board)
+            player_move = get_next_move(state_.board, legal_moves())
 
-            renderer.after_next_move(player_move)
+            after_next_move(player_move)
 
-            self._state.slide(player_move.direction)
+            if slide(player_move.direction) and self._recorder is not None:
+                self._recorder.record(
+                    player_move.direction,
+                    state_.last_spawn if self._recorder.records_spawns else None,
+                )
@@ -8,7 +8,7 @@ from python_2048.game import types
 class GameError(abc.ABC, Exception):
     """A base exception related to the entire game."""
 
-    def __init__(self, board: types.GameBoard):
+    def __init__(self, board: types.ReadOnlyGameBoard):
         self.board = board
 
     @abc.abstractmethod
@@ -19,7 +19,7 @@ class GameError(abc.ABC, Exception):
 class GameBoardError(GameError):
     """A base exception related to the game board."""
 
-    def __init__(self, board: types.GameBoard):
+    def __init__(self, board: types.ReadOnlyGameBoard):
         self.board = board
 
 
@@ -54,3 +54,41 @@ class InvalidColumnReplacement(GameBoardError):
             f"Cannot replace column {self.index} of length {self.old_length} "
             f"with a new row of length {self.new_length}"
         )
+
+
+class BoardNotEncodable(GameBoardError):
+    """Raised when a game board cannot be packed into 4-bit tiles."""
+
+    def __str__(self) -> str:
+        return (
+            "Expected a 4x4 board, where every tile is either empty "
+            "or a power of two between 2 and 2 ** 14."
+        )
+
+
+class ReplayError(abc.ABC, Exception):
+    """A base exception related to a recorded replay of a game."""
+
+    @abc.abstractmethod
+    def __str__(self) -> str:
+        """A human readable description of the error."""
+
+
+class InvalidReplay(ReplayError):
+    """Raised when a replay is not in the replay format, or its turns cannot be played."""
+
+    def __init__(self, reason: str):
+        self.reason = reason
+
+    def __str__(self) -> str:
+        return f"Invalid replay: {self.reason}"
+
+
+class ReplayDiverged(ReplayError):
+    """Raised when a recorded spawn differs from the spawn drawn by the recorded seed."""
+
+    def __init__(self, move_index: int):
+        self.move_index = move_index
+
+    def __str__(self) -> str:
+        return f"The replay diverges from its seed at move {self.move_index}."
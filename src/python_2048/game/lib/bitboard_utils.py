@@ -0,0 +1,545 @@
+"""Module that contains game logic on a packed 64-bit representation of a 4x4 game board.
+
+Each tile occupies 4 bits and stores the log2 exponent of its value, where `0` denotes
+an empty tile. The tile at row `r` and column `c` lives at bits `[16r + 4c, 16r + 4c + 4)`,
+so that each row can be extracted as a 16-bit integer and moved with a table lookup.
+"""
+
+import random
+import typing
+
+import typing_extensions
+
+from python_2048.game import constants, types
+from python_2048.game.lib import tile_utils
+
+BOARD_SIZE = 4
+"""The only board size that can be packed into a `Bitboard`."""
+
+MAX_EXPONENT = 15
+"""The largest log2 exponent that a 4-bit tile can hold."""
+
+MAX_ENCODABLE_TILE = 2 ** (MAX_EXPONENT - 1)
+"""The largest tile that can be encoded, such that a merge of two never overflows.
+
+A row that would merge two tiles of `2 ** MAX_EXPONENT` is left unchanged on a bitboard,
+since their sum cannot be represented in 4 bits.
+"""
+
+_ROW_MASK = 0xFFFF
+_TILE_MASK = 0xF
+_ONES = 0x1111_1111_1111_1111
+_HIGH_BITS = 0x8888_8888_8888_8888
+_LAST_COLUMN = 0xF000_F000_F000_F000
+_LAST_ROW = 0xFFFF_0000_0000_0000
+_ONES_BEFORE_LAST_COLUMN = 0x0111_0111_0111_0111
+_ONES_BEFORE_LAST_ROW = 0x0000_1111_1111_1111
+
+
+class _RowTable(dict[int, int]):
+    """A lazily populated lookup table from a 16-bit row to its moved counterpart.
+
+    It is derived from the line transitions shared with `tile_utils`.
+
+    With `as_column`, the moved row is laid out as a column instead,
+    so that moving a transposed board does not need to transpose it back.
+    """
+
+    def __init__(self, *, towards_end: bool, as_column: bool):
+        super().__init__()
+        self._towards_end = towards_end
+        self._as_column = as_column
+
+    def __missing__(self, row: int) -> int:
+        transition = tile_utils.get_line_transitions(self._towards_end)[_decode_row(row)]
+        result = _encode_row(transition.tiles, fallback=row)
+
+        if self._as_column:
+            result = _spread_row_as_column(result)
+
+        self[row] = result
+        return result
+
+
+class _RowRewardTable(dict[int, int]):
+    """A lazily populated lookup table from a 16-bit row to the reward of moving it."""
+
+    def __init__(self, *, towards_end: bool):
+        super().__init__()
+        self._towards_end = towards_end
+
+    def __missing__(self, row: int) -> int:
+        transition = tile_utils.get_line_transitions(self._towards_end)[_decode_row(row)]
+
+        # a row that would overflow 4 bits is left unchanged by `_RowTable`
+        reward = self[row] = (
+            transition.reward if _encode_row(transition.tiles, fallback=-1) >= 0 else 0
+        )
+        return reward
+
+
+class _DecodedRowTable(dict[int, tuple[int | None, ...]]):
+    """A lazily populated lookup table from a 16-bit row to its tiles."""
+
+    def __missing__(self, row: int) -> tuple[int | None, ...]:
+        tiles = self[row] = _decode_row(row)
+        return tiles
+
+
+_DECODED_ROWS = _DecodedRowTable()
+_LEGAL_MOVES = tuple(
+    frozenset(direction for i, direction in enumerate(types.SlideDirection) if mask >> i & 1)
+    for mask in range(1 << len(types.SlideDirection))
+)
+_MOVE_LEFT = _RowTable(towards_end=False, as_column=False)
+_MOVE_RIGHT = _RowTable(towards_end=True, as_column=False)
+_MOVE_UP = _RowTable(towards_end=False, as_column=True)
+_MOVE_DOWN = _RowTable(towards_end=True, as_column=True)
+_REWARD_TOWARDS_START = _RowRewardTable(towards_end=False)
+_REWARD_TOWARDS_END = _RowRewardTable(towards_end=True)
+
+
+class BitboardSpawnOutcome(typing.NamedTuple):
+    """One of the possible outcomes of spawning a new tile on a `Bitboard`."""
+
+    bitboard: types.Bitboard
+    """The bitboard with the new tile."""
+
+    probability: float
+    """The probability that this bitboard is the outcome of the spawn."""
+
+
+class BitboardPreview(typing.NamedTuple):
+    """The outcome of a slide that is previewed on a `Bitboard`."""
+
+    afterstate: types.Bitboard
+    """The bitboard after tiles are moved and merged, but before a new tile is spawned."""
+
+    reward: int
+    """The sum of all tiles created by merges."""
+
+    moved: bool
+    """Whether any tile has been moved or merged."""
+
+
+def can_encode(board: types.ReadOnlyGameBoard) -> bool:
+    """Determine whether the `board` can be packed into a `Bitboard`.
+
+    It requires a 4x4 board, where every tile is either empty
+    or a power of two between 2 and `MAX_ENCODABLE_TILE`.
+    """
+
+    if len(board) != BOARD_SIZE:
+        return False
+
+    for row in board:
+        if len(row) != BOARD_SIZE:
+            return False
+
+        for tile in row:
+            if tile is None:
+                continue
+
+            if type(tile) is not int or not 2 <= tile <= MAX_ENCODABLE_TILE or tile & (tile - 1):
+                return False
+
+    return True
+
+
+def encode(board: types.ReadOnlyGameBoard) -> types.Bitboard:
+    """Pack a 4x4 `board` into a `Bitboard`, assuming `can_encode(board)`."""
+
+    bitboard = 0
+
+    for row_index, row in enumerate(board):
+        for column_index, tile in enumerate(row):
+            if tile is not None:
+                bitboard |= (tile.bit_length() - 1) << _get_shift(row_index, column_index)
+
+    return bitboard
+
+
+def decode(bitboard: types.Bitboard) -> types.GameBoard:
+    """Unpack a `Bitboard` into a new 4x4 game board."""
+
+    rows = _DECODED_ROWS
+
+    return [
+        list(rows[bitboard & _ROW_MASK]),
+        list(rows[(bitboard >> 16) & _ROW_MASK]),
+        list(rows[(bitboard >> 32) & _ROW_MASK]),
+        list(rows[bitboard >> 48]),
+    ]
+
+
+def decode_frozen(bitboard: types.Bitboard) -> types.FrozenGameBoard:
+    """Unpack a `Bitboard` into an immutable 4x4 game board."""
+
+    rows = _DECODED_ROWS
+
+    return (
+        rows[bitboard & _ROW_MASK],
+        rows[(bitboard >> 16) & _ROW_MASK],
+        rows[(bitboard >> 32) & _ROW_MASK],
+        rows[bitboard >> 48],
+    )
+
+
+def get_tile(bitboard: types.Bitboard, row_index: int, column_index: int) -> int | None:
+    """Get the value of a tile on the `bitboard`, or `None` if it is empty."""
+
+    exponent = (bitboard >> _get_shift(row_index, column_index)) & _TILE_MASK
+    return 1 << exponent if exponent else None
+
+
+def transpose(bitboard: types.Bitboard) -> types.Bitboard:
+    """Swap the rows and columns of the `bitboard`."""
+
+    a1 = bitboard & 0xF0F0_0F0F_F0F0_0F0F
+    a2 = bitboard & 0x0000_F0F0_0000_F0F0
+    a3 = bitboard & 0x0F0F_0000_0F0F_0000
+    a = a1 | (a2 << 12) | (a3 >> 12)
+
+    b1 = a & 0xFF00_FF00_00FF_00FF
+    b2 = a & 0x00FF_00FF_0000_0000
+    b3 = a & 0x0000_0000_FF00_FF00
+
+    return b1 | (b2 >> 24) | (b3 << 24)
+
+
+def spawn_new_tile(
+    bitboard: types.Bitboard,
+    new_tiles: typing.Sequence[types.NewTile] = constants.DEFAULT_NEW_TILES,
+    *,
+    num_empty_tiles: int | None = None,
+    rng: random.Random | None = None,
+) -> types.Bitboard:
+    """Spawn a new tile at a random empty tile on the `bitboard`.
+
+    The random draws are identical to `board_utils.spawn_new_tile`,
+    so a seeded game produces the same outcomes on either representation.
+
+    Args:
+        bitboard: the game board where a new tile should be spawned.
+        new_tiles: the content and weights used to spawn a new random tile;
+            every value must be a power of two.
+        num_empty_tiles: the number of empty tiles on the `bitboard`, if already known.
+        rng: the random number generator to draw from, or the global one if `None`.
+
+    Returns:
+        The new bitboard, or the same one if there are no empty tiles left.
+    """
+
+    empty_tiles = _get_zero_nibbles(bitboard)
+
+    if not empty_tiles:
+        return bitboard
+
+    # drop the lowest empty tiles, so that the chosen one becomes the lowest
+    if num_empty_tiles is None:
+        num_empty_tiles = empty_tiles.bit_count()
+
+    for _ in range((rng or random).randrange(num_empty_tiles)):
+        empty_tiles &= empty_tiles - 1
+
+    shift = (empty_tiles & -empty_tiles).bit_length() - 1
+    new_tile = tile_utils.draw_new_tile(new_tiles, rng=rng)
+
+    return bitboard | ((new_tile.bit_length() - 1) << shift)
+
+
+def get_spawn_outcomes(
+    bitboard: types.Bitboard,
+    new_tiles: typing.Sequence[types.NewTile] = constants.DEFAULT_NEW_TILES,
+) -> typing.Iterator[BitboardSpawnOutcome]:
+    """Enumerate every bitboard that `spawn_new_tile` may produce, with its probability.
+
+    The outcomes are enumerated in the same order as `board_utils.get_spawn_outcomes`.
+    """
+
+    empty_tiles = _get_zero_nibbles(bitboard)
+
+    if not empty_tiles:
+        return
+
+    new_exponents = [
+        (value.bit_length() - 1, probability)
+        for value, probability in tile_utils.get_new_tile_probabilities(new_tiles)
+    ]
+    position_probability = 1 / empty_tiles.bit_count()
+
+    while empty_tiles:
+        shift = (empty_tiles & -empty_tiles).bit_length() - 1
+        empty_tiles &= empty_tiles - 1
+
+        for exponent, probability in new_exponents:
+            yield BitboardSpawnOutcome(
+                bitboard | (exponent << shift), probability * position_probability
+            )
+
+
+def get_spawned_tile(bitboard: types.Bitboard, spawned: types.Bitboard) -> int:
+    """Get the value of the tile that `spawn_new_tile(bitboard)` has spawned, or 0 if none."""
+
+    # the new tile is the only nibble that differs, since it was empty before
+    difference = bitboard ^ spawned
+
+    if not difference:
+        return 0
+
+    return 1 << (difference >> ((difference.bit_length() - 1) & ~3))
+
+
+def get_spawn(bitboard: types.Bitboard, spawned: types.Bitboard) -> types.Spawn | None:
+    """Get the tile that `spawn_new_tile(bitboard)` has spawned, or `None` if none."""
+
+    difference = bitboard ^ spawned
+
+    if not difference:
+        return None
+
+    shift = (difference.bit_length() - 1) & ~3
+    row_index, column_index = divmod(shift >> 2, BOARD_SIZE)
+
+    return types.Spawn(row_index, column_index, 1 << (difference >> shift))
+
+
+def count_empty_tiles(bitboard: types.Bitboard) -> int:
+    """Count the number of empty tiles on the `bitboard`."""
+
+    return _get_zero_nibbles(bitboard).bit_count()
+
+
+def get_score(bitboard: types.Bitboard) -> int:
+    """Calculate the score of the `bitboard`, consistent with `board_utils.get_score`."""
+
+    score = 0
+
+    while bitboard:
+        exponent = bitboard & _TILE_MASK
+        if exponent:
+            score += 1 << exponent
+        bitboard >>= 4
+
+    return score
+
+
+def has_2048(bitboard: types.Bitboard) -> bool:
+    """Determine whether there is a tile of 2048."""
+
+    return has_exponent(bitboard, 11)
+
+
+def has_exponent(bitboard: types.Bitboard, exponent: int) -> bool:
+    """Determine whether there is a tile of `2 ** exponent` on the `bitboard`."""
+
+    return _has_zero_nibble(bitboard ^ (_ONES * exponent))
+
+
+def get_legal_moves(bitboard: types.Bitboard) -> frozenset[types.SlideDirection]:
+    """Get the directions towards which a slide would move or merge any tile on the `bitboard`.
+
+    A tile can be moved towards an adjacent empty tile, and merged with an adjacent equal tile.
+    Like `is_out_of_moves`, tiles of `2 ** MAX_EXPONENT` are assumed to be mergeable.
+    """
+
+    empty = _get_zero_nibbles(bitboard)
+    occupied = empty ^ _ONES
+
+    # the lowest bit of each tile that is equal to its right/lower neighbour
+    horizontal_pairs = _get_zero_nibbles(bitboard ^ (bitboard >> 4)) & occupied
+    vertical_pairs = _get_zero_nibbles(bitboard ^ (bitboard >> 16)) & occupied
+
+    horizontal = _ONES_BEFORE_LAST_COLUMN
+    vertical = _ONES_BEFORE_LAST_ROW
+
+    mask = (
+        bool((vertical_pairs | (empty & (occupied >> 16))) & vertical)
+        | bool((horizontal_pairs | (empty & (occupied >> 4))) & horizontal) << 1
+        | bool((vertical_pairs | (occupied & (empty >> 16))) & vertical) << 2
+        | bool((horizontal_pairs | (occupied & (empty >> 4))) & horizontal) << 3
+    )
+
+    return _LEGAL_MOVES[mask]
+
+
+def is_out_of_moves(bitboard: types.Bitboard) -> bool:
+    """Determine whether there are no more possible moves on the `bitboard`."""
+
+    if _has_zero_nibble(bitboard):
+        # any tile can move towards an empty tile, unless the board is entirely empty
+        return bitboard == 0
+
+    horizontal_neighbours = (bitboard ^ (bitboard >> 4)) | _LAST_COLUMN
+    vertical_neighbours = (bitboard ^ (bitboard >> 16)) | _LAST_ROW
+
+    return not (_has_zero_nibble(horizontal_neighbours) or _has_zero_nibble(vertical_neighbours))
+
+
+def move_up(bitboard: types.Bitboard) -> types.Bitboard:
+    """Move and merge the tiles on the `bitboard` upward."""
+
+    return _move_columns(bitboard, _MOVE_UP)
+
+
+def move_left(bitboard: types.Bitboard) -> types.Bitboard:
+    """Move and merge the tiles on the `bitboard` towards left."""
+
+    return _move_rows(bitboard, _MOVE_LEFT)
+
+
+def move_down(bitboard: types.Bitboard) -> types.Bitboard:
+    """Move and merge the tiles on the `bitboard` downward."""
+
+    return _move_columns(bitboard, _MOVE_DOWN)
+
+
+def move_right(bitboard: types.Bitboard) -> types.Bitboard:
+    """Move and merge the tiles on the `bitboard` towards right."""
+
+    return _move_rows(bitboard, _MOVE_RIGHT)
+
+
+def preview(bitboard: types.Bitboard, direction: types.SlideDirection) -> BitboardPreview:
+    """Preview a slide of the tiles on the `bitboard` towards `direction`."""
+
+    match direction:
+        case types.SlideDirection.UP:
+            return _preview_columns(bitboard, transpose(bitboard), _MOVE_UP, _REWARD_TOWARDS_START)
+        case types.SlideDirection.LEFT:
+            return _preview_rows(bitboard, _MOVE_LEFT, _REWARD_TOWARDS_START)
+        case types.SlideDirection.DOWN:
+            return _preview_columns(bitboard, transpose(bitboard), _MOVE_DOWN, _REWARD_TOWARDS_END)
+        case types.SlideDirection.RIGHT:
+            return _preview_rows(bitboard, _MOVE_RIGHT, _REWARD_TOWARDS_END)
+        case _:  # pragma: no cover
+            typing_extensions.assert_never(direction)
+
+
+def preview_all(bitboard: types.Bitboard) -> dict[types.SlideDirection, BitboardPreview]:
+    """Preview a slide of the tiles on the `bitboard` towards every direction."""
+
+    transposed = transpose(bitboard)
+
+    return {
+        types.SlideDirection.UP: _preview_columns(
+            bitboard, transposed, _MOVE_UP, _REWARD_TOWARDS_START
+        ),
+        types.SlideDirection.LEFT: _preview_rows(bitboard, _MOVE_LEFT, _REWARD_TOWARDS_START),
+        types.SlideDirection.DOWN: _preview_columns(
+            bitboard, transposed, _MOVE_DOWN, _REWARD_TOWARDS_END
+        ),
+        types.SlideDirection.RIGHT: _preview_rows(bitboard, _MOVE_RIGHT, _REWARD_TOWARDS_END),
+    }
+
+
+def _preview_rows(
+    bitboard: types.Bitboard,
+    moves: _RowTable,
+    rewards: _RowRewardTable,
+) -> BitboardPreview:
+    """Preview a slide of every row of the `bitboard` with row lookup tables."""
+
+    row_0 = bitboard & _ROW_MASK
+    row_1 = (bitboard >> 16) & _ROW_MASK
+    row_2 = (bitboard >> 32) & _ROW_MASK
+    row_3 = bitboard >> 48
+
+    afterstate = moves[row_0] | moves[row_1] << 16 | moves[row_2] << 32 | moves[row_3] << 48
+    reward = rewards[row_0] + rewards[row_1] + rewards[row_2] + rewards[row_3]
+
+    return BitboardPreview(afterstate, reward, afterstate != bitboard)
+
+
+def _preview_columns(
+    bitboard: types.Bitboard,
+    transposed: types.Bitboard,
+    moves: _RowTable,
+    rewards: _RowRewardTable,
+) -> BitboardPreview:
+    """Preview a slide of every column of the `bitboard`, given its `transposed` counterpart."""
+
+    row_0 = transposed & _ROW_MASK
+    row_1 = (transposed >> 16) & _ROW_MASK
+    row_2 = (transposed >> 32) & _ROW_MASK
+    row_3 = transposed >> 48
+
+    afterstate = moves[row_0] | moves[row_1] << 4 | moves[row_2] << 8 | moves[row_3] << 12
+    reward = rewards[row_0] + rewards[row_1] + rewards[row_2] + rewards[row_3]
+
+    return BitboardPreview(afterstate, reward, afterstate != bitboard)
+
+
+def _move_rows(bitboard: types.Bitboard, table: _RowTable) -> types.Bitboard:
+    """Move every row of the `bitboard` with a row lookup `table`."""
+
+    return (
+        table[bitboard & _ROW_MASK]
+        | table[(bitboard >> 16) & _ROW_MASK] << 16
+        | table[(bitboard >> 32) & _ROW_MASK] << 32
+        | table[bitboard >> 48] << 48
+    )
+
+
+def _move_columns(bitboard: types.Bitboard, table: _RowTable) -> types.Bitboard:
+    """Move every column of the `bitboard` with a column-producing lookup `table`."""
+
+    transposed = transpose(bitboard)
+
+    return (
+        table[transposed & _ROW_MASK]
+        | table[(transposed >> 16) & _ROW_MASK] << 4
+        | table[(transposed >> 32) & _ROW_MASK] << 8
+        | table[transposed >> 48] << 12
+    )
+
+
+def _get_shift(row_index: int, column_index: int) -> int:
+    """Get the bit offset of a tile on a bitboard."""
+
+    return 16 * row_index + 4 * column_index
+
+
+def _decode_row(row: int) -> tuple[int | None, ...]:
+    """Unpack a 16-bit row into its tiles."""
+
+    exponents = ((row >> (4 * i)) & _TILE_MASK for i in range(BOARD_SIZE))
+    return tuple(1 << exponent if exponent else None for exponent in exponents)
+
+
+def _encode_row(tiles: typing.Sequence[int | None], fallback: int) -> int:
+    """Pack tiles into a 16-bit row, or return `fallback` if any tile overflows 4 bits."""
+
+    row = 0
+
+    for i, tile in enumerate(tiles):
+        if tile is None:
+            continue
+
+        exponent = tile.bit_length() - 1
+        if exponent > MAX_EXPONENT:
+            return fallback
+
+        row |= exponent << (4 * i)
+
+    return row
+
+
+def _spread_row_as_column(row: int) -> int:
+    """Lay out the tiles of a 16-bit row in the first column of a bitboard."""
+
+    return sum(((row >> (4 * i)) & _TILE_MASK) << (16 * i) for i in range(BOARD_SIZE))
+
+
+def _has_zero_nibble(value: int) -> bool:
+    """Determine whether any of the 16 nibbles in `value` is zero."""
+
+    return bool((value - _ONES) & ~value & _HIGH_BITS)
+
+
+def _get_zero_nibbles(value: int) -> int:
+    """Get a mask with the lowest bit set for each of the 16 nibbles in `value` that is zero."""
+
+    value |= value >> 2
+    value |= value >> 1
+    return ~value & _ONES
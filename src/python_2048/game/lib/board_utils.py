@@ -8,10 +8,61 @@ from python_2048.game import constants, types
 from python_2048.game.lib import tile_utils
 
 
+class BoardSummary(typing.NamedTuple):
+    """The aggregates of a game board that `GameState` keeps up to date."""
+
+    score: int
+    """The sum of all tiles, consistent with `get_score`."""
+
+    max_tile: int
+    """The largest tile, or 0 if the board is empty."""
+
+    num_empty_tiles: int
+    """The number of empty tiles."""
+
+
+class MoveOutcome(typing.NamedTuple):
+    """The outcome of moving and merging the tiles on a board towards a direction."""
+
+    changed: bool
+    """Whether any tile has been moved or merged."""
+
+    reward: int
+    """The sum of all tiles created by merges."""
+
+    merged_tiles: tuple[int, ...]
+    """The tiles created by merges."""
+
+
+class MovePreview(typing.NamedTuple):
+    """The outcome of a slide that is previewed without mutating the board."""
+
+    afterstate: types.FrozenGameBoard
+    """The board after tiles are moved and merged, but before a new tile is spawned."""
+
+    reward: int
+    """The sum of all tiles created by merges."""
+
+    moved: bool
+    """Whether any tile has been moved or merged."""
+
+
+class SpawnOutcome(typing.NamedTuple):
+    """One of the possible outcomes of spawning a new tile on a board."""
+
+    board: types.FrozenGameBoard
+    """The board with the new tile."""
+
+    probability: float
+    """The probability that this board is the outcome of the spawn."""
+
+
 def create_new_board(
     board_size: int = constants.DEFAULT_BOARD_SIZE,
     new_tiles: typing.Sequence[types.NewTile] = constants.DEFAULT_NEW_TILES,
     num_initial_tiles: int | None = constants.DEFAULT_NUMBER_OF_INITIAL_TILES,
+    *,
+    rng: random.Random | None = None,
 ) -> types.GameBoard:
     """Create a new 2048 game board, with a number of initial tiles populated.
 
@@ -19,6 +70,7 @@ def create_new_board(
         board_size: the size of each row/column of the game board.
         new_tiles: the content and weights used to spawn new random tiles.
         num_initial_tile: the number of initial tiles populated; evaluates to random if null
+        rng: the random number generator of the spawns, or the global one if `None`.
 
     Returns:
         A new game board.
@@ -28,13 +80,13 @@ def create_new_board(
 
     if num_initial_tiles is None:
         max_initial_tiles = board_size * board_size // 2
-        num_initial_tiles = random.randrange(
+        num_initial_tiles = (rng or random).randrange(
             min(2, max_initial_tiles),
             max(2, max_initial_tiles) + 1,
         )
 
     for _ in range(num_initial_tiles):
-        spawn_new_tile(board, new_tiles)
+        spawn_new_tile(board, new_tiles, rng=rng)
 
     return board
 
@@ -55,44 +107,165 @@ def create_empty_board(board_size: int = constants.DEFAULT_BOARD_SIZE) -> types.
 def spawn_new_tile(
     board: types.GameBoard,
     new_tiles: typing.Sequence[types.NewTile] = constants.DEFAULT_NEW_TILES,
-):
+    *,
+    num_empty_tiles: int | None = None,
+    rng: random.Random | None = None,
+) -> int | None:
     """Spawn a new tile of 2/4 at a random empty tile on the `board`.
 
     If there are no empty tiles left, this function returns without spwaning a new tile.
+    Otherwise, a spawn costs one random draw for the position, and one for the value.
+
+    Args:
+        board: the game board where a new tile should be spawned.
+        new_tiles: the content and weights used to spawn a new random tile.
+        num_empty_tiles: the number of empty tiles on the `board`, if already known;
+            otherwise the empty tiles are indexed in one pass.
+        rng: the random number generator to draw from, or the global one if `None`.
+
+    Returns:
+        The new tile, or `None` if there are no empty tiles left.
+    """
+
+    spawn = draw_spawn(board, new_tiles, num_empty_tiles=num_empty_tiles, rng=rng)
+
+    if spawn is None:
+        return None
+
+    board[spawn.row][spawn.column] = spawn.value
+    return spawn.value
+
+
+def draw_spawn(
+    board: types.ReadOnlyGameBoard,
+    new_tiles: typing.Sequence[types.NewTile] = constants.DEFAULT_NEW_TILES,
+    *,
+    num_empty_tiles: int | None = None,
+    rng: random.Random | None = None,
+) -> types.Spawn | None:
+    """Draw where and which new tile `spawn_new_tile` would spawn, without placing it.
 
     Args:
         board: the game board where a new tile should be spawned.
         new_tiles: the content and weights used to spawn a new random tile.
+        num_empty_tiles: the number of empty tiles on the `board`, if already known;
+            otherwise the empty tiles are indexed in one pass.
+        rng: the random number generator to draw from, or the global one if `None`.
+
+    Returns:
+        The new tile, or `None` if there are no empty tiles left.
     """
 
-    any_empty_tiles = any(tile is None for row in board for tile in row)
+    randrange = (rng or random).randrange
+
+    if num_empty_tiles is None:
+        empty_tiles = [
+            (row_index, column_index)
+            for row_index, row in enumerate(board)
+            for column_index, tile in enumerate(row)
+            if tile is None
+        ]
+
+        if not empty_tiles:
+            return None
+
+        row_index, column_index = empty_tiles[randrange(len(empty_tiles))]
+    else:
+        if not num_empty_tiles:
+            return None
+
+        row_index, column_index = _find_empty_tile(board, randrange(num_empty_tiles))
 
-    if not any_empty_tiles:
+    return types.Spawn(row_index, column_index, tile_utils.draw_new_tile(new_tiles, rng=rng))
+
+
+def get_spawn_outcomes(
+    board: types.ReadOnlyGameBoard,
+    new_tiles: typing.Sequence[types.NewTile] = constants.DEFAULT_NEW_TILES,
+) -> typing.Iterator[SpawnOutcome]:
+    """Enumerate every board that `spawn_new_tile` may produce from `board`, with its probability.
+
+    The `board` is left unchanged, and every outcome shares the untouched rows of a frozen copy.
+    Nothing is yielded if there are no empty tiles left.
+    """
+
+    frozen_board: types.FrozenGameBoard = tuple(map(tuple, board))
+    empty_tiles = [
+        (row_index, column_index)
+        for row_index, row in enumerate(frozen_board)
+        for column_index, tile in enumerate(row)
+        if tile is None
+    ]
+
+    if not empty_tiles:
         return
 
-    while True:
-        row_index = random.randrange(len(board))
-        column_index = random.randrange(len(board[row_index]))
+    probabilities = tile_utils.get_new_tile_probabilities(new_tiles)
+    position_probability = 1 / len(empty_tiles)
+
+    for row_index, column_index in empty_tiles:
+        rows_before, row, rows_after = (
+            frozen_board[:row_index],
+            frozen_board[row_index],
+            frozen_board[row_index + 1 :],
+        )
 
-        if board[row_index][column_index] is None:  # pragma: no branch
-            new_tile: int = random.choices(*tuple(zip(*new_tiles)))[0]
-            board[row_index][column_index] = new_tile
-            return
+        for value, probability in probabilities:
+            new_row = (*row[:column_index], value, *row[column_index + 1 :])
+            yield SpawnOutcome(
+                (*rows_before, new_row, *rows_after), probability * position_probability
+            )
 
 
-def get_score(board: types.GameBoard) -> int:
+def get_score(board: types.ReadOnlyGameBoard) -> int:
     """Calculate the score of the current game board."""
 
     return sum(filter(None, itertools.chain.from_iterable(board)))
 
 
-def has_2048(board: types.GameBoard) -> bool:
+def summarize(board: types.ReadOnlyGameBoard) -> BoardSummary:
+    """Calculate the score, the largest tile and the number of empty tiles in a single pass."""
+
+    score = max_tile = num_empty_tiles = 0
+
+    for tile in itertools.chain.from_iterable(board):
+        if tile is None:
+            num_empty_tiles += 1
+            continue
+
+        score += tile
+        max_tile = max(max_tile, tile)
+
+    return BoardSummary(score=score, max_tile=max_tile, num_empty_tiles=num_empty_tiles)
+
+
+def has_2048(board: types.ReadOnlyGameBoard) -> bool:
     """Determine whether there is a tile of 2048."""
 
     return any(tile == 2048 for tile in itertools.chain.from_iterable(board))
 
 
-def is_out_of_moves(board: types.GameBoard) -> bool:
+def get_legal_moves(board: types.ReadOnlyGameBoard) -> frozenset[types.SlideDirection]:
+    """Get the directions towards which a slide would move or merge any tile on the `board`."""
+
+    rows = list(tile_utils.get_rows(board))
+    columns = list(tile_utils.get_columns(board))
+
+    candidates = (
+        (types.SlideDirection.UP, columns, False),
+        (types.SlideDirection.LEFT, rows, False),
+        (types.SlideDirection.DOWN, columns, True),
+        (types.SlideDirection.RIGHT, rows, True),
+    )
+
+    return frozenset(
+        direction
+        for direction, lines, towards_end in candidates
+        if any(tile_utils.get_line_transitions(towards_end)[line].changed for line in lines)
+    )
+
+
+def is_out_of_moves(board: types.ReadOnlyGameBoard) -> bool:
     """Determine whether there are no more possible moves on the `board`."""
 
     def is_moveable(tile_a: int | None, tile_b: int | None) -> bool:
@@ -118,30 +291,72 @@ def is_out_of_moves(board: types.GameBoard) -> bool:
     )
 
 
-def move_and_merge_up(board: types.GameBoard) -> bool:
-    """Move and merge the tiles on board towards upward.
+def move_and_merge(board: types.GameBoard, direction: types.SlideDirection) -> MoveOutcome:
+    """Move and merge the tiles on board towards `direction`.
 
     Args:
         board: the game board
+        direction: the direction towards which tiles are moved and merged
 
     Returns:
-        A boolean that indicates whether there is any effective modification.
+        The outcome of the move, including whether there is any effective modification.
     """
 
-    modified = False
+    towards_end = direction in (types.SlideDirection.DOWN, types.SlideDirection.RIGHT)
+    transitions = tile_utils.get_line_transitions(towards_end)
 
-    for index, column in enumerate(tile_utils.get_columns(board)):
-        new_column = tuple(reversed(tile_utils.move_and_merge_tiles(reversed(column))))
+    if direction in (types.SlideDirection.UP, types.SlideDirection.DOWN):
+        lines, replace_line = tile_utils.get_columns(board), tile_utils.replace_column
+    else:
+        lines, replace_line = tile_utils.get_rows(board), tile_utils.replace_row
 
-        if column != new_column:
-            modified = True
-            tile_utils.replace_column(board, new_column, index)
+    changed = False
+    reward = 0
+    merged_tiles: tuple[int, ...] = ()
 
-    return modified
+    for index, line in enumerate(lines):
+        transition = transitions[line]
 
+        if transition.changed:
+            changed = True
+            reward += transition.reward
+            merged_tiles += transition.merged_tiles
+            replace_line(board, transition.tiles, index)
 
-def move_and_merge_left(board: types.GameBoard) -> bool:
-    """Move and merge the tiles on board towards left.
+    return MoveOutcome(changed=changed, reward=reward, merged_tiles=merged_tiles)
+
+
+def preview(board: types.ReadOnlyGameBoard, direction: types.SlideDirection) -> MovePreview:
+    """Preview a slide of the tiles on the `board` towards `direction`, without mutating it.
+
+    The lines of the afterstate are shared with the line transition tables,
+    so that a preview allocates little beyond the outer tuple.
+    """
+
+    if direction in (types.SlideDirection.UP, types.SlideDirection.DOWN):
+        return _preview_lines(tile_utils.get_columns(board), direction)
+
+    return _preview_lines(tile_utils.get_rows(board), direction)
+
+
+def preview_all(
+    board: types.ReadOnlyGameBoard,
+) -> dict[types.SlideDirection, MovePreview]:
+    """Preview a slide of the tiles on the `board` towards every direction, without mutating it."""
+
+    rows = list(tile_utils.get_rows(board))
+    columns = list(tile_utils.get_columns(board))
+
+    return {
+        types.SlideDirection.UP: _preview_lines(columns, types.SlideDirection.UP),
+        types.SlideDirection.LEFT: _preview_lines(rows, types.SlideDirection.LEFT),
+        types.SlideDirection.DOWN: _preview_lines(columns, types.SlideDirection.DOWN),
+        types.SlideDirection.RIGHT: _preview_lines(rows, types.SlideDirection.RIGHT),
+    }
+
+
+def move_and_merge_up(board: types.GameBoard) -> bool:
+    """Move and merge the tiles on board towards upward.
 
     Args:
         board: the game board
@@ -150,16 +365,20 @@ def move_and_merge_left(board: types.GameBoard) -> bool:
         A boolean that indicates whether there is any effective modification.
     """
 
-    modified = False
+    return move_and_merge(board, types.SlideDirection.UP).changed
+
+
+def move_and_merge_left(board: types.GameBoard) -> bool:
+    """Move and merge the tiles on board towards left.
 
-    for index, row in enumerate(tile_utils.get_rows(board)):
-        new_row = tuple(reversed(tile_utils.move_and_merge_tiles(reversed(row))))
+    Args:
+        board: the game board
 
-        if row != new_row:
-            modified = True
-            tile_utils.replace_row(board, new_row, index)
+    Returns:
+        A boolean that indicates whether there is any effective modification.
+    """
 
-    return modified
+    return move_and_merge(board, types.SlideDirection.LEFT).changed
 
 
 def move_and_merge_down(board: types.GameBoard) -> bool:
@@ -172,16 +391,7 @@ def move_and_merge_down(board: types.GameBoard) -> bool:
         A boolean that indicates whether there is any effective modification.
     """
 
-    modified = False
-
-    for index, column in enumerate(tile_utils.get_columns(board)):
-        new_column = tile_utils.move_and_merge_tiles(column)
-
-        if column != new_column:
-            modified = True
-            tile_utils.replace_column(board, new_column, index)
-
-    return modified
+    return move_and_merge(board, types.SlideDirection.DOWN).changed
 
 
 def move_and_merge_right(board: types.GameBoard) -> bool:
@@ -194,13 +404,41 @@ def move_and_merge_right(board: types.GameBoard) -> bool:
         A boolean that indicates whether there is any effective modification.
     """
 
-    modified = False
+    return move_and_merge(board, types.SlideDirection.RIGHT).changed
+
+
+def _preview_lines(
+    lines: typing.Iterable[tuple[int | None, ...]],
+    direction: types.SlideDirection,
+) -> MovePreview:
+    """Preview a slide of the rows/columns in `lines` towards `direction`."""
+
+    towards_end = direction in (types.SlideDirection.DOWN, types.SlideDirection.RIGHT)
+    transitions = tile_utils.get_line_transitions(towards_end)
+    moved_lines = [transitions[line] for line in lines]
+
+    moved_tiles = (transition.tiles for transition in moved_lines)
+    afterstate = (
+        tuple(zip(*moved_tiles))
+        if direction in (types.SlideDirection.UP, types.SlideDirection.DOWN)
+        else tuple(moved_tiles)
+    )
+
+    return MovePreview(
+        afterstate=afterstate,
+        reward=sum(transition.reward for transition in moved_lines),
+        moved=any(transition.changed for transition in moved_lines),
+    )
+
 
-    for index, row in enumerate(tile_utils.get_rows(board)):
-        new_row = tile_utils.move_and_merge_tiles(row)
+def _find_empty_tile(board: types.ReadOnlyGameBoard, nth: int) -> tuple[int, int]:
+    """Find the position of the `nth` empty tile on the `board`, in row-major order."""
 
-        if row != new_row:
-            modified = True
-            tile_utils.replace_row(board, new_row, index)
+    for row_index, row in enumerate(board):
+        for column_index, tile in enumerate(row):
+            if tile is None:
+                if not nth:
+                    return row_index, column_index
+                nth -= 1
 
-    return modified
+    raise IndexError("There are fewer empty tiles on the board than expected")
@@ -0,0 +1,136 @@
+"""Module that derives independent random number streams from a single master seed.
+
+A derived seed is a hash of the master seed and a path of keys, e.g. the index of a game,
+so that any stream can be created directly, without drawing every stream before it.
+Games seeded this way are reproducible no matter how they are sharded or scheduled.
+
+A `CounterRandom` goes further, as every single draw within a stream is addressable,
+so that the spawn of any turn can be computed without replaying the turns before it.
+"""
+
+import hashlib
+import random
+
+DRAWS_PER_SPAWN = 2
+"""The number of draws of a spawn, i.e. one for the position, and one for the value."""
+
+_MASK_64 = (1 << 64) - 1
+_GOLDEN_GAMMA = 0x9E37_79B9_7F4A_7C15
+
+
+def derive_seed(seed: int, *keys: int | str) -> int:
+    """Derive the 64-bit seed of the stream at `keys` under the master `seed`.
+
+    Distinct paths of keys give statistically independent streams,
+    e.g. `derive_seed(seed, game_index)` and `derive_seed(seed, game_index, "player")`.
+    """
+
+    digest = hashlib.blake2b(repr((seed, *keys)).encode(), digest_size=8).digest()
+    return int.from_bytes(digest, "little")
+
+
+def create_rng(seed: int, *keys: int | str) -> random.Random:
+    """Create a random number generator of the stream at `keys` under the master `seed`."""
+
+    return random.Random(derive_seed(seed, *keys))
+
+
+def create_master_seed(seed: int | None = None) -> int:
+    """Get the master `seed`, or a fresh one from the operating system if it is `None`."""
+
+    return seed if seed is not None else random.SystemRandom().getrandbits(64)
+
+
+def create_counter_rng(seed: int, *keys: int | str) -> "CounterRandom":
+    """Create a counter-based random number generator of the stream at `keys` under `seed`."""
+
+    return CounterRandom(derive_seed(seed, *keys))
+
+
+class CounterRandom(random.Random):
+    """A stateless random number generator, whose n-th draw is a keyed hash of `n`.
+
+    The draws follow SplitMix64 from a mixed `key`, so that `seek` jumps to any draw in O(1).
+    Unlike `random.Random`, `randrange` and `random` always take a single draw each,
+    so that the n-th spawn of a game starts at draw `n * DRAWS_PER_SPAWN`;
+    a new board of a random number of initial tiles takes one more draw up front.
+    """
+
+    def __init__(self, key: int | None = None):
+        """
+        Args:
+            key: the key of the stream, or a fresh one from the operating system if `None`.
+        """
+
+        self._key = 0
+        self._counter = 0
+
+        super().__init__(key)
+
+    @property
+    def counter(self) -> int:
+        """The index of the next draw."""
+
+        return self._counter
+
+    def seek(self, counter: int):
+        """Move to the draw at the index `counter`, e.g. `n * DRAWS_PER_SPAWN` for spawn `n`."""
+
+        self._counter = counter
+
+    def seed(self, a: int | None = None, version: int = 2):  # pyright: ignore[reportIncompatibleMethodOverride]
+        """Restart the stream of the key `a`, or of a fresh key if it is `None`."""
+
+        self._key = _mix64(create_master_seed(a) & _MASK_64)
+        self._counter = 0
+
+    def getstate(self) -> tuple[int, int]:
+        return self._key, self._counter
+
+    def setstate(self, state: tuple[int, int]):
+        self._key, self._counter = state
+
+    def random(self) -> float:
+        return (self._draw() >> 11) * 2.0**-53
+
+    def getrandbits(self, k: int) -> int:
+        bits = 0
+
+        for _ in range(-(-k // 64)):
+            bits = (bits << 64) | self._draw()
+
+        return bits >> (-k % 64)
+
+    def randrange(self, start: int, stop: int | None = None, step: int = 1) -> int:
+        if stop is None:
+            start, stop = 0, start
+
+        if step == 0:
+            raise ValueError("zero step for randrange()")
+
+        width = (stop - start + step - (1 if step > 0 else -1)) // step
+
+        if width <= 0:
+            raise ValueError(f"empty range in randrange({start}, {stop}, {step})")
+
+        if width > _MASK_64:
+            return super().randrange(start, stop, step)
+
+        # a multiply-shift of a single draw, whose bias is at most `width / 2 ** 64`
+        return start + step * ((self._draw() * width) >> 64)
+
+    def _draw(self) -> int:
+        """Take the next draw of 64 bits."""
+
+        counter = self._counter
+        self._counter += 1
+
+        return _mix64((self._key + counter * _GOLDEN_GAMMA) & _MASK_64)
+
+
+def _mix64(value: int) -> int:
+    """Scramble the bits of a 64-bit `value`, by the finalizer of SplitMix64."""
+
+    value = ((value ^ (value >> 30)) * 0xBF58_476D_1CE4_E5B9) & _MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D0_49BB_1331_11EB) & _MASK_64
+    return value ^ (value >> 31)
@@ -0,0 +1,213 @@
+"""Module that contains the dihedral symmetries of a game board.
+
+A board has 8 symmetric equivalents under rotations and reflections, which play identically
+once the slide directions are mapped through the same symmetry. Caches of evaluated positions
+can be keyed by the canonical representative, so that symmetric positions share their entries.
+"""
+
+import enum
+import typing
+
+import typing_extensions
+
+from python_2048.game import types
+from python_2048.game.lib import bitboard_utils
+
+
+class Transform(enum.IntEnum):
+    """A rotation or reflection of a game board."""
+
+    IDENTITY = 0
+    ROTATE_CLOCKWISE = 1
+    ROTATE_HALF_TURN = 2
+    ROTATE_ANTICLOCKWISE = 3
+    FLIP_HORIZONTALLY = 4
+    FLIP_VERTICALLY = 5
+    TRANSPOSE = 6
+    ANTI_TRANSPOSE = 7
+
+    @property
+    def inverse(self) -> "Transform":
+        """The transform that undoes this one."""
+
+        return _INVERSES[self]
+
+
+_INVERSES = {
+    transform: {
+        Transform.ROTATE_CLOCKWISE: Transform.ROTATE_ANTICLOCKWISE,
+        Transform.ROTATE_ANTICLOCKWISE: Transform.ROTATE_CLOCKWISE,
+    }.get(transform, transform)
+    for transform in Transform
+}
+
+# the unit vector (row, column) of each direction
+_VECTORS = {
+    types.SlideDirection.UP: (-1, 0),
+    types.SlideDirection.LEFT: (0, -1),
+    types.SlideDirection.DOWN: (1, 0),
+    types.SlideDirection.RIGHT: (0, 1),
+}
+
+_VECTOR_TRANSFORMS: dict[Transform, typing.Callable[[int, int], tuple[int, int]]] = {
+    Transform.IDENTITY: lambda row, column: (row, column),
+    Transform.ROTATE_CLOCKWISE: lambda row, column: (column, -row),
+    Transform.ROTATE_HALF_TURN: lambda row, column: (-row, -column),
+    Transform.ROTATE_ANTICLOCKWISE: lambda row, column: (-column, row),
+    Transform.FLIP_HORIZONTALLY: lambda row, column: (row, -column),
+    Transform.FLIP_VERTICALLY: lambda row, column: (-row, column),
+    Transform.TRANSPOSE: lambda row, column: (column, row),
+    Transform.ANTI_TRANSPOSE: lambda row, column: (-column, -row),
+}
+
+_DIRECTIONS = {vector: direction for direction, vector in _VECTORS.items()}
+
+_DIRECTION_MAPS = {
+    transform: {
+        direction: _DIRECTIONS[_VECTOR_TRANSFORMS[transform](*vector)]
+        for direction, vector in _VECTORS.items()
+    }
+    for transform in Transform
+}
+
+_ODD_COLUMNS_MASK = 0x0F0F_0F0F_0F0F_0F0F
+_FIRST_HALF_COLUMNS_MASK = 0x00FF_00FF_00FF_00FF
+_ODD_ROWS_MASK = 0x0000_FFFF_0000_FFFF
+_FIRST_HALF_ROWS_MASK = 0x0000_0000_FFFF_FFFF
+
+
+def map_direction(direction: types.SlideDirection, transform: Transform) -> types.SlideDirection:
+    """Map a slide `direction` on a board to its counterpart on the `transform`ed board.
+
+    Use `transform.inverse` to map a direction on the transformed board back.
+    """
+
+    return _DIRECTION_MAPS[transform][direction]
+
+
+def apply(board: types.ReadOnlyGameBoard, transform: Transform) -> types.FrozenGameBoard:
+    """Rotate or reflect the `board`, where a rectangular board may become transposed."""
+
+    frozen_board: types.FrozenGameBoard = tuple(map(tuple, board))
+
+    match transform:
+        case Transform.IDENTITY:
+            return frozen_board
+        case Transform.ROTATE_CLOCKWISE:
+            return _flip_horizontally(_transpose(frozen_board))
+        case Transform.ROTATE_HALF_TURN:
+            return _flip_horizontally(frozen_board[::-1])
+        case Transform.ROTATE_ANTICLOCKWISE:
+            return _transpose(frozen_board)[::-1]
+        case Transform.FLIP_HORIZONTALLY:
+            return _flip_horizontally(frozen_board)
+        case Transform.FLIP_VERTICALLY:
+            return frozen_board[::-1]
+        case Transform.TRANSPOSE:
+            return _transpose(frozen_board)
+        case Transform.ANTI_TRANSPOSE:
+            return _flip_horizontally(_transpose(frozen_board)[::-1])
+        case _:  # pragma: no cover
+            typing_extensions.assert_never(transform)
+
+
+def canonicalize(board: types.ReadOnlyGameBoard) -> tuple[types.FrozenGameBoard, Transform]:
+    """Reduce the `board` to the canonical representative of its 8 symmetric equivalents.
+
+    For a board that can be encoded, the representative is the same as `canonicalize_bitboard`.
+
+    Returns:
+        The canonical board, and the transform that turns `board` into it.
+    """
+
+    return min(
+        ((apply(board, transform), transform) for transform in Transform),
+        key=lambda candidate: _get_sort_key(candidate[0]),
+    )
+
+
+def apply_to_bitboard(bitboard: types.Bitboard, transform: Transform) -> types.Bitboard:
+    """Rotate or reflect the `bitboard`."""
+
+    match transform:
+        case Transform.IDENTITY:
+            return bitboard
+        case Transform.ROTATE_CLOCKWISE:
+            return _flip_bitboard_horizontally(bitboard_utils.transpose(bitboard))
+        case Transform.ROTATE_HALF_TURN:
+            return _flip_bitboard_horizontally(_flip_bitboard_vertically(bitboard))
+        case Transform.ROTATE_ANTICLOCKWISE:
+            return _flip_bitboard_vertically(bitboard_utils.transpose(bitboard))
+        case Transform.FLIP_HORIZONTALLY:
+            return _flip_bitboard_horizontally(bitboard)
+        case Transform.FLIP_VERTICALLY:
+            return _flip_bitboard_vertically(bitboard)
+        case Transform.TRANSPOSE:
+            return bitboard_utils.transpose(bitboard)
+        case Transform.ANTI_TRANSPOSE:
+            return _flip_bitboard_horizontally(
+                _flip_bitboard_vertically(bitboard_utils.transpose(bitboard))
+            )
+        case _:  # pragma: no cover
+            typing_extensions.assert_never(transform)
+
+
+def canonicalize_bitboard(bitboard: types.Bitboard) -> tuple[types.Bitboard, Transform]:
+    """Reduce the `bitboard` to the smallest of its 8 symmetric equivalents.
+
+    Returns:
+        The canonical bitboard, and the transform that turns `bitboard` into it.
+    """
+
+    flipped = _flip_bitboard_vertically(bitboard)
+    transposed = bitboard_utils.transpose(bitboard)
+    flipped_transposed = _flip_bitboard_vertically(transposed)
+
+    # every candidate is listed in the order of `Transform`, so that ties resolve alike
+    candidates = (
+        bitboard,
+        _flip_bitboard_horizontally(transposed),
+        _flip_bitboard_horizontally(flipped),
+        flipped_transposed,
+        _flip_bitboard_horizontally(bitboard),
+        flipped,
+        transposed,
+        _flip_bitboard_horizontally(flipped_transposed),
+    )
+
+    canonical = min(candidates)
+    return canonical, Transform(candidates.index(canonical))
+
+
+def _transpose(board: types.FrozenGameBoard) -> types.FrozenGameBoard:
+    """Swap the rows and columns of the `board`."""
+
+    return tuple(zip(*board))
+
+
+def _flip_horizontally(board: types.FrozenGameBoard) -> types.FrozenGameBoard:
+    """Reverse every row of the `board`."""
+
+    return tuple(row[::-1] for row in board)
+
+
+def _get_sort_key(board: types.FrozenGameBoard) -> tuple[int, tuple[int, ...]]:
+    """Order boards by their shape, then as their bitboards would be ordered."""
+
+    return len(board), tuple(tile or 0 for row in reversed(board) for tile in reversed(row))
+
+
+def _flip_bitboard_horizontally(bitboard: types.Bitboard) -> types.Bitboard:
+    """Reverse every row of the `bitboard`, by swapping nibbles and then bytes."""
+
+    bitboard = ((bitboard & _ODD_COLUMNS_MASK) << 4) | ((bitboard >> 4) & _ODD_COLUMNS_MASK)
+    return ((bitboard & _FIRST_HALF_COLUMNS_MASK) << 8) | (
+        (bitboard >> 8) & _FIRST_HALF_COLUMNS_MASK
+    )
+
+
+def _flip_bitboard_vertically(bitboard: types.Bitboard) -> types.Bitboard:
+    """Reverse the order of the rows of the `bitboard`."""
+
+    bitboard = ((bitboard & _ODD_ROWS_MASK) << 16) | ((bitboard >> 16) & _ODD_ROWS_MASK)
+    return ((bitboard & _FIRST_HALF_ROWS_MASK) << 32) | (bitboard >> 32)
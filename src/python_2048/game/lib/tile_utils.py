@@ -1,18 +1,75 @@
 """Module that contains game logic related to tiles."""
 
+import bisect
+import functools
+import itertools
+import random
 import typing
 
-from python_2048.game import exceptions, types
+from python_2048.game import constants, exceptions, types
 
 
-def get_rows(board: types.GameBoard) -> typing.Iterator[tuple[int | None, ...]]:  # pragma: no cover
+class LineTransition(typing.NamedTuple):
+    """The outcome of moving and merging a line of tiles."""
+
+    tiles: tuple[int | None, ...]
+    """The tiles after being moved and merged."""
+
+    reward: int
+    """The sum of all tiles created by merges, i.e. the score gained in a classic 2048 game."""
+
+    changed: bool
+    """Whether any tile has been moved or merged."""
+
+    merged_tiles: tuple[int, ...]
+    """The tiles created by merges, in the order of their creation."""
+
+
+class _LineTransitionTable(dict[tuple[int | None, ...], LineTransition]):
+    """A lookup table of `LineTransition`s, which is populated lazily on first use.
+
+    Only lines up to the default board size are memoized, so that the table stays bounded
+    by the number of distinct lines on regular boards.
+    """
+
+    def __init__(self, towards_end: bool):
+        super().__init__()
+        self._towards_end = towards_end
+
+    def __missing__(self, tiles: tuple[int | None, ...]) -> LineTransition:
+        if self._towards_end:
+            moved, merged_tiles = _move_and_merge_towards_end(tiles)
+        else:
+            moved, merged_tiles = _move_and_merge_towards_end(tiles[::-1])
+            moved = moved[::-1]
+
+        transition = LineTransition(
+            moved,
+            reward=sum(merged_tiles),
+            changed=moved != tiles,
+            merged_tiles=merged_tiles,
+        )
+
+        if len(tiles) <= constants.DEFAULT_BOARD_SIZE:
+            self[tiles] = transition
+
+        return transition
+
+
+_TRANSITIONS_TOWARDS_START = _LineTransitionTable(towards_end=False)
+_TRANSITIONS_TOWARDS_END = _LineTransitionTable(towards_end=True)
+
+
+def get_rows(
+    board: types.ReadOnlyGameBoard,
+) -> typing.Iterator[tuple[int | None, ...]]:  # pragma: no cover
     """Get all rows from the `board`."""
 
     for row in board:
         yield tuple(row)
 
 
-def get_columns(board: types.GameBoard) -> typing.Iterator[tuple[int | None, ...]]:
+def get_columns(board: types.ReadOnlyGameBoard) -> typing.Iterator[tuple[int | None, ...]]:
     """Get all columns from the `board`."""
 
     try:
@@ -46,15 +103,102 @@ def replace_column(board: types.GameBoard, new_column: typing.Sequence[int | Non
             ) from cause
 
 
+def get_line_transitions(
+    towards_end: bool = True,
+) -> typing.Mapping[tuple[int | None, ...], LineTransition]:
+    """Get the process-wide lookup table from a line of tiles to its `LineTransition`.
+
+    Args:
+        towards_end: whether tiles are moved towards the end of the line, i.e. right/down;
+            otherwise towards the start of the line, i.e. left/up.
+    """
+
+    return _TRANSITIONS_TOWARDS_END if towards_end else _TRANSITIONS_TOWARDS_START
+
+
+def draw_new_tile(
+    new_tiles: typing.Sequence[types.NewTile] = constants.DEFAULT_NEW_TILES,
+    *,
+    rng: random.Random | None = None,
+) -> int:
+    """Draw the value of a new tile at random, according to the weights of `new_tiles`.
+
+    The draw is consistent with `random.choices`, but the cumulative weights are only
+    computed once for each distinct `new_tiles`, and once per process for the default.
+
+    Args:
+        new_tiles: the content and weights used to spawn a new random tile.
+        rng: the random number generator to draw from, or the global one if `None`.
+    """
+
+    if new_tiles is constants.DEFAULT_NEW_TILES:
+        values, cum_weights = _DEFAULT_NEW_TILES_COMPILED
+    else:
+        values, cum_weights = _compile_new_tiles(tuple(new_tiles))
+
+    total = cum_weights[-1]
+
+    draw = (rng or random).random()
+
+    return values[bisect.bisect(cum_weights, draw * total, 0, len(values) - 1)]
+
+
+def get_new_tile_probabilities(
+    new_tiles: typing.Sequence[types.NewTile] = constants.DEFAULT_NEW_TILES,
+) -> tuple[types.NewTile, ...]:
+    """Normalize the weights of `new_tiles` into probabilities, leaving out impossible tiles."""
+
+    if new_tiles is constants.DEFAULT_NEW_TILES:
+        return _DEFAULT_NEW_TILE_PROBABILITIES
+
+    return _normalize_new_tiles(tuple(new_tiles))
+
+
 def move_and_merge_tiles(tiles: typing.Iterable[int | None]) -> tuple[int | None, ...]:
     """
     Move each of the numbers in `tiles` from start to end,
     and merge when two tiles of the same number collide.
 
+    This function is a table lookup for lines of a regular board.
+    """
+
+    return _TRANSITIONS_TOWARDS_END[tuple(tiles)].tiles
+
+
+@functools.lru_cache(maxsize=16)
+def _compile_new_tiles(
+    new_tiles: tuple[types.NewTile, ...],
+) -> tuple[tuple[int, ...], tuple[float, ...]]:
+    """Split `new_tiles` into their values and cumulative weights."""
+
+    values, weights = zip(*new_tiles)
+    return values, tuple(itertools.accumulate(weights))
+
+
+@functools.lru_cache(maxsize=16)
+def _normalize_new_tiles(new_tiles: tuple[types.NewTile, ...]) -> tuple[types.NewTile, ...]:
+    """Replace the weights of `new_tiles` with probabilities that sum up to 1."""
+
+    total = sum(weight for _, weight in new_tiles)
+    return tuple(types.NewTile(value, weight / total) for value, weight in new_tiles if weight)
+
+
+_DEFAULT_NEW_TILES_COMPILED = _compile_new_tiles(tuple(constants.DEFAULT_NEW_TILES))
+_DEFAULT_NEW_TILE_PROBABILITIES = _normalize_new_tiles(tuple(constants.DEFAULT_NEW_TILES))
+
+
+def _move_and_merge_towards_end(
+    tiles: tuple[int | None, ...],
+) -> tuple[tuple[int | None, ...], tuple[int, ...]]:
+    """
+    Move and merge `tiles` from start to end,
+    and collect all tiles created by merges.
+
     This function is O(n) with a two-pointer approach.
     """
 
     results = list(tiles)
+    merged_tiles: list[int] = []
     left = right = len(results) - 1
 
     while left >= 0:
@@ -78,10 +222,11 @@ def move_and_merge_tiles(tiles: typing.Iterable[int | None]) -> tuple[int | None
         # Merge the left tile to the right tile
         if results[left] == results[right]:
             results[right] += results[left]  # pyright: ignore[reportOperatorIssue]
+            merged_tiles.append(results[right])  # pyright: ignore[reportArgumentType]
             results[left] = None
             left -= 1
             right -= 1
         else:
             right -= 1
 
-    return tuple(results)
+    return tuple(results), tuple(merged_tiles)
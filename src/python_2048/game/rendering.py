@@ -11,7 +11,7 @@ class GameRenderingProtocol(typing.NamedTuple):
     on_init: typing.Callable[[], None]
     """Called on the initialization of the game."""
 
-    on_start: typing.Callable[[types.GameBoard], None]
+    on_start: typing.Callable[[types.ReadOnlyGameBoard], None]
     """Called on the start of each game loop."""
 
     before_next_move: typing.Callable[[], None]
@@ -0,0 +1,477 @@
+"""Module of the compact, append-only replay format of a game.
+
+A replay starts with `MAGIC`, a varint length and a JSON header of the initial board and of
+the state of its `CounterRandom`, followed by a varint of every effective move in order.
+A move takes a single byte on a 4x4 board, even with the position and value of its spawn.
+The spawns may be left out when the random state is known, as replaying redraws them.
+
+Keyframes of the full board every `KEYFRAME_INTERVAL` moves may be kept next to a replay,
+so that seeking to any move plays at most that many moves from the nearest keyframe.
+"""
+
+import json
+import random
+import typing
+
+from python_2048.game import exceptions, types
+from python_2048.game.lib import bitboard_utils, board_utils, random_utils
+
+MAGIC = b"2048RPL1"
+"""The leading bytes of a replay file."""
+
+KEYFRAME_INTERVAL = 256
+"""The default number of moves between two keyframes."""
+
+_DIRECTIONS: tuple[types.SlideDirection, ...] = tuple(types.SlideDirection)
+_DIRECTION_CODES = {direction: code for code, direction in enumerate(_DIRECTIONS)}
+_DIRECTION_BITS = 2
+
+_BITBOARD_MOVES = {
+    types.SlideDirection.UP: bitboard_utils.move_up,
+    types.SlideDirection.LEFT: bitboard_utils.move_left,
+    types.SlideDirection.DOWN: bitboard_utils.move_down,
+    types.SlideDirection.RIGHT: bitboard_utils.move_right,
+}
+
+_SINGLE_BYTES = [bytes((code,)) for code in range(0x80)]
+
+
+class ReplayHeader(typing.NamedTuple):
+    """The configuration of a recorded game."""
+
+    board: types.FrozenGameBoard
+    """The game board before the first move."""
+
+    rng_state: tuple[int, int] | None
+    """The state of the `CounterRandom` before the first move, if the game is played by one."""
+
+    has_spawns: bool
+    """Whether every move is recorded along with its spawn."""
+
+
+class Turn(typing.NamedTuple):
+    """An effective move of a recorded game."""
+
+    direction: types.SlideDirection
+    """The direction of the move."""
+
+    spawn: types.Spawn | None
+    """The new tile after the move, if recorded."""
+
+
+class Replay(typing.NamedTuple):
+    """A recorded game."""
+
+    header: ReplayHeader
+    """The configuration of the game."""
+
+    turns: list[Turn]
+    """The effective moves of the game, in order."""
+
+
+class ReplayResult(typing.NamedTuple):
+    """The outcome of playing back a `Replay`."""
+
+    board: types.FrozenGameBoard
+    """The game board after the last move."""
+
+    num_moves: int
+    """The number of moves that have been played back."""
+
+    score: int
+    """The final score of the game, i.e. the sum of all tiles."""
+
+    max_tile: int
+    """The largest tile at the end of the game."""
+
+
+class Keyframes(typing.NamedTuple):
+    """The game boards at regular intervals of a `Replay`."""
+
+    interval: int
+    """The number of moves between two keyframes."""
+
+    boards: list[types.FrozenGameBoard]
+    """The game boards after every `interval` moves, starting with the initial one."""
+
+
+class ReplayRecorder:
+    """Append every effective move of a game to a binary file, e.g. as `GameEngine` plays it."""
+
+    def __init__(
+        self,
+        file: typing.BinaryIO,
+        board: types.ReadOnlyGameBoard,
+        *,
+        rng: random.Random | None = None,
+        record_spawns: bool = True,
+    ):
+        """
+        Args:
+            file: the file to append to, which is left open.
+            board: the game board before the first move.
+            rng: the random number generator of the spawns; only the state of a `CounterRandom`
+                can be recorded, which makes the replay verifiable.
+            record_spawns: whether to record the spawn of every move, which is implied
+                if the state of `rng` cannot be recorded.
+        """
+
+        rng_state = rng.getstate() if isinstance(rng, random_utils.CounterRandom) else None
+
+        self._file = file
+        self._records_spawns = record_spawns or rng_state is None
+        self._num_columns = len(board[0]) if board else 0
+        self._position_bits = max(len(board) * self._num_columns - 1, 0).bit_length()
+
+        header = json.dumps(
+            {"board": board, "rng": rng_state, "spawns": self._records_spawns},
+            separators=(",", ":"),
+        ).encode()
+
+        file.write(MAGIC + _encode_varint(len(header)) + header)
+
+    @property
+    def records_spawns(self) -> bool:
+        """Whether every move is recorded along with its spawn."""
+
+        return self._records_spawns
+
+    def record(self, direction: types.SlideDirection, spawn: types.Spawn | None = None):
+        """Append an effective move, and its spawn if `records_spawns`.
+
+        Raises:
+            ValueError: if the spawn is missing, or its value is not a power of two.
+        """
+
+        code = _DIRECTION_CODES[direction]
+
+        if self._records_spawns:
+            if spawn is None or spawn.value < 2 or spawn.value & (spawn.value - 1):
+                raise ValueError(f"Expected the spawn of a power of two, got {spawn}")
+
+            position = spawn.row * self._num_columns + spawn.column
+            exponent = spawn.value.bit_length() - 2  # the smallest tile of 2 is encoded as 0
+            code |= (position | exponent << self._position_bits) << _DIRECTION_BITS
+
+        self._file.write(_SINGLE_BYTES[code] if code < 0x80 else _encode_varint(code))
+
+
+class ReplayCursor:
+    """A position within a `Replay`, which plays the turns on a bitboard wherever possible."""
+
+    def __init__(self, replay: Replay, *, verify: bool = False):
+        """
+        Args:
+            replay: the recorded game.
+            verify: whether to check that the recorded spawns are drawn by the recorded state
+                of the random number generator, if both are recorded.
+        """
+
+        header = replay.header
+
+        self._turns = replay.turns
+        self._rng: random_utils.CounterRandom | None = None
+        self._start_counter = 0
+
+        if header.rng_state is not None:
+            self._rng = random_utils.CounterRandom()
+            self._rng.setstate(header.rng_state)
+            self._start_counter = header.rng_state[1]
+
+        self._verify = verify and self._rng is not None
+
+        self._initial_board = header.board
+        self._move_index = 0
+        self._bitboard: types.Bitboard | None = None
+        self._board: types.GameBoard = []
+        self.restore(header.board, 0)
+
+    @property
+    def move_index(self) -> int:
+        """The number of moves that have been played."""
+
+        return self._move_index
+
+    @property
+    def num_moves(self) -> int:
+        """The number of moves of the replay."""
+
+        return len(self._turns)
+
+    @property
+    def board(self) -> types.FrozenGameBoard:
+        """The game board after `move_index` moves."""
+
+        if self._bitboard is not None:
+            return bitboard_utils.decode_frozen(self._bitboard)
+
+        return tuple(map(tuple, self._board))
+
+    def restore(self, board: types.ReadOnlyGameBoard, move_index: int):
+        """Continue from a `board` that is known to be reached after `move_index` moves."""
+
+        if bitboard_utils.can_encode(board):
+            self._bitboard = bitboard_utils.encode(board)
+        else:
+            self._bitboard = None
+            self._board = [list(row) for row in board]
+
+        self._move_index = move_index
+
+    def seek(self, move_index: int, keyframes: Keyframes | None = None):
+        """Move to `move_index`, which is clamped to the moves of the replay.
+
+        The moves are played from the nearest of the current position and the keyframe before
+        `move_index`, so that at most `keyframes.interval` moves are played.
+        Without keyframes, seeking backwards plays the replay from its start.
+
+        Raises:
+            InvalidReplay: if a move is not effective, or it spawns onto an occupied tile.
+            ReplayDiverged: if a recorded spawn is not the one drawn, on verification.
+        """
+
+        move_index = min(max(move_index, 0), len(self._turns))
+
+        if keyframes is not None:
+            keyframe_index = min(move_index // keyframes.interval, len(keyframes.boards) - 1)
+            keyframe_move_index = keyframe_index * keyframes.interval
+
+            if not keyframe_move_index <= self._move_index <= move_index:
+                self.restore(keyframes.boards[keyframe_index], keyframe_move_index)
+        elif move_index < self._move_index:
+            self.restore(self._initial_board, 0)
+
+        while self._move_index < move_index:
+            self.step()
+
+    def step(self) -> bool:
+        """Play the next move, and return whether there has been one.
+
+        Raises:
+            InvalidReplay: if the move is not effective, or it spawns onto an occupied tile.
+            ReplayDiverged: if the recorded spawn is not the one drawn, on verification.
+        """
+
+        if self._move_index >= len(self._turns):
+            return False
+
+        turn = self._turns[self._move_index]
+
+        # every spawn takes the same number of draws, so that the draws of any move are known
+        if self._rng is not None:
+            self._rng.seek(self._start_counter + self._move_index * random_utils.DRAWS_PER_SPAWN)
+
+        if self._bitboard is not None:
+            self._step_bitboard(self._bitboard, turn)
+        else:
+            self._step_board(turn)
+
+        self._move_index += 1
+        return True
+
+    def _step_bitboard(self, bitboard: types.Bitboard, turn: Turn):
+        """Play a move on the bitboard, and continue on the 2d-matrix if it may overflow."""
+
+        moved = _BITBOARD_MOVES[turn.direction](bitboard)
+
+        if moved == bitboard:
+            raise exceptions.InvalidReplay(f"the move {self._move_index} is not effective")
+
+        if turn.spawn is None:
+            spawned = bitboard_utils.spawn_new_tile(moved, rng=self._rng)
+        else:
+            row_index, column_index, value = turn.spawn
+            shift = 4 * (row_index * bitboard_utils.BOARD_SIZE + column_index)
+
+            if (moved >> shift) & 0xF:
+                raise exceptions.InvalidReplay(f"the move {self._move_index} spawns onto a tile")
+
+            spawned = moved | (value.bit_length() - 1) << shift
+
+            if self._verify and bitboard_utils.spawn_new_tile(moved, rng=self._rng) != spawned:
+                raise exceptions.ReplayDiverged(self._move_index)
+
+        if bitboard_utils.has_exponent(spawned, bitboard_utils.MAX_EXPONENT):
+            self._board = bitboard_utils.decode(spawned)
+            self._bitboard = None
+        else:
+            self._bitboard = spawned
+
+    def _step_board(self, turn: Turn):
+        """Play a move on the 2d-matrix."""
+
+        board = self._board
+
+        if not board_utils.move_and_merge(board, turn.direction).changed:
+            raise exceptions.InvalidReplay(f"the move {self._move_index} is not effective")
+
+        if turn.spawn is None:
+            board_utils.spawn_new_tile(board, rng=self._rng)
+            return
+
+        row_index, column_index, value = turn.spawn
+
+        if board[row_index][column_index] is not None:
+            raise exceptions.InvalidReplay(f"the move {self._move_index} spawns onto a tile")
+
+        if self._verify and board_utils.draw_spawn(board, rng=self._rng) != turn.spawn:
+            raise exceptions.ReplayDiverged(self._move_index)
+
+        board[row_index][column_index] = value
+
+
+def read_replay(file: typing.BinaryIO) -> Replay:
+    """Read a replay written by `ReplayRecorder`.
+
+    Raises:
+        InvalidReplay: if the file is not in the replay format, or it is truncated.
+    """
+
+    data = file.read()
+
+    if not data.startswith(MAGIC):
+        raise exceptions.InvalidReplay("not a replay file")
+
+    header_length, offset = _decode_varint(data, len(MAGIC))
+
+    try:
+        fields = json.loads(data[offset : offset + header_length])
+        board: types.FrozenGameBoard = tuple(map(tuple, fields["board"]))
+        rng_state = tuple(fields["rng"]) if fields["rng"] is not None else None
+        has_spawns = bool(fields["spawns"])
+    except (ValueError, TypeError, KeyError) as cause:
+        raise exceptions.InvalidReplay("the header cannot be parsed") from cause
+
+    if not has_spawns and rng_state is None:
+        raise exceptions.InvalidReplay("neither the spawns nor the random state are recorded")
+
+    header = ReplayHeader(board, typing.cast(tuple[int, int] | None, rng_state), has_spawns)
+    offset += header_length
+
+    if not has_spawns:
+        if any(code >= len(_DIRECTIONS) for code in data[offset:]):
+            raise exceptions.InvalidReplay("a move cannot be decoded")
+
+        return Replay(header, [Turn(_DIRECTIONS[code], None) for code in data[offset:]])
+
+    num_columns = len(board[0]) if board else 0
+    num_tiles = len(board) * num_columns
+    position_bits = max(num_tiles - 1, 0).bit_length()
+    turns: list[Turn] = []
+
+    while offset < len(data):
+        code, offset = _decode_varint(data, offset)
+        spawn_code = code >> _DIRECTION_BITS
+        position = spawn_code & ((1 << position_bits) - 1)
+
+        if position >= num_tiles:
+            raise exceptions.InvalidReplay(f"the move {len(turns)} spawns off the board")
+
+        spawn = types.Spawn(*divmod(position, num_columns), 2 << (spawn_code >> position_bits))
+        turns.append(Turn(_DIRECTIONS[code & 0b11], spawn))
+
+    return Replay(header, turns)
+
+
+def play_back(replay: Replay, *, verify: bool = False) -> ReplayResult:
+    """Play every move of a `replay`.
+
+    Raises:
+        InvalidReplay: if a move is not effective, or it spawns onto an occupied tile.
+        ReplayDiverged: if a recorded spawn is not the one drawn, on verification.
+    """
+
+    cursor = ReplayCursor(replay, verify=verify)
+
+    while cursor.step():
+        pass
+
+    board = cursor.board
+    summary = board_utils.summarize(board)
+
+    return ReplayResult(board, cursor.move_index, summary.score, summary.max_tile)
+
+
+def build_keyframes(replay: Replay, *, interval: int = KEYFRAME_INTERVAL) -> Keyframes:
+    """Play every move of a `replay`, and keep the game board after every `interval` moves.
+
+    Raises:
+        InvalidReplay: if a move is not effective, or it spawns onto an occupied tile.
+    """
+
+    cursor = ReplayCursor(replay)
+    boards = [cursor.board]
+
+    while cursor.step():
+        if cursor.move_index % interval == 0:
+            boards.append(cursor.board)
+
+    return Keyframes(interval, boards)
+
+
+def write_keyframes(file: typing.TextIO, keyframes: Keyframes, *, replay_digest: str):
+    """Write `keyframes` as JSON, along with the digest of the replay file they belong to."""
+
+    json.dump(
+        {"replay": replay_digest, "interval": keyframes.interval, "boards": keyframes.boards},
+        file,
+        separators=(",", ":"),
+    )
+
+
+def read_keyframes(file: typing.TextIO, *, replay_digest: str) -> Keyframes:
+    """Read keyframes written by `write_keyframes`.
+
+    Raises:
+        InvalidReplay: if the file cannot be parsed, or it belongs to another replay file.
+    """
+
+    try:
+        fields = json.load(file)
+        digest = fields["replay"]
+        interval = int(fields["interval"])
+        boards: list[types.FrozenGameBoard] = [
+            tuple(map(tuple, board)) for board in fields["boards"]
+        ]
+    except (ValueError, TypeError, KeyError) as cause:
+        raise exceptions.InvalidReplay("the keyframes cannot be parsed") from cause
+
+    if digest != replay_digest:
+        raise exceptions.InvalidReplay("the keyframes belong to another replay")
+
+    if interval < 1 or not boards:
+        raise exceptions.InvalidReplay("the keyframes are empty")
+
+    return Keyframes(interval, boards)
+
+
+def _encode_varint(value: int) -> bytes:
+    """Encode a non-negative integer in LEB128, i.e. 7 bits per byte, lowest bits first."""
+
+    encoded = bytearray()
+
+    while value >= 0x80:
+        encoded.append(value & 0x7F | 0x80)
+        value >>= 7
+
+    encoded.append(value)
+    return bytes(encoded)
+
+
+def _decode_varint(data: bytes, offset: int) -> tuple[int, int]:
+    """Decode a varint at `offset` of `data`, and return it with the offset after it."""
+
+    value = shift = 0
+
+    while True:
+        if offset >= len(data):
+            raise exceptions.InvalidReplay("the file is truncated")
+
+        byte = data[offset]
+        value |= (byte & 0x7F) << shift
+        offset += 1
+
+        if byte < 0x80:
+            return value, offset
+
+        shift += 7
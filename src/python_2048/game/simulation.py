@@ -0,0 +1,111 @@
+"""Module that plays games headlessly, and aggregates their outcomes."""
+
+import collections
+import math
+import pathlib
+import random
+import typing
+
+from python_2048.game import engine, rendering, replay, state
+from python_2048.players import base
+
+SCORE_PERCENTILES = (10, 25, 50, 75, 90)
+"""The percentiles of the final scores that `summarize` reports."""
+
+
+class GameResult(typing.NamedTuple):
+    """The outcome of a game that is played without rendering."""
+
+    score: int
+    """The final score of the game, i.e. the sum of all tiles."""
+
+    max_tile: int
+    """The largest tile at the end of the game."""
+
+    won: bool
+    """Whether the game has been won."""
+
+    num_moves: int
+    """The number of moves that the player has made."""
+
+
+class SimulationSummary(typing.NamedTuple):
+    """The aggregates of many `GameResult`s."""
+
+    num_games: int
+    """The number of games that have been played."""
+
+    num_wins: int
+    """The number of games that have been won."""
+
+    num_moves: int
+    """The number of moves that have been made in all games."""
+
+    score_percentiles: dict[int, int]
+    """The final scores by their percentiles in `SCORE_PERCENTILES`, by the nearest rank."""
+
+    max_tiles: dict[int, int]
+    """The number of games by their largest tile, in ascending order of the tiles."""
+
+    @property
+    def win_rate(self) -> float:
+        """The ratio of games that have been won."""
+
+        return self.num_wins / self.num_games if self.num_games else 0.0
+
+
+def play_game(
+    player: base.Player,
+    *,
+    rng: random.Random | None = None,
+    record_path: pathlib.Path | None = None,
+) -> GameResult:
+    """Play a new game until a win/lose is determined, with the semantics of `DO_NOT_RENDER`.
+
+    Args:
+        player: the input source to get next moves from.
+        rng: the random number generator of the spawns, or the global one if `None`.
+        record_path: the path to write a replay of the game to, if any.
+    """
+
+    num_moves = 0
+
+    def count_move(_):
+        nonlocal num_moves
+        num_moves += 1
+
+    state_ = state.GameState(rng=rng)
+    renderer = rendering.DO_NOT_RENDER._replace(after_next_move=count_move)
+
+    if record_path is None:
+        won = engine.GameEngine(state_).start(player, renderer=renderer)
+    else:
+        with record_path.open("wb") as file:
+            recorder = replay.ReplayRecorder(file, state_.board, rng=rng)
+            won = engine.GameEngine(state_, recorder=recorder).start(player, renderer=renderer)
+
+    return GameResult(state_.score, state_.max_tile, won, num_moves)
+
+
+def summarize(results: typing.Iterable[GameResult]) -> SimulationSummary:
+    """Aggregate the win rate, the score percentiles and the distribution of largest tiles."""
+
+    results = list(results)
+    scores = sorted(result.score for result in results)
+
+    score_percentiles = (
+        {
+            percentile: scores[max(math.ceil(percentile / 100 * len(scores)), 1) - 1]
+            for percentile in SCORE_PERCENTILES
+        }
+        if scores
+        else {}
+    )
+
+    return SimulationSummary(
+        num_games=len(results),
+        num_wins=sum(result.won for result in results),
+        num_moves=sum(result.num_moves for result in results),
+        score_percentiles=score_percentiles,
+        max_tiles=dict(sorted(collections.Counter(result.max_tile for result in results).items())),
+    )
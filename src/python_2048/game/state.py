@@ -1,51 +1,152 @@
 """Module of `GameState`."""
 
 import copy
+import random
+import typing
 
 import typing_extensions
 
 from python_2048.game import constants, types
-from python_2048.game.lib import board_utils
+from python_2048.game.lib import bitboard_utils, board_utils
 
 
 class GameState:
-    """A public interface to mutate and manage the game state of 2048."""
+    """A public interface to mutate and manage the game state of 2048.
+
+    A 4x4 board of powers of two is kept as a packed `Bitboard` for fast moves,
+    while any other board falls back to the 2d-matrix representation.
+
+    The score, the largest tile and the number of empty tiles are kept up to date
+    by each slide, so that querying them does not scan the board.
+
+    The attributes are slotted rather than kept in a `__dict__`, so that a live game
+    of a 4x4 board takes little more than its packed integer, e.g. in a search frontier.
+    """
+
+    __slots__ = (
+        "_bitboard",
+        "_board",
+        "_frozen_board",
+        "_last_spawn",
+        "_last_spawn_bits",
+        "_legal_moves",
+        "_max_tile",
+        "_num_empty_tiles",
+        "_rng",
+        "_score",
+    )
 
     def __init__(
         self,
         board: types.GameBoard | None = None,
         num_initial_tiles: int | None = constants.DEFAULT_NUMBER_OF_INITIAL_TILES,
+        *,
+        rng: random.Random | None = None,
     ):
         """
         Args:
             board: a game board configuration, where a new one would be created if null
             num_initial_tiles: if a new board is being created, the number of initial tiles
                 to be populated; evaluates to a random number if null.
+            rng: the random number generator of this game's spawns, or the global one if null;
+                a game of its own generator is reproducible regardless of other games.
         """
 
-        self._board = board or board_utils.create_new_board(num_initial_tiles=num_initial_tiles)
+        self._rng = rng
+
+        board = board or board_utils.create_new_board(num_initial_tiles=num_initial_tiles, rng=rng)
+
+        self._bitboard: types.Bitboard | None = None
+        self._frozen_board: types.FrozenGameBoard | None = None
+        self._legal_moves: frozenset[types.SlideDirection] | None = None
+        self._last_spawn: types.Spawn | None = None
+        self._last_spawn_bits: types.Bitboard = 0
+
+        # the 2d-matrix is only held on its own path, so that it cannot go stale
+        if bitboard_utils.can_encode(board):
+            self._bitboard = bitboard_utils.encode(board)
+        else:
+            self._board = board
+
+        self._score, self._max_tile, self._num_empty_tiles = board_utils.summarize(board)
 
     @property
-    def board(self) -> types.GameBoard:
-        """The game board."""
+    def board(self) -> types.FrozenGameBoard:
+        """An immutable snapshot of the game board, which is cached until the next mutation."""
+
+        if self._frozen_board is None:
+            if self._bitboard is not None:
+                self._frozen_board = bitboard_utils.decode_frozen(self._bitboard)
+            else:
+                self._frozen_board = tuple(map(tuple, self._board))
+
+        return self._frozen_board
+
+    def copy_board(self) -> types.GameBoard:
+        """Get a mutable copy of the game board, which is detached from this game state."""
+
+        if self._bitboard is not None:
+            return bitboard_utils.decode(self._bitboard)
 
-        return copy.deepcopy(self._board)  # prevent unexpected mutations
+        return copy.deepcopy(self._board)
 
     @property
     def score(self) -> int:
-        """The current score of the game."""
+        """The current score of the game, i.e. the sum of all tiles."""
 
-        return board_utils.get_score(self._board)
+        return self._score
+
+    @property
+    def max_tile(self) -> int:
+        """The largest tile on the game board, or 0 if it is empty."""
+
+        return self._max_tile
+
+    @property
+    def num_empty_tiles(self) -> int:
+        """The number of empty tiles on the game board."""
+
+        return self._num_empty_tiles
+
+    @property
+    def last_spawn(self) -> types.Spawn | None:
+        """The new tile that the last effective slide has spawned, if any."""
+
+        # the spawn on a bitboard is only located on demand, as most games never ask for it;
+        # the bits are a bitboard of the new tile alone
+        if self._last_spawn_bits:
+            self._last_spawn = bitboard_utils.get_spawn(0, self._last_spawn_bits)
+            self._last_spawn_bits = 0
+
+        return self._last_spawn
 
     def has_won(self) -> bool:
         """Whether the player has won the game."""
 
+        if self._max_tile <= 2048:
+            return self._max_tile == 2048
+
+        # a larger tile does not rule out another tile of 2048
+        if self._bitboard is not None:
+            return bitboard_utils.has_2048(self._bitboard)
+
         return board_utils.has_2048(self._board)
 
     def is_out_of_moves(self) -> bool:
         """Whether the player has lost the game."""
 
-        return board_utils.is_out_of_moves(self._board)
+        return not self.legal_moves()
+
+    def legal_moves(self) -> frozenset[types.SlideDirection]:
+        """The directions towards which a slide is effective, cached until the next mutation."""
+
+        if self._legal_moves is None:
+            if self._bitboard is not None:
+                self._legal_moves = bitboard_utils.get_legal_moves(self._bitboard)
+            else:
+                self._legal_moves = board_utils.get_legal_moves(self._board)
+
+        return self._legal_moves
 
     def slide(self, direction: types.SlideDirection) -> bool:
         """
@@ -68,35 +169,102 @@ class GameState:
     def slide_up(self) -> bool:
         """Slide the tiles to the top, then spawn a new tile if it is an effective move."""
 
-        if board_utils.move_and_merge_up(self._board):
-            board_utils.spawn_new_tile(self._board)
-            return True
+        if self._bitboard is not None:
+            return self._slide_bitboard(self._bitboard, bitboard_utils.move_up)
 
-        return False
+        return self._slide_board(types.SlideDirection.UP)
 
     def slide_left(self) -> bool:
         """Slide the tiles to the left, then spawn a new tile if it is an effective move."""
 
-        if board_utils.move_and_merge_left(self._board):
-            board_utils.spawn_new_tile(self._board)
-            return True
+        if self._bitboard is not None:
+            return self._slide_bitboard(self._bitboard, bitboard_utils.move_left)
 
-        return False
+        return self._slide_board(types.SlideDirection.LEFT)
 
     def slide_down(self) -> bool:
         """Slide the tiles to the bottom, then spawn a new tile if it is an effective move."""
 
-        if board_utils.move_and_merge_down(self._board):
-            board_utils.spawn_new_tile(self._board)
-            return True
+        if self._bitboard is not None:
+            return self._slide_bitboard(self._bitboard, bitboard_utils.move_down)
 
-        return False
+        return self._slide_board(types.SlideDirection.DOWN)
 
     def slide_right(self) -> bool:
         """Slide the tiles to the right, then spawn a new tile if it is an effective move."""
 
-        if board_utils.move_and_merge_right(self._board):
-            board_utils.spawn_new_tile(self._board)
-            return True
+        if self._bitboard is not None:
+            return self._slide_bitboard(self._bitboard, bitboard_utils.move_right)
+
+        return self._slide_board(types.SlideDirection.RIGHT)
+
+    def _slide_bitboard(
+        self,
+        bitboard: types.Bitboard,
+        move: typing.Callable[[types.Bitboard], types.Bitboard],
+    ) -> bool:
+        """Slide the tiles on `bitboard` with `move`, then spawn a new tile if effective."""
+
+        moved = move(bitboard)
+
+        if moved == bitboard:
+            return False
+
+        # a merge at most doubles the largest tile, as a merged tile cannot merge again
+        if self._max_tile and bitboard_utils.has_exponent(moved, self._max_tile.bit_length()):
+            self._max_tile *= 2
+
+        # an effective move always leaves at least one empty tile behind
+        num_empty_tiles = bitboard_utils.count_empty_tiles(moved)
+
+        self._bitboard = bitboard_utils.spawn_new_tile(
+            moved, num_empty_tiles=num_empty_tiles, rng=self._rng
+        )
+        self._frozen_board = None
+        self._legal_moves = None
+        self._last_spawn = None
+        self._last_spawn_bits = moved ^ self._bitboard
+
+        # merges preserve the sum of all tiles, so only the new tile changes the score
+        self._add_new_tile(bitboard_utils.get_spawned_tile(moved, self._bitboard))
+        self._num_empty_tiles = num_empty_tiles - 1
+
+        if bitboard_utils.has_exponent(self._bitboard, bitboard_utils.MAX_EXPONENT):
+            # the next merge could overflow 4 bits, continue on the 2d-matrix instead
+            self._board = bitboard_utils.decode(self._bitboard)
+            self._bitboard = None
+
+        return True
+
+    def _slide_board(self, direction: types.SlideDirection) -> bool:
+        """Slide the tiles on the 2d-matrix, then spawn a new tile if it is an effective move."""
+
+        outcome = board_utils.move_and_merge(self._board, direction)
+
+        if not outcome.changed:
+            return False
+
+        # each merge frees up a tile
+        self._num_empty_tiles += len(outcome.merged_tiles)
+        self._max_tile = max((self._max_tile, *outcome.merged_tiles))
+
+        spawn = board_utils.draw_spawn(
+            self._board, num_empty_tiles=self._num_empty_tiles, rng=self._rng
+        )
+        self._frozen_board = None
+        self._legal_moves = None
+        self._last_spawn = spawn
+        self._last_spawn_bits = 0
+
+        if spawn is not None:
+            self._board[spawn.row][spawn.column] = spawn.value
+            self._num_empty_tiles -= 1
+            self._add_new_tile(spawn.value)
+
+        return True
+
+    def _add_new_tile(self, new_tile: int):
+        """Account for a new tile in the score and the largest tile."""
 
-        return False
+        self._score += new_tile
+        self._max_tile = max(self._max_tile, new_tile)
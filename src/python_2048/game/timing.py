@@ -0,0 +1,116 @@
+"""Module that times the phases of the game loop, for `GameEngine` to opt into.
+
+Every call of a phase adds its wall-clock and CPU time to the totals of the phase, and its
+wall-clock time to a histogram of power-of-two buckets of nanoseconds.
+"""
+
+import enum
+import functools
+import time
+import typing
+
+_P = typing.ParamSpec("_P")
+_R = typing.TypeVar("_R")
+
+
+class Phase(str, enum.Enum):
+    """The phases of a turn of the game loop."""
+
+    ON_START = "renderer.on_start"
+    HAS_WON = "state.has_won"
+    IS_OUT_OF_MOVES = "state.is_out_of_moves"
+    LEGAL_MOVES = "state.legal_moves"
+    GET_NEXT_MOVE = "player.get_next_move"
+    AFTER_NEXT_MOVE = "renderer.after_next_move"
+    SLIDE = "state.slide"
+
+
+class PhaseTiming(typing.NamedTuple):
+    """The times of all calls of a phase."""
+
+    num_calls: int
+    """The number of calls of the phase."""
+
+    wall_time: float
+    """The total wall-clock time of the calls, in seconds."""
+
+    cpu_time: float
+    """The total CPU time of the process during the calls, in seconds."""
+
+    histogram: dict[int, int]
+    """The number of calls by the upper bound of their wall-clock time in nanoseconds,
+    i.e. a power of two, in ascending order of the bounds."""
+
+    def percentile(self, percentile: float) -> int:
+        """Get the upper bound in nanoseconds of the histogram bucket of a `percentile`."""
+
+        rank = max(percentile / 100 * self.num_calls, 1)
+        num_calls = 0
+
+        for upper_bound, count in self.histogram.items():
+            num_calls += count
+
+            if num_calls >= rank:
+                return upper_bound
+
+        return 0
+
+
+class _PhaseRecord:
+    """The mutable times of a phase, while it is being timed."""
+
+    __slots__ = ("buckets", "cpu_ns", "num_calls", "wall_ns")
+
+    def __init__(self):
+        self.num_calls = 0
+        self.wall_ns = 0
+        self.cpu_ns = 0
+        self.buckets = [0] * 65  # by the bit length of the nanoseconds
+
+
+class PhaseTimer:
+    """Time the phases of a game, e.g. as `GameEngine(phase_timer=...)` plays it."""
+
+    def __init__(self):
+        self._records = {phase: _PhaseRecord() for phase in Phase}
+
+    def wrap(self, phase: Phase, function: typing.Callable[_P, _R]) -> typing.Callable[_P, _R]:
+        """Wrap a `function`, so that every call of it is timed as the `phase`."""
+
+        record = self._records[phase]
+        buckets = record.buckets
+
+        @functools.wraps(function)
+        def timed(*args: _P.args, **kwargs: _P.kwargs) -> _R:
+            started_at = time.perf_counter_ns()
+            cpu_started_at = time.process_time_ns()
+
+            try:
+                return function(*args, **kwargs)
+            finally:
+                cpu_ns = time.process_time_ns() - cpu_started_at
+                wall_ns = time.perf_counter_ns() - started_at
+
+                record.num_calls += 1
+                record.wall_ns += wall_ns
+                record.cpu_ns += cpu_ns
+                buckets[wall_ns.bit_length()] += 1
+
+        return timed
+
+    def timings(self) -> dict[Phase, PhaseTiming]:
+        """Get the times of every phase so far, in the order of a turn."""
+
+        return {
+            phase: PhaseTiming(
+                num_calls=record.num_calls,
+                wall_time=record.wall_ns / 1e9,
+                cpu_time=record.cpu_ns / 1e9,
+                histogram={
+                    1 << bit_length: count
+                    for bit_length, count in enumerate(record.buckets)
+                    if count
+                },
+            )
+            for phase, record in self._records.items()
+        }
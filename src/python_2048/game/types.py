@@ -8,6 +8,15 @@ import pydantic
 GameBoard = list[list[int | None]]
 """A 2d-matrix representation of the game board."""
 
+FrozenGameBoard = tuple[tuple[int | None, ...], ...]
+"""An immutable 2d-matrix representation of the game board."""
+
+ReadOnlyGameBoard = typing.Sequence[typing.Sequence[int | None]]
+"""A game board that is only read from, e.g. a `GameBoard` or a `FrozenGameBoard`."""
+
+Bitboard = int
+"""A 4x4 game board packed into a 64-bit integer of 4-bit log2 exponents."""
+
 
 class NewTile(typing.NamedTuple):
     """A new tile that can be spawned in a game board."""
@@ -19,6 +28,19 @@ class NewTile(typing.NamedTuple):
     """The weight of `value` in the random sampling."""
 
 
+class Spawn(typing.NamedTuple):
+    """A new tile that has been spawned on a game board."""
+
+    row: int
+    """The row index of the new tile."""
+
+    column: int
+    """The column index of the new tile."""
+
+    value: int
+    """The numeric value of the new tile."""
+
+
 class SlideDirection(str, enum.Enum):
     """An enumeration of slide directions towards which tiles are moved and merged."""
 
@@ -1,6 +1,7 @@
 """Module of `Player`."""
 
 import abc
+import typing
 
 from python_2048.game import types
 
@@ -9,11 +10,16 @@ class Player(abc.ABC):
     """A `Player` represents a source of `PlayerDecision`."""
 
     @abc.abstractmethod
-    def get_next_move(self, board: types.GameBoard) -> types.PlayerDecision:
+    def get_next_move(
+        self,
+        board: types.ReadOnlyGameBoard,
+        legal_moves: typing.AbstractSet[types.SlideDirection] | None = None,
+    ) -> types.PlayerDecision:
         """Get the next move from the player.
 
         Args:
             board: the 2048 game board.
+            legal_moves: the directions towards which a slide is effective, if known.
 
         Returns:
             The player's decision based on the given `board`.
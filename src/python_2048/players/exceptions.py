@@ -1,8 +1,11 @@
 """Exceptions for player operations."""
 
 import abc
+import pathlib
+import typing
 
-import pydantic_ai.models
+if typing.TYPE_CHECKING:
+    import pydantic_ai.models
 
 
 class PlayerException(abc.ABC, Exception):
@@ -16,7 +19,7 @@ class PlayerException(abc.ABC, Exception):
 class LlmException(PlayerException):
     """Raised when `pydantic-ai` fails to interact with the LLM."""
 
-    def __init__(self, model: pydantic_ai.models.Model):
+    def __init__(self, model: "pydantic_ai.models.Model"):
         self.model = model
 
     def __str__(self) -> str:
@@ -28,3 +31,13 @@ class InvalidStructuredResponse(LlmException):
 
     def __str__(self) -> str:
         return "Failed to generate a structured response from the LLM: " + self.model.model_name
+
+
+class InvalidWeightsFile(PlayerException):
+    """Raised when a weights file of an n-tuple network cannot be loaded."""
+
+    def __init__(self, file_path: pathlib.Path):
+        self.file_path = file_path
+
+    def __str__(self) -> str:
+        return f"Failed to load the n-tuple network weights: {self.file_path}"
@@ -0,0 +1,280 @@
+"""Module of `ExpectimaxPlayer`."""
+
+import itertools
+import math
+import time
+import typing
+
+from python_2048.game import constants, types
+from python_2048.game.lib import bitboard_utils, board_utils, tile_utils
+from python_2048.players import base, transposition
+
+DEFAULT_MAX_DEPTH = 3
+"""The default number of moves to look ahead."""
+
+DEFAULT_TRANSPOSITION_TABLE_SIZE = 1 << 16
+"""The default number of positions that an `ExpectimaxPlayer` caches, which takes about 10 MB."""
+
+DEFAULT_TIME_BUDGET = 0.05
+"""The default number of seconds to search for each move."""
+
+MIN_PROBABILITY = 1e-4
+"""The probability below which a line of play is evaluated without looking further ahead."""
+
+# weights of the heuristic that rewards open, monotonic lines with pending merges
+_LOSS_PENALTY = 200_000.0
+_EMPTY_TILE_WEIGHT = 270.0
+_MERGE_WEIGHT = 700.0
+_MONOTONICITY_POWER = 4.0
+_MONOTONICITY_WEIGHT = 47.0
+_SUM_POWER = 3.5
+_SUM_WEIGHT = 11.0
+
+
+def _evaluate_line(exponents: typing.Sequence[int]) -> float:
+    """Evaluate a row or column by the log2 exponents of its tiles, where `0` is empty."""
+
+    num_empty_tiles = exponents.count(0)
+    tile_sum = sum(exponent**_SUM_POWER for exponent in exponents)
+
+    merges = 0
+    previous, streak = 0, 0
+
+    for exponent in filter(None, exponents):
+        if exponent == previous:
+            streak += 1
+        else:
+            merges += 1 + streak if streak else 0
+            previous, streak = exponent, 0
+
+    merges += 1 + streak if streak else 0
+
+    towards_start = towards_end = 0.0
+
+    for current, following in itertools.pairwise(exponents):
+        difference = following**_MONOTONICITY_POWER - current**_MONOTONICITY_POWER
+
+        if difference > 0:
+            towards_start += difference
+        else:
+            towards_end -= difference
+
+    return (
+        _LOSS_PENALTY
+        + _EMPTY_TILE_WEIGHT * num_empty_tiles
+        + _MERGE_WEIGHT * merges
+        - _MONOTONICITY_WEIGHT * min(towards_start, towards_end)
+        - _SUM_WEIGHT * tile_sum
+    )
+
+
+class _RowHeuristicTable(dict[int, float]):
+    """A lazily populated lookup table from a 16-bit row of a `Bitboard` to its evaluation."""
+
+    def __missing__(self, row: int) -> float:
+        value = self[row] = _evaluate_line([(row >> shift) & 0xF for shift in range(0, 16, 4)])
+        return value
+
+
+class _LineHeuristicTable(dict[tuple[int | None, ...], float]):
+    """A lazily populated lookup table from a row or column of a board to its evaluation."""
+
+    def __missing__(self, tiles: tuple[int | None, ...]) -> float:
+        value = self[tiles] = _evaluate_line([(tile or 1).bit_length() - 1 for tile in tiles])
+        return value
+
+
+_ROW_HEURISTICS = _RowHeuristicTable()
+_LINE_HEURISTICS = _LineHeuristicTable()
+
+
+def _evaluate_bitboard(bitboard: types.Bitboard) -> float:
+    """Evaluate every row and column of the `bitboard`."""
+
+    transposed = bitboard_utils.transpose(bitboard)
+
+    return (
+        _ROW_HEURISTICS[bitboard & 0xFFFF]
+        + _ROW_HEURISTICS[(bitboard >> 16) & 0xFFFF]
+        + _ROW_HEURISTICS[(bitboard >> 32) & 0xFFFF]
+        + _ROW_HEURISTICS[bitboard >> 48]
+        + _ROW_HEURISTICS[transposed & 0xFFFF]
+        + _ROW_HEURISTICS[(transposed >> 16) & 0xFFFF]
+        + _ROW_HEURISTICS[(transposed >> 32) & 0xFFFF]
+        + _ROW_HEURISTICS[transposed >> 48]
+    )
+
+
+def _evaluate_board(board: types.ReadOnlyGameBoard) -> float:
+    """Evaluate every row and column of the `board`."""
+
+    return sum(
+        _LINE_HEURISTICS[line]
+        for line in itertools.chain(tile_utils.get_rows(board), tile_utils.get_columns(board))
+    )
+
+
+class _Rules(typing.NamedTuple):
+    """The game logic that the search is run with, on one representation of the board."""
+
+    preview_all: typing.Callable[[typing.Any], dict[types.SlideDirection, typing.Any]]
+    get_spawn_outcomes: typing.Callable[..., typing.Iterable[tuple[typing.Any, float]]]
+    evaluate: typing.Callable[[typing.Any], float]
+
+
+_BITBOARD_RULES = _Rules(
+    preview_all=bitboard_utils.preview_all,
+    get_spawn_outcomes=bitboard_utils.get_spawn_outcomes,
+    evaluate=_evaluate_bitboard,
+)
+
+_BOARD_RULES = _Rules(
+    preview_all=board_utils.preview_all,
+    get_spawn_outcomes=board_utils.get_spawn_outcomes,
+    evaluate=_evaluate_board,
+)
+
+
+class _SearchTimeout(Exception):
+    """Raised to abandon a search that has run out of its time budget."""
+
+
+class ExpectimaxPlayer(base.Player):
+    """A player that looks ahead with a depth-limited expectimax search.
+
+    The search alternates between move nodes, where the best slide is taken,
+    and chance nodes, where every spawn outcome is weighted by its probability.
+    Leaf boards are evaluated by a heuristic on the lines of the board,
+    which favours empty tiles, pending merges and monotonic rows and columns.
+    It deepens iteratively until `max_depth` is reached or `time_budget` runs out,
+    and the deepest fully searched depth decides the move.
+
+    Move nodes are cached in a `TranspositionTable`, which is kept across moves,
+    as the same positions are reached through different orders of moves and spawns.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        time_budget: float = DEFAULT_TIME_BUDGET,
+        new_tiles: typing.Sequence[types.NewTile] = constants.DEFAULT_NEW_TILES,
+        transposition_table: transposition.TranspositionTable | None = None,
+    ):
+        if max_depth < 1:
+            raise ValueError(f"max_depth must be positive, got {max_depth}")
+
+        self._max_depth = max_depth
+        self._time_budget = time_budget
+        self._new_tiles = new_tiles
+        self._transposition_table = (
+            transposition.TranspositionTable(DEFAULT_TRANSPOSITION_TABLE_SIZE)
+            if transposition_table is None
+            else transposition_table
+        )
+
+    @property
+    def transposition_table(self) -> transposition.TranspositionTable:
+        """The cache of the positions that have been searched."""
+
+        return self._transposition_table
+
+    def get_next_move(
+        self,
+        board: types.ReadOnlyGameBoard,
+        legal_moves: typing.AbstractSet[types.SlideDirection] | None = None,
+    ) -> types.PlayerDecision:
+        if bitboard_utils.can_encode(board):
+            rules, root = _BITBOARD_RULES, bitboard_utils.encode(board)
+        else:
+            rules, root = _BOARD_RULES, board
+
+        previews = {
+            direction: preview
+            for direction, preview in rules.preview_all(root).items()
+            if preview.moved and (legal_moves is None or direction in legal_moves)
+        }
+
+        if not previews:
+            direction = next(iter(legal_moves or types.SlideDirection))
+            return types.PlayerDecision(direction=direction, reason="No tile can be moved.")
+
+        self._transposition_table.new_generation()
+        deadline = time.perf_counter() + self._time_budget
+        scores: dict[types.SlideDirection, float] = {}
+        searched_depth = 0
+
+        for depth in range(1, self._max_depth + 1):
+            try:
+                # the shallowest search always completes, so that there is a move to make
+                scores = {
+                    direction: self._get_chance_value(
+                        rules, preview.afterstate, depth, 1.0, math.inf if depth == 1 else deadline
+                    )
+                    for direction, preview in previews.items()
+                }
+            except _SearchTimeout:
+                break
+
+            searched_depth = depth
+
+        direction = max(scores, key=scores.__getitem__)
+        expected_scores = ", ".join(
+            f"{direction.name} {score:.1f}"
+            for direction in types.SlideDirection
+            if (score := scores.get(direction)) is not None
+        )
+
+        return types.PlayerDecision(
+            direction=direction,
+            reason=f"Expected scores at depth {searched_depth}: {expected_scores}.",
+        )
+
+    def _get_move_value(
+        self, rules: _Rules, state: typing.Any, depth: int, probability: float, deadline: float
+    ) -> float:
+        """Get the best expected value of the moves on `state`, looking `depth` moves ahead.
+
+        A board out of moves is worth nothing, which is well below any heuristic evaluation.
+        """
+
+        if not depth or probability < MIN_PROBABILITY:
+            return rules.evaluate(state)
+
+        if (entry := self._transposition_table.lookup(state, depth)) is not None:
+            return entry.value
+
+        best_value, best_move = 0.0, None
+
+        for direction, preview in rules.preview_all(state).items():
+            if preview.moved:
+                value = self._get_chance_value(
+                    rules, preview.afterstate, depth, probability, deadline
+                )
+
+                if best_move is None or value > best_value:
+                    best_value, best_move = value, direction
+
+        self._transposition_table.store(state, best_value, depth, best_move)
+        return best_value
+
+    def _get_chance_value(
+        self,
+        rules: _Rules,
+        afterstate: typing.Any,
+        depth: int,
+        probability: float,
+        deadline: float,
+    ) -> float:
+        """Get the expected value of the spawn outcomes on `afterstate`."""
+
+        if time.perf_counter() > deadline:
+            raise _SearchTimeout
+
+        return sum(
+            outcome_probability
+            * self._get_move_value(
+                rules, state, depth - 1, probability * outcome_probability, deadline
+            )
+            for state, outcome_probability in rules.get_spawn_outcomes(afterstate, self._new_tiles)
+        )
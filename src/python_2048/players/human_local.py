@@ -2,6 +2,7 @@
 
 import pathlib
 import sys
+import typing
 
 import typer
 from rich import print
@@ -17,7 +18,11 @@ class LocalHumanPlayer(base.Player):
     def __init__(self, *, assistant: base.Player | None = None):
         self._assistant = assistant
 
-    def get_next_move(self, board: types.GameBoard) -> types.PlayerDecision:
+    def get_next_move(
+        self,
+        board: types.ReadOnlyGameBoard,
+        legal_moves: typing.AbstractSet[types.SlideDirection] | None = None,
+    ) -> types.PlayerDecision:
         while True:
             match option := self._prompt_for_option().lower():
                 case (
@@ -27,9 +32,13 @@ class LocalHumanPlayer(base.Player):
                     | types.SlideDirection.RIGHT
                 ):
                     direction = types.SlideDirection(option)
-                    return types.PlayerDecision(direction=direction, reason="")
+
+                    if legal_moves is None or direction in legal_moves:
+                        return types.PlayerDecision(direction=direction, reason="")
+
+                    print(f"Cannot slide {direction.name}, as no tile would move.")
                 case "h":
-                    self._ask_for_hint(board)
+                    self._ask_for_hint(board, legal_moves)
                 case "p":
                     self._save_game(board)
                 case "q":
@@ -39,14 +48,18 @@ class LocalHumanPlayer(base.Player):
 
             print()
 
-    def _ask_for_hint(self, board: types.GameBoard):
+    def _ask_for_hint(
+        self,
+        board: types.ReadOnlyGameBoard,
+        legal_moves: typing.AbstractSet[types.SlideDirection] | None = None,
+    ):
         """Ask the `assistant` for hints for the next move."""
 
         if not self._assistant:
             print("No AI Assistant is configured.")
             return
 
-        suggested_move = self._assistant.get_next_move(board)
+        suggested_move = self._assistant.get_next_move(board, legal_moves)
         print(f"The AI Assistant suggested: {suggested_move.direction.name}")
         print(f"Reason provided: {suggested_move.reason}")
 
@@ -64,7 +77,7 @@ class LocalHumanPlayer(base.Player):
         return option
 
     @staticmethod
-    def _save_game(board: types.GameBoard):
+    def _save_game(board: types.ReadOnlyGameBoard):
         """Prompt the user where to save the current game board."""
 
         file_path = input("Provide a file path to save the snapshot: ")
@@ -1,6 +1,7 @@
 """Module of `LlmPlayer`."""
 
 import json
+import typing
 
 import pydantic_ai
 import pydantic_ai.exceptions
@@ -55,9 +56,19 @@ class LlmPlayer(base.Player):
         except pydantic_ai.exceptions.UserError as cause:  # pragma: no cover
             raise exceptions.LlmException(model) from cause
 
-    def get_next_move(self, board: types.GameBoard) -> types.PlayerDecision:
+    def get_next_move(
+        self,
+        board: types.ReadOnlyGameBoard,
+        legal_moves: typing.AbstractSet[types.SlideDirection] | None = None,
+    ) -> types.PlayerDecision:
         user_prompt = json.dumps(board)
 
+        if legal_moves is not None:
+            valid_moves = ", ".join(
+                direction.value for direction in types.SlideDirection if direction in legal_moves
+            )
+            user_prompt = f"{user_prompt}\nValid moves: {valid_moves}"
+
         try:
             result = self._agent.run_sync(user_prompt)
         except pydantic_ai.exceptions.UnexpectedModelBehavior as cause:
@@ -0,0 +1,219 @@
+"""Module of `MctsPlayer`."""
+
+import concurrent.futures
+import math
+import os
+import random
+import time
+import typing
+
+from python_2048.game import types
+from python_2048.game.lib import bitboard_utils, board_utils
+from python_2048.players import base
+
+DEFAULT_NUM_ROLLOUTS = 100
+"""The default number of rollouts to play after each candidate move."""
+
+DEFAULT_ROLLOUTS_PER_TASK = 10
+"""The default number of rollouts that a worker plays in one go."""
+
+DEFAULT_MAX_ROLLOUT_MOVES = 1000
+"""The default number of moves after which a rollout is cut short."""
+
+_BITBOARD_MOVES = (
+    bitboard_utils.move_up,
+    bitboard_utils.move_left,
+    bitboard_utils.move_down,
+    bitboard_utils.move_right,
+)
+
+
+class _RolloutResult(typing.NamedTuple):
+    """The outcome of a batch of rollouts after the same first move."""
+
+    total_score: int
+    """The sum of the final scores of the rollouts."""
+
+    num_rollouts: int
+    """The number of rollouts that have been played."""
+
+
+class MctsPlayer(base.Player):
+    """A player that picks the move with the best mean score of random rollouts.
+
+    The rollouts are split into tasks of a few rollouts each, which are spread
+    across a process pool. The pool is created on the first move and reused
+    until `close` is called, so that workers are not re-spawned for every move.
+    """
+
+    def __init__(
+        self,
+        *,
+        num_rollouts: int = DEFAULT_NUM_ROLLOUTS,
+        time_budget: float | None = None,
+        num_workers: int | None = None,
+        rollouts_per_task: int = DEFAULT_ROLLOUTS_PER_TASK,
+        max_rollout_moves: int = DEFAULT_MAX_ROLLOUT_MOVES,
+        seed: int | None = None,
+    ):
+        """
+        Args:
+            num_rollouts: the number of rollouts to play after each candidate move.
+            time_budget: the number of seconds to play rollouts for each move, if limited;
+                every task plays at least one rollout, even after the deadline.
+            num_workers: the number of worker processes, or the number of CPUs if `None`.
+            rollouts_per_task: the number of rollouts that a worker plays in one go.
+            max_rollout_moves: the number of moves after which a rollout is cut short.
+            seed: the seed of the rollouts, so that the same seed picks the same moves.
+        """
+
+        if num_rollouts < 1 or rollouts_per_task < 1:
+            raise ValueError("num_rollouts and rollouts_per_task must be positive")
+
+        self._num_rollouts = num_rollouts
+        self._time_budget = time_budget
+        self._num_workers = num_workers or os.cpu_count() or 1
+        self._rollouts_per_task = rollouts_per_task
+        self._max_rollout_moves = max_rollout_moves
+        self._random = random.Random(seed)
+        self._executor: concurrent.futures.ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> typing.Self:
+        return self
+
+    def __exit__(self, *_):
+        self.close()
+
+    def close(self):
+        """Shut down the worker processes, if any."""
+
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
+
+    def get_next_move(
+        self,
+        board: types.ReadOnlyGameBoard,
+        legal_moves: typing.AbstractSet[types.SlideDirection] | None = None,
+    ) -> types.PlayerDecision:
+        if bitboard_utils.can_encode(board):
+            previews = bitboard_utils.preview_all(bitboard_utils.encode(board))
+        else:
+            previews = board_utils.preview_all(board)
+
+        afterstates = {
+            direction: preview.afterstate
+            for direction, preview in previews.items()
+            if preview.moved and (legal_moves is None or direction in legal_moves)
+        }
+
+        if not afterstates:
+            direction = next(iter(legal_moves or types.SlideDirection))
+            return types.PlayerDecision(direction=direction, reason="No tile can be moved.")
+
+        if self._executor is None:
+            self._executor = concurrent.futures.ProcessPoolExecutor(self._num_workers)
+
+        deadline = time.time() + self._time_budget if self._time_budget is not None else math.inf
+        num_tasks = math.ceil(self._num_rollouts / self._rollouts_per_task)
+
+        futures = {
+            direction: [
+                self._executor.submit(
+                    _run_rollouts,
+                    afterstate,
+                    self._rollouts_per_task,
+                    max_moves=self._max_rollout_moves,
+                    seed=self._random.getrandbits(64),
+                    deadline=deadline,
+                )
+                for _ in range(num_tasks)
+            ]
+            for direction, afterstate in afterstates.items()
+        }
+
+        mean_scores: dict[types.SlideDirection, float] = {}
+        num_rollouts = 0
+
+        for direction, direction_futures in futures.items():
+            results = [future.result() for future in direction_futures]
+            total = sum(result.num_rollouts for result in results)
+
+            mean_scores[direction] = sum(result.total_score for result in results) / total
+            num_rollouts += total
+
+        direction = max(mean_scores, key=mean_scores.__getitem__)
+        formatted_scores = ", ".join(
+            f"{direction.name} {score:.1f}"
+            for direction in types.SlideDirection
+            if (score := mean_scores.get(direction)) is not None
+        )
+
+        return types.PlayerDecision(
+            direction=direction,
+            reason=f"Mean scores over {num_rollouts} rollouts: {formatted_scores}.",
+        )
+
+
+def _run_rollouts(
+    afterstate: types.Bitboard | types.ReadOnlyGameBoard,
+    num_rollouts: int,
+    *,
+    max_moves: int = DEFAULT_MAX_ROLLOUT_MOVES,
+    seed: int | None = None,
+    deadline: float = math.inf,
+) -> _RolloutResult:
+    """Play random rollouts from an `afterstate`, until the games are over or cut short.
+
+    Args:
+        afterstate: the bitboard or board right after a move, before a new tile is spawned.
+        num_rollouts: the number of rollouts to play, unless the `deadline` has passed.
+        max_moves: the number of moves after which a rollout is cut short.
+        seed: the seed of the random number generator.
+        deadline: the `time.time()` after which no more rollouts are started.
+    """
+
+    rng = random.Random(seed)
+    total_score = 0
+
+    for num_played in range(num_rollouts):
+        if num_played and time.time() > deadline:
+            return _RolloutResult(total_score, num_played)
+
+        if isinstance(afterstate, int):
+            total_score += _play_out_bitboard(afterstate, max_moves, rng)
+        else:
+            total_score += _play_out_board(afterstate, max_moves, rng)
+
+    return _RolloutResult(total_score, num_rollouts)
+
+
+def _play_out_bitboard(bitboard: types.Bitboard, max_moves: int, rng: random.Random) -> int:
+    """Play random moves on a `bitboard`, and return the final score."""
+
+    for _ in range(max_moves):
+        bitboard = bitboard_utils.spawn_new_tile(bitboard, rng=rng)
+        moved = [moved for move in _BITBOARD_MOVES if (moved := move(bitboard)) != bitboard]
+
+        if not moved:
+            break
+
+        bitboard = rng.choice(moved)
+
+    return bitboard_utils.get_score(bitboard)
+
+
+def _play_out_board(afterstate: types.ReadOnlyGameBoard, max_moves: int, rng: random.Random) -> int:
+    """Play random moves on a copy of the `afterstate`, and return the final score."""
+
+    board = [list(row) for row in afterstate]
+
+    for _ in range(max_moves):
+        board_utils.spawn_new_tile(board, rng=rng)
+
+        if not (legal_moves := board_utils.get_legal_moves(board)):
+            break
+
+        board_utils.move_and_merge(board, rng.choice(sorted(legal_moves)))
+
+    return board_utils.get_score(board)
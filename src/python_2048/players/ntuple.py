@@ -0,0 +1,250 @@
+"""Module of `NTupleNetwork` and `NTuplePlayer`."""
+
+import array
+import json
+import mmap
+import pathlib
+import struct
+import typing
+
+from python_2048.game import types
+from python_2048.game.lib import bitboard_utils, board_utils, symmetry_utils
+from python_2048.players import base, exceptions
+
+DEFAULT_PATTERNS: tuple[tuple[int, ...], ...] = (
+    (0, 1, 2, 3, 4, 5),
+    (4, 5, 6, 7, 8, 9),
+    (0, 1, 2, 4, 5, 6),
+    (4, 5, 6, 8, 9, 10),
+)
+"""The default n-tuples, by the row-major index of each tile, which take 256 MB of weights."""
+
+_MAGIC = b"2048NTN1"
+_HEADER_LENGTH = struct.Struct("<I")
+_WEIGHT_TYPECODE = "f"
+_WEIGHT_SIZE = array.array(_WEIGHT_TYPECODE).itemsize
+
+
+class NTupleNetwork:
+    """A value function of afterstates, as a sum of weights looked up by tuples of tiles.
+
+    Each n-tuple is a pattern of tiles, whose exponents form an index into a flat table
+    of `16 ** n` weights. Every pattern is also sampled under the 8 symmetries of the board,
+    so symmetric boards share their weights and evaluate alike.
+
+    The weights of every pattern are concatenated into a single flat buffer of 32-bit floats,
+    which is either an `array.array` or a read-only memory mapping of a weights file.
+    """
+
+    def __init__(
+        self,
+        patterns: typing.Sequence[typing.Sequence[int]] = DEFAULT_PATTERNS,
+        weights: typing.MutableSequence[float] | None = None,
+    ):
+        """
+        Args:
+            patterns: the n-tuples, each of which is a sequence of row-major tile indices.
+            weights: the flat weights of every pattern in order, or all zeros if `None`.
+        """
+
+        self._patterns = tuple(tuple(pattern) for pattern in patterns)
+        self._features: list[tuple[int, tuple[int, ...]]] = []
+
+        num_weights = _count_weights(self._patterns)
+        offset = 0
+
+        for pattern in self._patterns:
+            for transform in symmetry_utils.Transform:
+                shifts = tuple(_get_symmetric_shift(tile, transform) for tile in pattern)
+                self._features.append((offset, shifts))
+
+            offset += 16 ** len(pattern)
+
+        if weights is None:
+            weights = array.array(_WEIGHT_TYPECODE, [0.0]) * num_weights
+        elif len(weights) != num_weights:
+            raise ValueError(f"Expected {num_weights} weights, got {len(weights)}")
+
+        self._weights = weights
+        self._mmap: mmap.mmap | None = None
+
+    @property
+    def patterns(self) -> tuple[tuple[int, ...], ...]:
+        """The n-tuples of the network."""
+
+        return self._patterns
+
+    @property
+    def weights(self) -> typing.MutableSequence[float]:
+        """The flat weights of every pattern."""
+
+        return self._weights
+
+    @property
+    def num_features(self) -> int:
+        """The number of weights that are summed up by an evaluation."""
+
+        return len(self._features)
+
+    @classmethod
+    def load(cls, file_path: pathlib.Path, *, writable: bool = False) -> "NTupleNetwork":
+        """Memory-map a weights file, so that processes share the pages of one copy.
+
+        Args:
+            file_path: the path to a file written by `save`.
+            writable: whether changes to the weights are written through to the file,
+                and become visible to every process that maps it.
+
+        Raises:
+            InvalidWeightsFile: if the file is not written by `save`, or it is truncated.
+        """
+
+        with file_path.open("r+b" if writable else "rb") as file:
+            access = mmap.ACCESS_WRITE if writable else mmap.ACCESS_READ
+            memory = mmap.mmap(file.fileno(), 0, access=access)
+
+        try:
+            patterns, start = _parse_header(memory)
+
+            if len(memory) - start != _count_weights(patterns) * _WEIGHT_SIZE:
+                raise ValueError("The number of weights does not match the patterns")
+        except (ValueError, TypeError, KeyError, struct.error) as cause:
+            memory.close()
+            raise exceptions.InvalidWeightsFile(file_path) from cause
+
+        weights = memoryview(memory)[start:].cast(_WEIGHT_TYPECODE)
+        network = cls(patterns, weights)  # type: ignore
+        network._mmap = memory
+
+        return network
+
+    def save(self, file_path: pathlib.Path):
+        """Write the patterns and the weights, in a format that `load` can memory-map."""
+
+        header = json.dumps({"patterns": self._patterns}).encode()
+        header += b" " * (-(len(_MAGIC) + _HEADER_LENGTH.size + len(header)) % _WEIGHT_SIZE)
+
+        with file_path.open("wb") as file:
+            file.write(_MAGIC)
+            file.write(_HEADER_LENGTH.pack(len(header)))
+            file.write(header)
+
+            if isinstance(self._weights, array.array):
+                self._weights.tofile(file)
+            else:
+                file.write(array.array(_WEIGHT_TYPECODE, self._weights).tobytes())
+
+    def flush(self):
+        """Write the changes to a writable memory mapping back to the weights file, if any."""
+
+        if self._mmap is not None:
+            self._mmap.flush()
+
+    def close(self):
+        """Release the memory mapping of the weights file, if any."""
+
+        if self._mmap is not None:
+            typing.cast(memoryview, self._weights).release()
+            self._mmap.close()
+            self._mmap = None
+
+    def evaluate(self, bitboard: types.Bitboard) -> float:
+        """Evaluate an afterstate, as the sum of the weights of every sampled n-tuple."""
+
+        weights = self._weights
+        return sum(weights[index] for index in self.get_indices(bitboard))
+
+    def get_indices(self, bitboard: types.Bitboard) -> list[int]:
+        """Get the index into `weights` of every sampled n-tuple of an afterstate."""
+
+        indices = []
+
+        for offset, shifts in self._features:
+            index = 0
+
+            for shift in shifts:
+                index = (index << 4) | ((bitboard >> shift) & 0xF)
+
+            indices.append(offset + index)
+
+        return indices
+
+
+class NTuplePlayer(base.Player):
+    """A player that maximizes the reward of a move plus the value of its afterstate.
+
+    A board that cannot be encoded into a bitboard is played by the reward alone.
+    """
+
+    def __init__(self, network: NTupleNetwork):
+        self._network = network
+
+    def get_next_move(
+        self,
+        board: types.ReadOnlyGameBoard,
+        legal_moves: typing.AbstractSet[types.SlideDirection] | None = None,
+    ) -> types.PlayerDecision:
+        if bitboard_utils.can_encode(board):
+            scores = {
+                direction: preview.reward + self._network.evaluate(preview.afterstate)
+                for direction, preview in bitboard_utils.preview_all(
+                    bitboard_utils.encode(board)
+                ).items()
+                if preview.moved and (legal_moves is None or direction in legal_moves)
+            }
+        else:
+            scores = {
+                direction: float(preview.reward)
+                for direction, preview in board_utils.preview_all(board).items()
+                if preview.moved and (legal_moves is None or direction in legal_moves)
+            }
+
+        if not scores:
+            direction = next(iter(legal_moves or types.SlideDirection))
+            return types.PlayerDecision(direction=direction, reason="No tile can be moved.")
+
+        direction = max(scores, key=scores.__getitem__)
+        formatted_scores = ", ".join(
+            f"{direction.name} {score:.1f}"
+            for direction in types.SlideDirection
+            if (score := scores.get(direction)) is not None
+        )
+
+        return types.PlayerDecision(
+            direction=direction,
+            reason=f"Reward plus afterstate value: {formatted_scores}.",
+        )
+
+
+def _count_weights(patterns: typing.Iterable[typing.Sequence[int]]) -> int:
+    """Count the weights of every pattern, after validating their tile indices."""
+
+    num_weights = 0
+
+    for pattern in patterns:
+        if not pattern or not all(0 <= tile < 16 for tile in pattern):
+            raise ValueError(f"Invalid n-tuple: {pattern}")
+
+        num_weights += 16 ** len(pattern)
+
+    return num_weights
+
+
+def _get_symmetric_shift(tile: int, transform: symmetry_utils.Transform) -> int:
+    """Get the bit offset where the row-major `tile` is moved to by the `transform`."""
+
+    moved = symmetry_utils.apply_to_bitboard(1 << (4 * tile), transform)
+    return moved.bit_length() - 1
+
+
+def _parse_header(memory: mmap.mmap) -> tuple[list[list[int]], int]:
+    """Parse the patterns of a weights file, and where its weights start."""
+
+    if memory[: len(_MAGIC)] != _MAGIC:
+        raise ValueError("Not a weights file")
+
+    (header_length,) = _HEADER_LENGTH.unpack_from(memory, len(_MAGIC))
+    start = len(_MAGIC) + _HEADER_LENGTH.size
+
+    patterns = json.loads(memory[start : start + header_length])["patterns"]
+    return patterns, start + header_length
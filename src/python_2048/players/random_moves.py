@@ -0,0 +1,37 @@
+"""Module of `RandomPlayer`."""
+
+import random
+import typing
+
+from python_2048.game import types
+from python_2048.game.lib import board_utils
+from python_2048.players import base
+
+
+class RandomPlayer(base.Player):
+    """A player that picks one of the effective moves uniformly at random, as a baseline."""
+
+    def __init__(self, *, seed: int | None = None):
+        """
+        Args:
+            seed: the seed of the moves, so that the same seed picks the same moves.
+        """
+
+        self._random = random.Random(seed)
+
+    def get_next_move(
+        self,
+        board: types.ReadOnlyGameBoard,
+        legal_moves: typing.AbstractSet[types.SlideDirection] | None = None,
+    ) -> types.PlayerDecision:
+        if legal_moves is None:
+            legal_moves = board_utils.get_legal_moves(board)
+
+        if not legal_moves:
+            return types.PlayerDecision(
+                direction=types.SlideDirection.UP, reason="No tile can be moved."
+            )
+
+        # sorted, so that the same seed picks the same moves regardless of the set order
+        direction = self._random.choice(sorted(legal_moves))
+        return types.PlayerDecision(direction=direction, reason="A random effective move.")
@@ -0,0 +1,110 @@
+"""Module that trains an `NTupleNetwork` by temporal-difference learning of afterstates."""
+
+import random
+import typing
+
+from python_2048.game.lib import bitboard_utils, board_utils
+from python_2048.players import ntuple
+
+DEFAULT_LEARNING_RATE = 0.1
+"""The default step size of an update, which is shared among the features of an evaluation."""
+
+
+class TrainingResult(typing.NamedTuple):
+    """The outcome of a batch of self-play games."""
+
+    updates: dict[int, float]
+    """The sparse changes to the weights, by their indices."""
+
+    num_games: int
+    """The number of games that have been played."""
+
+    num_moves: int
+    """The number of moves that have been made."""
+
+    total_score: int
+    """The sum of the final scores of the games."""
+
+    max_tile: int
+    """The largest tile of all games."""
+
+
+def play_training_games(
+    network: ntuple.NTupleNetwork,
+    num_games: int,
+    *,
+    learning_rate: float = DEFAULT_LEARNING_RATE,
+    rng: random.Random | None = None,
+) -> TrainingResult:
+    """Play games greedily against the `network`, and learn from every move by TD(0).
+
+    Each move picks the afterstate of the best reward plus value, and the value of
+    the previous afterstate is moved towards that target. The games are played on
+    bitboards, spawning tiles like `GameState` does, until they are out of moves.
+
+    The `network` itself is left unchanged, so that its weights can be shared read-only.
+    The changes are accumulated into sparse updates instead, and seen by later moves.
+
+    Args:
+        network: the value function of afterstates to learn.
+        num_games: the number of games to play.
+        learning_rate: the step size of an update, shared among the features of an evaluation.
+        rng: the random number generator of the spawns, or the global one if `None`.
+    """
+
+    weights = network.weights
+    updates: dict[int, float] = {}
+    step = learning_rate / network.num_features
+
+    num_moves = total_score = max_tile = 0
+
+    def evaluate(indices: list[int]) -> float:
+        return sum(weights[index] + updates.get(index, 0.0) for index in indices)
+
+    def learn(indices: list[int], target: float):
+        delta = step * (target - evaluate(indices))
+
+        for index in indices:
+            updates[index] = updates.get(index, 0.0) + delta
+
+    for _ in range(num_games):
+        bitboard = bitboard_utils.encode(board_utils.create_new_board(rng=rng))
+        previous: list[int] = []  # learning on no features is a no-op
+
+        while True:
+            best: tuple[float, bitboard_utils.BitboardPreview, list[int]] | None = None
+
+            for preview in bitboard_utils.preview_all(bitboard).values():
+                if preview.moved:
+                    indices = network.get_indices(preview.afterstate)
+                    value = preview.reward + evaluate(indices)
+
+                    if best is None or value > best[0]:
+                        best = value, preview, indices
+
+            if best is None:
+                # the value of an afterstate that leads to a loss is nothing
+                learn(previous, 0.0)
+                break
+
+            value, preview, indices = best
+            learn(previous, value)
+
+            previous = indices
+            bitboard = bitboard_utils.spawn_new_tile(preview.afterstate, rng=rng)
+            num_moves += 1
+
+        summary = board_utils.summarize(bitboard_utils.decode_frozen(bitboard))
+        total_score += summary.score
+        max_tile = max(max_tile, summary.max_tile)
+
+    return TrainingResult(updates, num_games, num_moves, total_score, max_tile)
+
+
+def apply_updates(network: ntuple.NTupleNetwork, updates: dict[int, float]):
+    """Add sparse `updates` to the weights of a writable `network`."""
+
+    weights = network.weights
+
+    for index, delta in updates.items():
+        weights[index] += delta
@@ -0,0 +1,139 @@
+"""Module of `TranspositionTable`."""
+
+import typing
+
+from python_2048.game import types
+
+DEFAULT_MAX_ENTRIES = 1 << 20
+"""The default number of entries that a `TranspositionTable` can hold."""
+
+_FIBONACCI_MULTIPLIER = 0x9E37_79B9_7F4A_7C15
+_UINT64_MASK = 0xFFFF_FFFF_FFFF_FFFF
+
+
+class TranspositionEntry(typing.NamedTuple):
+    """A position evaluated by a search."""
+
+    key: typing.Hashable
+    """The compact encoding of the position, e.g. a `Bitboard`."""
+
+    value: float
+    """The value of the position found by the search."""
+
+    depth: int
+    """The number of moves that the search has looked ahead from the position."""
+
+    best_move: types.SlideDirection | None
+    """The best move from the position, or `None` if there is none."""
+
+    generation: int
+    """The generation of the table when the entry was stored."""
+
+
+class TranspositionStats(typing.NamedTuple):
+    """The counters of a `TranspositionTable`."""
+
+    hits: int
+    """The number of lookups that have found a deep enough entry."""
+
+    misses: int
+    """The number of lookups that have not."""
+
+    evictions: int
+    """The number of entries that have been replaced by another position."""
+
+    size: int
+    """The number of entries that the table currently holds."""
+
+
+class TranspositionTable:
+    """A cache of evaluated positions with a fixed number of slots.
+
+    Each position hashes to a single slot, so memory never grows beyond `max_entries`.
+    When two positions collide, the one searched deeper is kept, unless the stored one
+    is left over from an older generation, i.e. from the search of a previous move.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        if max_entries < 1:
+            raise ValueError(f"max_entries must be positive, got {max_entries}")
+
+        self._slots: list[TranspositionEntry | None] = [None] * max_entries
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def max_entries(self) -> int:
+        """The number of entries that the table can hold."""
+
+        return len(self._slots)
+
+    @property
+    def stats(self) -> TranspositionStats:
+        """The hit/miss/eviction counters of the table."""
+
+        return TranspositionStats(self._hits, self._misses, self._evictions, self._size)
+
+    def lookup(self, key: typing.Hashable, depth: int) -> TranspositionEntry | None:
+        """Find the entry of position `key` that has been searched at least `depth` moves ahead."""
+
+        entry = self._slots[self._get_index(key)]
+
+        if entry is not None and entry.depth >= depth and entry.key == key:
+            self._hits += 1
+            return entry
+
+        self._misses += 1
+        return None
+
+    def store(
+        self,
+        key: typing.Hashable,
+        value: float,
+        depth: int,
+        best_move: types.SlideDirection | None = None,
+    ) -> bool:
+        """Store the evaluation of position `key`, subject to the replacement policy.
+
+        Returns:
+            `True` if the entry is stored, `False` if a deeper entry of this generation is kept.
+        """
+
+        index = self._get_index(key)
+        entry = self._slots[index]
+
+        if entry is None:
+            self._size += 1
+        elif entry.generation == self._generation and entry.depth > depth:
+            return False
+        elif entry.key != key:
+            self._evictions += 1
+
+        self._slots[index] = TranspositionEntry(key, value, depth, best_move, self._generation)
+        return True
+
+    def new_generation(self):
+        """Age every stored entry, so that they give way to the entries of a new search."""
+
+        self._generation += 1
+
+    def clear(self):
+        """Remove every entry and reset the counters."""
+
+        self._slots = [None] * len(self._slots)
+        self._generation = self._hits = self._misses = self._evictions = self._size = 0
+
+    def _get_index(self, key: typing.Hashable) -> int:
+        """Map the `key` to a slot, mixing all bits of its hash first.
+
+        This spreads bitboards that only differ in their high nibbles over the whole table.
+        """
+
+        mixed = (hash(key) * _FIBONACCI_MULTIPLIER) & _UINT64_MASK
+        return (mixed * len(self._slots)) >> 64
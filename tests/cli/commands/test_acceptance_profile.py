@@ -0,0 +1,102 @@
+"""Acceptance tests for the `profile` command."""
+
+import pathlib
+import pstats
+
+import pytest
+import typer.testing
+
+from python_2048.cli import app
+from python_2048.players import ntuple
+
+
+@pytest.fixture
+def runner():
+    return typer.testing.CliRunner()
+
+
+def test_command__random_player(runner: typer.testing.CliRunner, tmp_path: pathlib.Path):
+    # given:
+    pstats_path = tmp_path / "games.pstats"
+    collapsed_path = tmp_path / "games.collapsed"
+
+    # when:
+    result = runner.invoke(
+        app.app,
+        [
+            "profile",
+            "-n",
+            "3",
+            "--seed",
+            "1",
+            "--pstats",
+            str(pstats_path),
+            "--collapsed",
+            str(collapsed_path),
+        ],
+    )
+
+    # then:
+    assert result.exit_code == 0
+    assert "Games: 3 | Moves: " in result.output
+    assert "Ordered by: internal time" in result.output
+    assert f"Wrote the collapsed stacks: {collapsed_path}" in result.output
+
+    # then: the statistics can be loaded, and every stack starts from the games
+    assert pstats.Stats(str(pstats_path)).total_calls > 0  # type: ignore[attr-defined]
+
+    stacks = [line.rsplit(" ", 1) for line in collapsed_path.read_text().splitlines()]
+    assert all(count.isdigit() for _, count in stacks)
+    assert any("_slide_bitboard" in stack for stack, _ in stacks)
+
+
+def test_command__ntuple_player(runner: typer.testing.CliRunner, tmp_path: pathlib.Path):
+    # given:
+    weights_path = tmp_path / "weights.bin"
+    ntuple.NTupleNetwork(((0, 1),)).save(weights_path)
+
+    # when:
+    result = runner.invoke(
+        app.app,
+        [
+            "profile",
+            "-n",
+            "1",
+            "-p",
+            "ntuple",
+            "--weights",
+            str(weights_path),
+            "--pstats",
+            str(tmp_path / "profile.pstats"),
+            "--collapsed",
+            str(tmp_path / "profile.collapsed"),
+        ],
+    )
+
+    # then:
+    assert result.exit_code == 0
+    assert "Games: 1 | " in result.output
+
+
+def test_command__ntuple_player_without_weights(runner: typer.testing.CliRunner):
+    # when:
+    result = runner.invoke(app.app, ["profile", "-p", "ntuple"])
+
+    # then:
+    assert "The n-tuple player requires --weights." in result.output
+    assert result.exit_code == 1
+
+
+def test_command__ntuple_player_with_invalid_weights(
+    runner: typer.testing.CliRunner, tmp_path: pathlib.Path
+):
+    # given:
+    weights_path = tmp_path / "weights.bin"
+    weights_path.write_bytes(b"not-weights")
+
+    # when:
+    result = runner.invoke(app.app, ["profile", "-p", "ntuple", "--weights", str(weights_path)])
+
+    # then:
+    assert "weights" in result.output.lower()
+    assert result.exit_code == 1
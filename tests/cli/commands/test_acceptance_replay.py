@@ -0,0 +1,192 @@
+"""Acceptance tests for the `replay` command."""
+
+import json
+import pathlib
+
+import pytest
+import typer.testing
+
+from python_2048.cli import app
+
+
+@pytest.fixture
+def runner():
+    return typer.testing.CliRunner()
+
+
+def test_command__replay_recorded_run(runner: typer.testing.CliRunner, tmp_path: pathlib.Path):
+    # given:
+    board = [
+        [1024, 512, 256, None],
+        [None, None, 256, None],
+        [None, None, None, None],
+        [None, None, None, None],
+    ]
+
+    snapshot_path = tmp_path / "snapshot.json"
+    snapshot_path.write_text(json.dumps(board))
+    replay_path = tmp_path / "game.replay"
+
+    run_result = runner.invoke(
+        app.app,
+        [
+            "run",
+            str(snapshot_path),
+            "--seed",
+            "1",
+            "--silent",
+            "--impersonate",
+            "--assistant",
+            "expectimax",
+            "--time-budget",
+            "0.001",
+            "--record",
+            str(replay_path),
+        ],
+    )
+    assert run_result.exit_code == 0
+
+    # when:
+    result = runner.invoke(app.app, ["replay", str(replay_path), "--verify"])
+
+    # then:
+    assert "Score: " in result.output
+    assert "Max tile: 2048" in result.output
+    assert "Verified every spawn against the seed." in result.output
+    assert result.exit_code == 0
+
+
+def test_command__replay_recorded_simulations(
+    runner: typer.testing.CliRunner, tmp_path: pathlib.Path
+):
+    # given:
+    record_dir = tmp_path / "replays"
+
+    simulate_result = runner.invoke(
+        app.app,
+        ["simulate", "-n", "3", "-w", "1", "--seed", "1", "--record-dir", str(record_dir)],
+    )
+    assert simulate_result.exit_code == 0
+
+    # when:
+    results = [
+        runner.invoke(app.app, ["replay", str(record_dir / f"{index}.replay")])
+        for index in range(3)
+    ]
+
+    # then:
+    assert all(result.exit_code == 0 for result in results)
+    assert all("Moves: " in result.output for result in results)
+    assert "Verified" not in results[0].output
+
+
+def test_command__invalid_replay(runner: typer.testing.CliRunner, tmp_path: pathlib.Path):
+    # given:
+    replay_path = tmp_path / "game.replay"
+    replay_path.write_bytes(b"not-a-replay")
+
+    # when:
+    result = runner.invoke(app.app, ["replay", str(replay_path)])
+
+    # then:
+    assert "Invalid replay: not a replay file" in result.output
+    assert result.exit_code == 1
+
+
+@pytest.fixture
+def replay_path(runner: typer.testing.CliRunner, tmp_path: pathlib.Path) -> pathlib.Path:
+    record_dir = tmp_path / "replays"
+
+    result = runner.invoke(
+        app.app,
+        ["simulate", "-n", "1", "-w", "1", "--seed", "1", "--record-dir", str(record_dir)],
+    )
+    assert result.exit_code == 0
+
+    return record_dir / "0.replay"
+
+
+def test_command__view_replay(runner: typer.testing.CliRunner, replay_path: pathlib.Path):
+    # when: stepping back at the start, forwards twice, back once, then jumping past the end
+    result = runner.invoke(
+        app.app,
+        ["replay", str(replay_path), "--view", "--keyframe-interval", "4", "--verify"],
+        input="bnnbj3\nxjlast\nj100000\nnq",
+    )
+
+    # then:
+    assert "This is the first move." in result.output
+    assert "Move: 1/" in result.output
+    assert "Move: 2/" in result.output
+    assert "Move: 3/" in result.output
+    assert "Not a move: last" in result.output
+    assert "Unrecognized option: x" in result.output
+    assert "This is the last move." in result.output
+    assert replay_path.with_name("0.replay.keyframes").exists()
+    assert result.exit_code == 0
+
+
+@pytest.mark.parametrize(
+    "keyframes",
+    [
+        pytest.param(None, id="missing"),
+        pytest.param("stale", id="stale"),
+        pytest.param("other-interval", id="other-interval"),
+        pytest.param("directory", id="unwritable"),
+    ],
+)
+def test_command__view_replay__builds_keyframes(
+    runner: typer.testing.CliRunner, replay_path: pathlib.Path, keyframes: str | None
+):
+    # given:
+    keyframes_path = replay_path.with_name("0.replay.keyframes")
+
+    match keyframes:
+        case "stale":
+            keyframes_path.write_text('{"replay":"other","interval":4,"boards":[]}')
+        case "other-interval":
+            runner.invoke(app.app, ["replay", str(replay_path), "--view"], input="q")
+        case "directory":
+            keyframes_path.mkdir()
+
+    # when:
+    result = runner.invoke(
+        app.app,
+        ["replay", str(replay_path), "--view", "--keyframe-interval", "4"],
+        input="j9\nq",
+    )
+
+    # then:
+    assert "Move: 9/" in result.output
+    assert result.exit_code == 0
+    assert keyframes_path.is_dir() or json.loads(keyframes_path.read_text())["interval"] == 4
+
+
+def test_command__view_replay__reuses_keyframes(
+    runner: typer.testing.CliRunner, replay_path: pathlib.Path
+):
+    # given:
+    runner.invoke(app.app, ["replay", str(replay_path), "--view"], input="q")
+    keyframes_path = replay_path.with_name("0.replay.keyframes")
+    modified_at = keyframes_path.stat().st_mtime_ns
+
+    # when:
+    result = runner.invoke(app.app, ["replay", str(replay_path), "--view"], input="j9\nq")
+
+    # then:
+    assert "Move: 9/" in result.output
+    assert keyframes_path.stat().st_mtime_ns == modified_at
+    assert result.exit_code == 0
+
+
+def test_command__view_invalid_replay(runner: typer.testing.CliRunner, tmp_path: pathlib.Path):
+    # given:
+    replay_path = tmp_path / "game.replay"
+    replay_path.write_bytes(b'2048RPL1\x0b{"board":[]}')
+
+    # when:
+    result = runner.invoke(app.app, ["replay", str(replay_path), "--view"])
+
+    # then:
+    assert "Invalid replay" in result.output
+    assert result.exit_code == 1
@@ -0,0 +1,99 @@
+"""
+Acceptance tests for the `run` command with the expectimax assistant.
+
+Since there is no frontend/backend separation in this codebase,
+acceptance tests look a lot like robot tests.
+"""
+
+import inspect
+import json
+import pathlib
+
+import pytest
+import typer.testing
+
+from python_2048.cli import app
+
+
+@pytest.fixture
+def runner():
+    return typer.testing.CliRunner()
+
+
+def test_command__play_by_expectimax(runner: typer.testing.CliRunner):
+    # given:
+    function_name = inspect.currentframe().f_code.co_name  # type: ignore
+
+    board = [
+        [1024, 1024, None, None],
+        [None, None, None, None],
+        [None, None, None, None],
+        [None, None, None, None],
+    ]
+
+    file_path = pathlib.Path(f"/tmp/{function_name}.json")
+    file_path.unlink(missing_ok=True)
+    file_path.write_text(json.dumps(board))
+
+    # when:
+    result = runner.invoke(
+        app.app,
+        ["run", str(file_path), "--seed", "1", "--impersonate", "--assistant", "expectimax"],
+    )
+
+    # then:
+    assert "Reason provided: Expected scores at depth" in result.output
+    assert "Congratulations, you win" in result.output
+    assert result.exit_code == 0
+
+
+def test_command__ai_suggestions_by_expectimax(runner: typer.testing.CliRunner):
+    # when:
+    result = runner.invoke(
+        app.app,
+        ["run", "--seed", "1", "--assistant", "expectimax", "--time-budget", "0.01"],
+        input="hqy",
+    )
+
+    # then:
+    assert "The AI Assistant suggested:" in result.output
+    assert "Reason provided: Expected scores at depth" in result.output
+    assert result.exit_code == 0
+
+
+def test_command__profile_phases(runner: typer.testing.CliRunner):
+    # given:
+    function_name = inspect.currentframe().f_code.co_name  # type: ignore
+
+    board = [
+        [1024, 1024, None, None],
+        [None, None, None, None],
+        [None, None, None, None],
+        [None, None, None, None],
+    ]
+
+    file_path = pathlib.Path(f"/tmp/{function_name}.json")
+    file_path.unlink(missing_ok=True)
+    file_path.write_text(json.dumps(board))
+
+    # when:
+    result = runner.invoke(
+        app.app,
+        [
+            "run",
+            str(file_path),
+            "--seed",
+            "1",
+            "--silent",
+            "--impersonate",
+            "--assistant",
+            "expectimax",
+            "--profile-phases",
+        ],
+    )
+
+    # then:
+    assert "Phase timings" in result.output
+    assert "player.get_next_move" in result.output
+    assert "state.slide" in result.output
+    assert result.exit_code == 0
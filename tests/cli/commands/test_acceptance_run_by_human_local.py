@@ -31,11 +31,13 @@ def test_command__new_game(runner: typer.testing.CliRunner):
     result = runner.invoke(
         app.app,
         ["run", "--seed", "1"],
-        input="adadadadadadadadadadadsssadadadasasdassdsdassasssdasssdaassdadadadada",
+        input="adadadadadadadadadadadsssadadadasasdassdsdassasssdasssdaassdadadadada"
+        + "adsadw" * 14
+        + "adsad",
     )
 
     # then:
-    assert "Score: 158" in result.output
+    assert "Score: 320" in result.output
     assert "Game over" in result.output
     assert result.exit_code == 0
 
@@ -0,0 +1,78 @@
+"""Acceptance tests for the `simulate` command."""
+
+import pathlib
+import re
+
+import pytest
+import typer.testing
+
+from python_2048.cli import app
+from python_2048.players import ntuple
+
+
+@pytest.fixture
+def runner():
+    return typer.testing.CliRunner()
+
+
+def test_command__random_player(runner: typer.testing.CliRunner):
+    # given:
+    args = ["simulate", "-n", "5", "-w", "2", "--games-per-task", "2", "--seed", "1"]
+
+    # when:
+    result = runner.invoke(app.app, args)
+
+    # then:
+    assert result.exit_code == 0
+    assert "Games: 5 | Win rate: 0.0% | Moves: " in result.output
+    assert "Score percentiles: p10 " in result.output
+    assert "Max tiles: " in result.output
+
+    # when: the same seed is sharded differently
+    other_result = runner.invoke(app.app, ["simulate", "-n", "5", "-w", "1", "--seed", "1"])
+
+    # then:
+    assert _strip_speed(other_result.output) == _strip_speed(result.output)
+
+
+def test_command__ntuple_player(runner: typer.testing.CliRunner, tmp_path: pathlib.Path):
+    # given:
+    weights_path = tmp_path / "weights.bin"
+    ntuple.NTupleNetwork(((0, 1),)).save(weights_path)
+
+    # when:
+    result = runner.invoke(
+        app.app, ["simulate", "-n", "1", "-w", "1", "-p", "ntuple", "--weights", str(weights_path)]
+    )
+
+    # then:
+    assert result.exit_code == 0
+    assert "Games: 1 | " in result.output
+
+
+def test_command__ntuple_player_without_weights(runner: typer.testing.CliRunner):
+    # when:
+    result = runner.invoke(app.app, ["simulate", "-p", "ntuple"])
+
+    # then:
+    assert "The n-tuple player requires --weights." in result.output
+    assert result.exit_code == 1
+
+
+def test_command__ntuple_player_with_invalid_weights(
+    runner: typer.testing.CliRunner, tmp_path: pathlib.Path
+):
+    # given:
+    weights_path = tmp_path / "weights.bin"
+    weights_path.write_bytes(b"not-weights")
+
+    # when:
+    result = runner.invoke(app.app, ["simulate", "-p", "ntuple", "--weights", str(weights_path)])
+
+    # then:
+    assert "Failed to load the n-tuple network weights" in result.output
+    assert result.exit_code == 1
+
+
+def _strip_speed(output: str) -> str:
+    return re.sub(r"Moves/sec: [\d.]+", "", output)
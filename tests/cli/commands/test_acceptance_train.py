@@ -0,0 +1,86 @@
+"""Acceptance tests for the `train` command."""
+
+import json
+import pathlib
+
+import pytest
+import typer.testing
+
+from python_2048.cli import app
+from python_2048.players import ntuple
+
+TUPLE_OPTIONS = ["-t", "0,1", "-t", "0,4,5"]
+
+
+@pytest.fixture
+def runner():
+    return typer.testing.CliRunner()
+
+
+def test_command__train_then_resume(runner: typer.testing.CliRunner, tmp_path: pathlib.Path):
+    # given:
+    weights_path = tmp_path / "weights.bin"
+    options = ["--games-per-task", "2", "--checkpoint-interval", "3", "--seed", "1"]
+
+    # when:
+    result = runner.invoke(
+        app.app, ["train", str(weights_path), "-n", "4", *TUPLE_OPTIONS, *options]
+    )
+
+    # then:
+    assert "Games: 2 | Games/sec: " in result.output
+    assert "Games: 4 | Games/sec: " in result.output
+    assert "Checkpointed after 2 games." not in result.output
+    assert "Checkpointed after 4 games." in result.output
+    assert json.loads((tmp_path / "weights.bin.json").read_text()) == {"num_games": 4}
+    assert result.exit_code == 0
+
+    network = ntuple.NTupleNetwork.load(weights_path)
+    assert network.patterns == ((0, 1), (0, 4, 5))
+    assert any(network.weights)
+    network.close()
+
+    # when:
+    result = runner.invoke(app.app, ["train", str(weights_path), "-n", "6", "--resume", *options])
+
+    # then:
+    assert "Games: 2 |" not in result.output
+    assert "Games: 6 | Games/sec: " in result.output
+    assert "Checkpointed after 6 games." in result.output
+    assert result.exit_code == 0
+
+
+def test_command__invalid_tuples(runner: typer.testing.CliRunner, tmp_path: pathlib.Path):
+    # when:
+    result = runner.invoke(app.app, ["train", str(tmp_path / "weights.bin"), "-t", "0,16"])
+
+    # then:
+    assert "Invalid n-tuples" in result.output
+    assert result.exit_code == 1
+
+
+def test_command__resume_without_checkpoint(
+    runner: typer.testing.CliRunner, tmp_path: pathlib.Path
+):
+    # when:
+    result = runner.invoke(app.app, ["train", str(tmp_path / "weights.bin"), "--resume"])
+
+    # then:
+    assert "There is no checkpoint to resume from" in result.output
+    assert result.exit_code == 1
+
+
+def test_command__resume_from_invalid_weights(
+    runner: typer.testing.CliRunner, tmp_path: pathlib.Path
+):
+    # given:
+    weights_path = tmp_path / "weights.bin"
+    weights_path.write_bytes(b"not-weights")
+    (tmp_path / "weights.bin.json").write_text(json.dumps({"num_games": 0}))
+
+    # when:
+    result = runner.invoke(app.app, ["train", str(weights_path), "--resume"])
+
+    # then:
+    assert "Failed to load the n-tuple network weights" in result.output
+    assert result.exit_code == 1
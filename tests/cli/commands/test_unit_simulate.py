@@ -0,0 +1,47 @@
+"""Unit tests for the worker functions of the `simulate` command."""
+
+import pathlib
+from unittest import mock
+
+import pytest
+
+from python_2048.cli.commands import simulate
+from python_2048.players import expectimax, ntuple, random_moves
+
+
+@pytest.mark.parametrize(
+    ["kind", "expected_type"],
+    [
+        pytest.param(simulate.PlayerKind.RANDOM, random_moves.RandomPlayer, id="random"),
+        pytest.param(simulate.PlayerKind.EXPECTIMAX, expectimax.ExpectimaxPlayer, id="expectimax"),
+        pytest.param(simulate.PlayerKind.NTUPLE, ntuple.NTuplePlayer, id="ntuple"),
+    ],
+)
+@mock.patch.object(simulate, "_worker_options", None)
+@mock.patch.object(simulate, "_worker_network", None)
+def test_create_player__in_worker(
+    kind: simulate.PlayerKind, expected_type: type, tmp_path: pathlib.Path
+):
+    # given:
+    weights_path = tmp_path / "weights.bin"
+    ntuple.NTupleNetwork(((0, 1),)).save(weights_path)
+    simulate._init_worker(simulate._PlayerOptions(kind, 0.01, weights_path, None))
+
+    # when:
+    player = simulate._create_player(seed=1)
+
+    # then:
+    assert isinstance(player, expected_type)
+
+
+@mock.patch.object(simulate, "_worker_options", None)
+def test_play_games__in_worker():
+    # given:
+    simulate._init_worker(simulate._PlayerOptions(simulate.PlayerKind.RANDOM, 0.01, None, None))
+
+    # when:
+    results = simulate._play_games(1, range(3))
+
+    # then: every game is the same, regardless of the others in its task
+    assert len(results) == 3
+    assert results[1:] == simulate._play_games(1, range(1, 3))
@@ -0,0 +1,23 @@
+"""Unit tests for the worker functions of the `train` command."""
+
+import pathlib
+from unittest import mock
+
+from python_2048.cli.commands import train
+from python_2048.players import ntuple
+
+
+@mock.patch.object(train, "_worker_network", None)
+def test_play_training_games__in_worker(tmp_path: pathlib.Path):
+    # given:
+    weights_path = tmp_path / "weights.bin"
+    ntuple.NTupleNetwork(((0, 1),)).save(weights_path)
+    train._init_worker(weights_path)
+
+    # when:
+    result = train._play_training_games(2, 0.1, seed=1)
+
+    # then:
+    assert result.num_games == 2
+    assert result.updates
+    assert result == train._play_training_games(2, 0.1, seed=1)
@@ -0,0 +1,77 @@
+"""Unit tests for `profiling`."""
+
+import pathlib
+import pstats
+import sys
+
+import pytest
+
+from python_2048.cli.lib import profiling
+
+MAIN = ("/project/app.py", 1, "main")
+A = ("/project/app.py", 10, "a")
+B = ("/vendor/lib.py", 20, "b")
+Z = ("/project/app.py", 30, "z")
+LEN = ("~", 0, "<built-in method builtins.len>")
+
+
+class StaticProfile:
+    """A profile of fixed raw statistics, as `pstats.Stats` loads from a `cProfile.Profile`."""
+
+    def __init__(self, stats: dict):
+        self.stats = stats
+
+    def create_stats(self):
+        pass
+
+
+@pytest.fixture
+def stats(monkeypatch: pytest.MonkeyPatch) -> pstats.Stats:
+    monkeypatch.setattr(sys, "path", ["", "/elsewhere", "/project"])
+    profiling._format_function.cache_clear()
+
+    # main calls a and b, and a calls b, which calls len; a recurses, and z takes no time;
+    # b lies outside of `sys.path`
+    return pstats.Stats(
+        StaticProfile(  # type: ignore[arg-type]
+            {
+                MAIN: (1, 1, 3.0, 10.0, {}),
+                A: (2, 1, 1.0, 4.0, {MAIN: (1, 1, 1.0, 4.0), A: (1, 1, 0.0, 0.0)}),
+                B: (2, 2, 5.0, 6.0, {MAIN: (1, 1, 2.5, 3.0), A: (1, 1, 2.5, 3.0)}),
+                LEN: (2, 2, 1.0, 1.0, {B: (2, 2, 1.0, 1.0)}),
+                Z: (1, 1, 0.0, 0.0, {MAIN: (1, 1, 0.0, 0.0)}),
+            }
+        )
+    )
+
+
+def test_collapse_stats__splits_time_by_edges(stats: pstats.Stats):
+    # when:
+    stacks = profiling.collapse_stats(stats)
+
+    # then:
+    main, a, b = "app.py:1:main", "app.py:10:a", "/vendor/lib.py:20:b"
+    builtin = "<built-in method builtins.len>"
+
+    assert stacks == {
+        main: 3_000_000,
+        f"{main};{a}": 1_000_000,
+        f"{main};{a};{b}": 2_500_000,
+        f"{main};{a};{b};{builtin}": 500_000,
+        f"{main};{b}": 2_500_000,
+        f"{main};{b};{builtin}": 500_000,
+    }
+    assert sum(stacks.values()) == 10_000_000
+
+
+def test_write_collapsed_stacks(stats: pstats.Stats, tmp_path: pathlib.Path):
+    # given:
+    path = tmp_path / "profile.collapsed"
+
+    # when:
+    profiling.write_collapsed_stacks(path, stats)
+
+    # then:
+    lines = path.read_text().splitlines()
+    assert lines[0] == "app.py:1:main 3000000"
+    assert len(lines) == 6
@@ -0,0 +1,83 @@
+"""Integration tests for the startup of the CLI application.
+
+The imports are measured by `python -X importtime` in a fresh interpreter,
+as the modules of this process have been imported by other tests already.
+"""
+
+import subprocess
+import sys
+
+import pytest
+import typer.testing
+
+from python_2048.cli import app
+
+HEAVY_MODULES = ("pydantic_ai", "openai", "rich.console", "tabulate")
+"""The modules that are only imported once a model is requested, or something is rendered."""
+
+IMPORT_TIME_BUDGET = 0.3
+"""The most seconds that importing the CLI application may take."""
+
+COMMAND_IMPORT_TIME_BUDGET = 0.5
+"""The most seconds that importing the module of any command may take."""
+
+
+def import_times(module: str) -> dict[str, float]:
+    """Import a `module` in a fresh interpreter, and get the cumulative seconds of every import."""
+
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+
+    # e.g. "import time:       884 |      97955 | python_2048.cli.app", in microseconds
+    return {
+        name.strip(): int(cumulative) / 1e6
+        for _, cumulative, name in (
+            line.removeprefix("import time:").split("|")
+            for line in process.stderr.splitlines()
+            if line.startswith("import time:") and "cumulative" not in line
+        )
+    }
+
+
+def test_import__app__within_budget():
+    # when: the fastest of a few runs, to rule out a busy machine
+    times = [import_times("python_2048.cli.app") for _ in range(3)]
+
+    # then: no command is imported until it is invoked
+    assert all(not name.startswith("python_2048.cli.commands.") for name in times[0])
+    assert min(time["python_2048.cli.app"] for time in times) <= IMPORT_TIME_BUDGET
+
+
+@pytest.mark.parametrize("command", sorted(app.COMMAND_MODULES))
+def test_import__command__skips_heavy_modules(command: str):
+    # given:
+    module = app.COMMAND_MODULES[command]
+
+    # when:
+    times = import_times(module)
+
+    # then:
+    assert not [name for name in times if name.startswith(HEAVY_MODULES)]
+    assert times[module] <= COMMAND_IMPORT_TIME_BUDGET
+
+
+def test_help__lists_every_command():
+    # when:
+    result = typer.testing.CliRunner().invoke(app.app, ["--help"])
+
+    # then:
+    assert result.exit_code == 0
+    assert all(command in result.output for command in app.COMMAND_MODULES)
+
+
+def test_invoke__unknown_command__fails():
+    # when:
+    result = typer.testing.CliRunner().invoke(app.app, ["unknown"])
+
+    # then:
+    assert "No such command" in result.output
+    assert result.exit_code == 2
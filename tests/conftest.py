@@ -1,17 +1,198 @@
+import itertools
+import json
+import platform
+import time
+import tracemalloc
+import typing
+
 import pytest
 
+BENCHMARK_ROUNDS = 5
+"""The number of timed rounds of a benchmark, of which the fastest is kept."""
+
+BENCHMARK_MIN_ROUND_SECONDS = 0.05
+"""The least duration of a round, which calibrates the number of calls per round."""
+
+BENCHMARK_MEMORY_OBJECTS = 2000
+"""The number of live objects of a memory benchmark, over which the bytes are averaged."""
+
+_benchmark_results_key = pytest.StashKey[dict[str, dict[str, float]]]()
+
 
 def pytest_addoption(parser):
     parser.addoption(
         "--run-llm-evaluations", action="store_true", default=False, help="run llm evaluations"
     )
+    parser.addoption("--run-benchmarks", action="store_true", default=False, help="run benchmarks")
+    parser.addoption(
+        "--benchmark-json", default=None, help="write the benchmark results to a JSON file"
+    )
+    parser.addoption(
+        "--benchmark-baseline",
+        default=None,
+        help="fail the benchmarks that regress from a JSON file of --benchmark-json",
+    )
+    parser.addoption(
+        "--benchmark-threshold",
+        type=float,
+        default=0.2,
+        help="the ratio by which a benchmark may be slower or larger than its baseline",
+    )
 
 
 def pytest_collection_modifyitems(config, items):
-    if config.getoption("--run-llm-evaluations"):
-        return
+    skips = {
+        "llm_evaluation": None
+        if config.getoption("--run-llm-evaluations")
+        else pytest.mark.skip(reason="need --run-llm-evaluations option to run"),
+        "benchmark": None
+        if config.getoption("--run-benchmarks")
+        else pytest.mark.skip(reason="need --run-benchmarks option to run"),
+    }
 
-    skip = pytest.mark.skip(reason="need --run-llm-evaluations option to run")
     for item in items:
-        if "llm_evaluation" in item.keywords:
-            item.add_marker(skip)
+        for keyword, skip in skips.items():
+            if skip and keyword in item.keywords:
+                item.add_marker(skip)
+
+
+def pytest_configure(config):
+    config.stash[_benchmark_results_key] = {}
+
+
+def pytest_sessionfinish(session):
+    results = session.config.stash[_benchmark_results_key]
+    json_path = session.config.getoption("--benchmark-json")
+
+    if not results or not json_path:
+        return
+
+    with open(json_path, "w") as file:
+        json.dump(
+            {
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "benchmarks": dict(sorted(results.items())),
+            },
+            file,
+            indent=2,
+        )
+
+
+@pytest.fixture
+def benchmark(request: pytest.FixtureRequest) -> typing.Callable[..., float]:
+    """Time the calls of a function, record them, and fail if they regress from the baseline.
+
+    Every call takes a fresh input from `setup`, which is made before the timer starts,
+    so that a function may mutate its input, e.g. a game board, without timing the copies.
+    Returns the seconds per call of the fastest round.
+    """
+
+    config = request.config
+    name = request.node.nodeid
+
+    def run(
+        function: typing.Callable[[typing.Any], object],
+        setup: typing.Callable[[], typing.Any] = lambda: None,
+    ) -> float:
+        number, seconds = _calibrate(function, setup)
+        seconds = min(
+            [seconds] + [_time_round(function, setup, number) for _ in range(BENCHMARK_ROUNDS - 1)]
+        )
+        seconds_per_call = seconds / number
+
+        config.stash[_benchmark_results_key][name] = {
+            "seconds_per_call": seconds_per_call,
+            "calls_per_second": 1 / seconds_per_call,
+        }
+        _check_baseline(config, name, "seconds_per_call", seconds_per_call)
+
+        return seconds_per_call
+
+    return run
+
+
+@pytest.fixture
+def memory_benchmark(request: pytest.FixtureRequest) -> typing.Callable[..., float]:
+    """Trace the memory of live objects, record it, and fail if it regresses from the baseline.
+
+    The objects are created by `factory` and kept alive together, as in a search frontier,
+    and the bytes that are still allocated are averaged over them, after a warm-up batch.
+    Returns the bytes per object.
+    """
+
+    config = request.config
+    name = request.node.nodeid
+
+    def run(factory: typing.Callable[[], object]) -> float:
+        # a batch is created untraced first, so that shared caches are not counted per object
+        _ = [factory() for _ in range(BENCHMARK_MEMORY_OBJECTS)]
+
+        tracemalloc.start()
+
+        try:
+            allocated_before, _ = tracemalloc.get_traced_memory()
+            objects = [factory() for _ in range(BENCHMARK_MEMORY_OBJECTS)]
+            allocated_after, _ = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        bytes_per_object = (allocated_after - allocated_before) / len(objects)
+
+        config.stash[_benchmark_results_key][name] = {"bytes_per_object": bytes_per_object}
+        _check_baseline(config, name, "bytes_per_object", bytes_per_object)
+
+        return bytes_per_object
+
+    return run
+
+
+def _calibrate(
+    function: typing.Callable[[typing.Any], object], setup: typing.Callable[[], typing.Any]
+) -> tuple[int, float]:
+    """Find the number of calls per round like `timeit.Timer.autorange`, i.e. 1, 2, 5, 10..."""
+
+    for exponent in itertools.count():
+        for multiple in (1, 2, 5):
+            number = multiple * 10**exponent
+
+            if (seconds := _time_round(function, setup, number)) >= BENCHMARK_MIN_ROUND_SECONDS:
+                return number, seconds
+
+    raise AssertionError("unreachable")
+
+
+def _time_round(
+    function: typing.Callable[[typing.Any], object],
+    setup: typing.Callable[[], typing.Any],
+    number: int,
+) -> float:
+    inputs = [setup() for _ in range(number)]
+    started_at = time.perf_counter()
+
+    for value in inputs:
+        function(value)
+
+    return time.perf_counter() - started_at
+
+
+def _check_baseline(config: pytest.Config, name: str, metric: str, value: float):
+    baseline_path = config.getoption("--benchmark-baseline")
+
+    if not baseline_path:
+        return
+
+    with open(baseline_path) as file:
+        baseline = json.load(file)["benchmarks"].get(name)
+
+    if baseline is None or metric not in baseline:
+        return
+
+    threshold = typing.cast(float, config.getoption("--benchmark-threshold"))
+    ratio = value / baseline[metric]
+
+    if ratio > 1 + threshold:
+        pytest.fail(
+            f"{name} regressed to {value:.4g} {metric}, "
+            f"{ratio - 1:.0%} above the baseline, beyond the threshold of {threshold:.0%}"
+        )
@@ -0,0 +1,76 @@
+"""Benchmarks for `board_utils`."""
+
+import copy
+import random
+import typing
+
+import pytest
+
+from python_2048.game import types
+from python_2048.game.lib import board_utils
+
+pytestmark = pytest.mark.benchmark
+
+SPARSE_BOARD: types.GameBoard = [
+    [None, None, None, None],
+    [None, 2, None, None],
+    [None, None, None, None],
+    [None, None, 4, None],
+]
+
+DENSE_BOARD: types.GameBoard = [
+    [2, 2, 4, None],
+    [8, None, 8, 16],
+    [4, 4, None, 2],
+    [32, 16, 16, 64],
+]
+
+NEAR_TERMINAL_BOARD: types.GameBoard = [
+    [2, 4, 8, 16],
+    [4, 8, 16, 32],
+    [8, 16, 32, 64],
+    [16, 32, 64, None],
+]
+
+BOARDS = [
+    pytest.param(SPARSE_BOARD, id="sparse"),
+    pytest.param(DENSE_BOARD, id="dense"),
+    pytest.param(NEAR_TERMINAL_BOARD, id="near-terminal"),
+]
+
+
+@pytest.mark.parametrize("board", BOARDS)
+@pytest.mark.parametrize(
+    "move_and_merge",
+    [
+        pytest.param(board_utils.move_and_merge_up, id="up"),
+        pytest.param(board_utils.move_and_merge_left, id="left"),
+        pytest.param(board_utils.move_and_merge_down, id="down"),
+        pytest.param(board_utils.move_and_merge_right, id="right"),
+    ],
+)
+def test_benchmark_move_and_merge(
+    benchmark: typing.Callable[..., float],
+    board: types.GameBoard,
+    move_and_merge: typing.Callable[[types.GameBoard], bool],
+):
+    benchmark(move_and_merge, setup=lambda: copy.deepcopy(board))
+
+
+@pytest.mark.parametrize("board", BOARDS)
+def test_benchmark_is_out_of_moves(benchmark: typing.Callable[..., float], board: types.GameBoard):
+    benchmark(lambda _: board_utils.is_out_of_moves(board))
+
+
+@pytest.mark.parametrize("board", BOARDS)
+def test_benchmark_spawn_new_tile(benchmark: typing.Callable[..., float], board: types.GameBoard):
+    rng = random.Random(0)
+    benchmark(
+        lambda board_: board_utils.spawn_new_tile(board_, rng=rng),
+        setup=lambda: copy.deepcopy(board),
+    )
+
+
+@pytest.mark.parametrize("board", BOARDS)
+def test_benchmark_get_score(benchmark: typing.Callable[..., float], board: types.GameBoard):
+    benchmark(lambda _: board_utils.get_score(board))
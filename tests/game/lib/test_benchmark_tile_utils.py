@@ -0,0 +1,24 @@
+"""Benchmarks for `tile_utils`."""
+
+import typing
+
+import pytest
+
+from python_2048.game.lib import tile_utils
+
+pytestmark = pytest.mark.benchmark
+
+
+@pytest.mark.parametrize(
+    "tiles",
+    [
+        pytest.param((None, 2, None, None), id="sparse"),
+        pytest.param((2, 2, 4, 4), id="dense"),
+        pytest.param((2, 4, 8, 16), id="near-terminal"),
+        pytest.param((None, 2, None, 2, 4, 4, None, 8), id="long"),
+    ],
+)
+def test_benchmark_move_and_merge_tiles(
+    benchmark: typing.Callable[..., float], tiles: tuple[int | None, ...]
+):
+    benchmark(lambda _: tile_utils.move_and_merge_tiles(tiles))
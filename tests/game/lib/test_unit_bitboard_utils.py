@@ -0,0 +1,362 @@
+"""Unit tests for the game logic on a packed bitboard."""
+
+import copy
+import random
+import typing
+
+import pytest
+
+from python_2048.game import types
+from python_2048.game.lib import bitboard_utils, board_utils
+
+RANDOM_SEED = 100
+
+REGULAR_BOARD: types.GameBoard = [
+    [None, 8, 2, 2],
+    [4, 2, None, 2],
+    [None, None, None, None],
+    [None, None, None, 2],
+]
+
+
+def _generate_random_boards(number_of_boards: int) -> list[types.GameBoard]:
+    """Generate random 4x4 boards, in both sparse and dense distributions."""
+
+    rng = random.Random(RANDOM_SEED)
+    sparse_tiles = (None, None, None, 2, 4, 8, 2048)
+    dense_tiles = (None, 2, 4, 8, 16)
+
+    return [
+        [[rng.choice(tiles) for _ in range(4)] for __ in range(4)]
+        for tiles in (sparse_tiles, dense_tiles)
+        for _ in range(number_of_boards // 2)
+    ]
+
+
+RANDOM_BOARDS = _generate_random_boards(200)
+
+
+@pytest.mark.parametrize(
+    ["board", "expected"],
+    [
+        pytest.param(REGULAR_BOARD, True, id="regular-board"),
+        pytest.param([[None] * 4 for _ in range(4)], True, id="empty-board"),
+        pytest.param([[2**14] * 4 for _ in range(4)], True, id="largest-tiles"),
+        pytest.param([], False, id="no-rows"),
+        pytest.param([[2, 4, 8]] * 4, False, id="irregular-columns"),
+        pytest.param([[2, 4, 8, 16]] * 3, False, id="irregular-rows"),
+        pytest.param([[2**15, None, None, None]] + [[None] * 4] * 3, False, id="too-large"),
+        pytest.param([[1, None, None, None]] + [[None] * 4] * 3, False, id="too-small"),
+        pytest.param([[6, None, None, None]] + [[None] * 4] * 3, False, id="not-power-of-two"),
+        pytest.param([[2.0, None, None, None]] + [[None] * 4] * 3, False, id="not-integer"),
+    ],
+)
+def test_can_encode(board: types.GameBoard, expected: bool):
+    assert bitboard_utils.can_encode(board) == expected
+
+
+def test_encode():
+    assert bitboard_utils.encode(REGULAR_BOARD) == 0x1000_0000_1012_1130
+
+
+@pytest.mark.parametrize(["board"], [pytest.param(board) for board in RANDOM_BOARDS[:10]])
+def test_decode__encoded__returns_same_board(board: types.GameBoard):
+    assert bitboard_utils.decode(bitboard_utils.encode(board)) == board
+
+
+@pytest.mark.parametrize(["board"], [pytest.param(board) for board in RANDOM_BOARDS[:10]])
+def test_decode_frozen__encoded__returns_same_board(board: types.GameBoard):
+    assert bitboard_utils.decode_frozen(bitboard_utils.encode(board)) == tuple(map(tuple, board))
+
+
+@pytest.mark.parametrize(
+    ["row_index", "column_index", "expected"],
+    [
+        pytest.param(0, 0, None, id="empty"),
+        pytest.param(0, 1, 8, id="first-row"),
+        pytest.param(3, 3, 2, id="last-row"),
+    ],
+)
+def test_get_tile(row_index: int, column_index: int, expected: int | None):
+    bitboard = bitboard_utils.encode(REGULAR_BOARD)
+    assert bitboard_utils.get_tile(bitboard, row_index, column_index) == expected
+
+
+def test_transpose():
+    # given:
+    bitboard = bitboard_utils.encode(REGULAR_BOARD)
+
+    # when:
+    transposed = bitboard_utils.transpose(bitboard)
+
+    # then:
+    assert bitboard_utils.decode(transposed) == [list(column) for column in zip(*REGULAR_BOARD)]
+
+
+@pytest.mark.parametrize(
+    ["board_utils_move", "bitboard_utils_move"],
+    [
+        pytest.param(board_utils.move_and_merge_up, bitboard_utils.move_up, id="up"),
+        pytest.param(board_utils.move_and_merge_left, bitboard_utils.move_left, id="left"),
+        pytest.param(board_utils.move_and_merge_down, bitboard_utils.move_down, id="down"),
+        pytest.param(board_utils.move_and_merge_right, bitboard_utils.move_right, id="right"),
+    ],
+)
+def test_move__is_consistent_with_board_utils(
+    board_utils_move: typing.Callable[[types.GameBoard], bool],
+    bitboard_utils_move: typing.Callable[[types.Bitboard], types.Bitboard],
+):
+    for board in RANDOM_BOARDS:
+        # given:
+        expected = copy.deepcopy(board)
+        modified = board_utils_move(expected)
+
+        # when:
+        bitboard = bitboard_utils.encode(board)
+        moved = bitboard_utils_move(bitboard)
+
+        # then:
+        assert bitboard_utils.decode(moved) == expected
+        assert (moved != bitboard) == modified
+
+
+@pytest.mark.parametrize(
+    ["direction"],
+    [pytest.param(direction, id=direction.name.lower()) for direction in types.SlideDirection],
+)
+def test_preview__is_consistent_with_board_utils(direction: types.SlideDirection):
+    for board in RANDOM_BOARDS:
+        # given:
+        expected = board_utils.preview(board, direction)
+
+        # when:
+        preview = bitboard_utils.preview(bitboard_utils.encode(board), direction)
+
+        # then:
+        assert bitboard_utils.decode_frozen(preview.afterstate) == expected.afterstate
+        assert preview.reward == expected.reward
+        assert preview.moved == expected.moved
+
+
+def test_preview_all__is_consistent_with_preview():
+    for board in RANDOM_BOARDS:
+        # given:
+        bitboard = bitboard_utils.encode(board)
+
+        # when:
+        previews = bitboard_utils.preview_all(bitboard)
+
+        # then:
+        assert previews == {
+            direction: bitboard_utils.preview(bitboard, direction)
+            for direction in types.SlideDirection
+        }
+
+
+def test_preview__overflowing_tiles__yields_no_reward():
+    # given: two adjacent tiles of 2 ** 15
+    bitboard = 0x00FF
+
+    # when:
+    preview = bitboard_utils.preview(bitboard, types.SlideDirection.LEFT)
+
+    # then:
+    assert preview == bitboard_utils.BitboardPreview(afterstate=bitboard, reward=0, moved=False)
+
+
+def test_move__overflowing_tiles__leaves_row_unchanged():
+    # given: two adjacent tiles of 2 ** 15
+    bitboard = 0x00FF
+
+    # when:
+    moved = bitboard_utils.move_right(bitboard)
+
+    # then:
+    assert bitboard_utils.decode(moved)[0] == [2**15, 2**15, None, None]
+
+
+def test_spawn_new_tile__is_consistent_with_board_utils():
+    for board in RANDOM_BOARDS:
+        # given:
+        expected = copy.deepcopy(board)
+        random.seed(RANDOM_SEED)
+        board_utils.spawn_new_tile(expected)
+
+        # when:
+        random.seed(RANDOM_SEED)
+        spawned = bitboard_utils.spawn_new_tile(bitboard_utils.encode(board))
+
+        # then:
+        assert bitboard_utils.decode(spawned) == expected
+
+
+@pytest.mark.parametrize(["seed"], [pytest.param(seed, id=f"seed-{seed}") for seed in range(5)])
+def test_spawn_new_tile__picks_indexed_empty_tile(seed: int):
+    # given: the empty tiles, in the order of their bit offsets
+    bitboard = bitboard_utils.encode(REGULAR_BOARD)
+    empty_tiles = [
+        (row_index, column_index)
+        for row_index, row in enumerate(REGULAR_BOARD)
+        for column_index, tile in enumerate(row)
+        if tile is None
+    ]
+
+    random.seed(seed)
+    expected_index = random.randrange(len(empty_tiles))
+
+    # when:
+    random.seed(seed)
+    spawned = bitboard_utils.spawn_new_tile(bitboard)
+
+    # then:
+    row_index, column_index = empty_tiles[expected_index]
+    assert bitboard_utils.get_tile(spawned, row_index, column_index) is not None
+    assert bitboard_utils.count_empty_tiles(spawned) == len(empty_tiles) - 1
+
+
+def test_spawn_new_tile__respects_new_tiles():
+    new_tiles = (types.NewTile(value=64, weight=1.0),)
+    spawned = bitboard_utils.spawn_new_tile(0, new_tiles)
+    assert bitboard_utils.get_score(spawned) == 64
+
+
+@pytest.mark.parametrize(
+    ["bitboard", "expected"],
+    [
+        pytest.param(0, 0x1111_1111_1111_1111, id="empty-board"),
+        pytest.param(0xFFFF_FFFF_FFFF_FFFF, 0, id="full-board"),
+        pytest.param(0x1000_0000_1012_1130, 0x0111_1111_0100_0001, id="regular-board"),
+    ],
+)
+def test_get_zero_nibbles(bitboard: int, expected: int):
+    assert bitboard_utils._get_zero_nibbles(bitboard) == expected
+
+
+def test_spawn_new_tile__full_board__returns_same_bitboard():
+    bitboard = bitboard_utils.encode([[2, 4, 2, 4], [4, 2, 4, 2], [2, 4, 2, 4], [4, 2, 4, 2]])
+    assert bitboard_utils.spawn_new_tile(bitboard) == bitboard
+
+
+def test_get_spawn_outcomes__is_consistent_with_board_utils():
+    new_tiles = (types.NewTile(value=2, weight=0.6), types.NewTile(value=16, weight=0.4))
+
+    for board in RANDOM_BOARDS:
+        # given:
+        expected = list(board_utils.get_spawn_outcomes(board, new_tiles))
+
+        # when:
+        outcomes = list(bitboard_utils.get_spawn_outcomes(bitboard_utils.encode(board), new_tiles))
+
+        # then:
+        assert [bitboard_utils.decode_frozen(outcome.bitboard) for outcome in outcomes] == [
+            outcome.board for outcome in expected
+        ]
+        assert [outcome.probability for outcome in outcomes] == pytest.approx(
+            [outcome.probability for outcome in expected]
+        )
+
+
+def test_get_spawn_outcomes__full_board__yields_nothing():
+    assert list(bitboard_utils.get_spawn_outcomes(0x1212_2121_1212_2121)) == []
+
+
+def test_get_spawned_tile():
+    for board in RANDOM_BOARDS:
+        # given:
+        bitboard = bitboard_utils.encode(board)
+
+        # when:
+        spawned = bitboard_utils.spawn_new_tile(bitboard)
+
+        # then:
+        expected = bitboard_utils.get_score(spawned) - bitboard_utils.get_score(bitboard)
+        assert bitboard_utils.get_spawned_tile(bitboard, spawned) == expected
+
+
+def test_get_spawn__is_consistent_with_board_utils():
+    for board in RANDOM_BOARDS:
+        # given:
+        random.seed(RANDOM_SEED)
+        expected = board_utils.draw_spawn(board)
+
+        # when:
+        random.seed(RANDOM_SEED)
+        bitboard = bitboard_utils.encode(board)
+        spawn = bitboard_utils.get_spawn(bitboard, bitboard_utils.spawn_new_tile(bitboard))
+
+        # then:
+        assert spawn == expected
+
+
+def test_count_empty_tiles():
+    for board in RANDOM_BOARDS:
+        expected = sum(tile is None for row in board for tile in row)
+        assert bitboard_utils.count_empty_tiles(bitboard_utils.encode(board)) == expected
+
+
+def test_get_score():
+    for board in RANDOM_BOARDS:
+        expected = board_utils.get_score(board)
+        assert bitboard_utils.get_score(bitboard_utils.encode(board)) == expected
+
+
+def test_has_2048():
+    for board in RANDOM_BOARDS:
+        expected = board_utils.has_2048(board)
+        assert bitboard_utils.has_2048(bitboard_utils.encode(board)) == expected
+
+
+@pytest.mark.parametrize(
+    ["board", "expected"],
+    [
+        pytest.param([[None] * 4 for _ in range(4)], True, id="empty-board"),
+        pytest.param(
+            [[2, 4, 2, 4], [4, 2, 4, 2], [2, 4, 2, 4], [4, 2, 4, 2]],
+            True,
+            id="full-board",
+        ),
+        pytest.param(
+            [[2, 4, 2, 4], [4, 2, 4, 2], [2, 4, 2, 4], [4, 2, 4, None]],
+            False,
+            id="moveable",
+        ),
+        pytest.param(
+            [[2, 4, 2, 4], [4, 2, 4, 2], [2, 4, 2, 4], [4, 2, 4, 4]],
+            False,
+            id="horizontally-mergeable",
+        ),
+        pytest.param(
+            [[2, 4, 2, 4], [4, 2, 4, 2], [2, 4, 2, 4], [2, 2, 4, 2]],
+            False,
+            id="vertically-mergeable",
+        ),
+    ],
+)
+def test_is_out_of_moves(board: types.GameBoard, expected: bool):
+    assert bitboard_utils.is_out_of_moves(bitboard_utils.encode(board)) == expected
+
+
+def test_is_out_of_moves__is_consistent_with_board_utils():
+    for board in RANDOM_BOARDS:
+        expected = board_utils.is_out_of_moves(board)
+        assert bitboard_utils.is_out_of_moves(bitboard_utils.encode(board)) == expected
+
+
+def test_get_legal_moves__is_consistent_with_board_utils():
+    for board in RANDOM_BOARDS:
+        expected = board_utils.get_legal_moves(board)
+        assert bitboard_utils.get_legal_moves(bitboard_utils.encode(board)) == expected
+
+
+def test_spawn_new_tile__with_rng__is_consistent_with_global_random():
+    for board in RANDOM_BOARDS:
+        # given:
+        bitboard = bitboard_utils.encode(board)
+        random.seed(RANDOM_SEED)
+        expected = bitboard_utils.spawn_new_tile(bitboard)
+
+        # when:
+        spawned = bitboard_utils.spawn_new_tile(bitboard, rng=random.Random(RANDOM_SEED))
+
+        # then:
+        assert spawned == expected
@@ -1,5 +1,6 @@
 """Unit tests for the game logic related to the board."""
 
+import copy
 import random
 from unittest import mock
 
@@ -30,7 +31,7 @@ def test_create_new_board__fixed_number_of_tiles(
     assert board == mock_create_empty_board.return_value
 
     # then: should spawn the expected number of tiles
-    mock_spawn_new_tile.assert_called_with(board, new_tiles)
+    mock_spawn_new_tile.assert_called_with(board, new_tiles, rng=None)
     assert mock_spawn_new_tile.call_count == num_initial_tiles
 
 
@@ -56,7 +57,7 @@ def test_create_new_board__random_number_of_tiles(
     assert board == mock_create_empty_board.return_value
 
     # then: should spawn the expected number of tiles
-    mock_spawn_new_tile.assert_called_with(board, new_tiles)
+    mock_spawn_new_tile.assert_called_with(board, new_tiles, rng=None)
     assert mock_spawn_new_tile.call_count == expected_number_of_tiles
 
 
@@ -142,12 +143,197 @@ def test_spawn_new_tile__regular_board():
     # then:
     assert board == [
         [None, None, None, None],
-        [None, None, None, 2],
+        [2, None, None, None],
         [None, None, None, None],
         [None, None, None, None],
     ]
 
 
+def test_spawn_new_tile__fills_the_only_empty_tile():
+    # given:
+    board: types.GameBoard = [[2, 4, None], [4, 2, 4]]
+
+    # when:
+    board_utils.spawn_new_tile(board)
+
+    # then:
+    assert board[0][2] in (2, 4)
+
+
+@pytest.mark.parametrize(["seed"], [pytest.param(seed, id=f"seed-{seed}") for seed in range(5)])
+def test_spawn_new_tile__with_num_empty_tiles__is_consistent_with_indexing(seed: int):
+    # given:
+    board: types.GameBoard = [[2, None, 4], [None, 8, None]]
+    expected = copy.deepcopy(board)
+
+    random.seed(seed)
+    expected_tile = board_utils.spawn_new_tile(expected)
+
+    # when:
+    random.seed(seed)
+    new_tile = board_utils.spawn_new_tile(board, num_empty_tiles=3)
+
+    # then:
+    assert board == expected
+    assert new_tile == expected_tile
+
+
+def test_spawn_new_tile__with_no_empty_tiles__returns_none():
+    # given:
+    board: types.GameBoard = [[2, 4]]
+
+    # then:
+    assert board_utils.spawn_new_tile(board) is None
+    assert board_utils.spawn_new_tile(board, num_empty_tiles=0) is None
+    assert board == [[2, 4]]
+
+
+def test_spawn_new_tile__with_wrong_num_empty_tiles__raises_index_error():
+    with pytest.raises(IndexError):
+        board_utils.spawn_new_tile([[2, None]], num_empty_tiles=5)
+
+
+@pytest.mark.parametrize(
+    ["direction", "expected_board", "expected"],
+    [
+        pytest.param(
+            types.SlideDirection.LEFT,
+            [[4, 4, None, None], [8, 8, None, None]],
+            board_utils.MoveOutcome(changed=True, reward=12, merged_tiles=(4, 8)),
+            id="left",
+        ),
+        pytest.param(
+            types.SlideDirection.UP,
+            [[2, 2, 8, 8], [4, None, None, None]],
+            board_utils.MoveOutcome(changed=True, reward=8, merged_tiles=(8,)),
+            id="up",
+        ),
+        pytest.param(
+            types.SlideDirection.DOWN,
+            [[2, None, None, None], [4, 2, 8, 8]],
+            board_utils.MoveOutcome(changed=True, reward=8, merged_tiles=(8,)),
+            id="down",
+        ),
+    ],
+)
+def test_move_and_merge(
+    direction: types.SlideDirection,
+    expected_board: types.GameBoard,
+    expected: board_utils.MoveOutcome,
+):
+    # given:
+    board: types.GameBoard = [[2, 2, 4, None], [4, None, 4, 8]]
+
+    # when:
+    outcome = board_utils.move_and_merge(board, direction)
+
+    # then:
+    assert board == expected_board
+    assert outcome == expected
+
+
+@pytest.mark.parametrize(
+    ["direction"],
+    [pytest.param(direction, id=direction.name.lower()) for direction in types.SlideDirection],
+)
+def test_preview__is_consistent_with_move_and_merge(direction: types.SlideDirection):
+    # given:
+    board: types.GameBoard = [[2, 2, 4, None], [4, None, 4, 8]]
+    expected_board = copy.deepcopy(board)
+    outcome = board_utils.move_and_merge(expected_board, direction)
+
+    # when:
+    preview = board_utils.preview(board, direction)
+
+    # then:
+    assert board == [[2, 2, 4, None], [4, None, 4, 8]]
+    assert preview == board_utils.MovePreview(
+        afterstate=tuple(map(tuple, expected_board)),
+        reward=outcome.reward,
+        moved=outcome.changed,
+    )
+
+
+def test_preview__unmovable_direction():
+    # when:
+    preview = board_utils.preview([[2, 4], [None, None]], types.SlideDirection.UP)
+
+    # then:
+    assert preview == board_utils.MovePreview(
+        afterstate=((2, 4), (None, None)), reward=0, moved=False
+    )
+
+
+def test_preview_all__is_consistent_with_preview():
+    # given:
+    board: types.GameBoard = [[2, 2, 4, None], [4, None, 4, 8], [None, 8, 8, 16]]
+
+    # when:
+    previews = board_utils.preview_all(board)
+
+    # then:
+    assert list(previews) == list(types.SlideDirection)
+    assert previews == {
+        direction: board_utils.preview(board, direction) for direction in types.SlideDirection
+    }
+
+
+@pytest.mark.parametrize(["seed"], [pytest.param(seed, id=f"seed-{seed}") for seed in range(5)])
+def test_spawn_new_tile__picks_indexed_empty_tile(seed: int):
+    # given:
+    board: types.GameBoard = [[2, None, 4], [None, 8, None]]
+    empty_tiles = [(0, 1), (1, 0), (1, 2)]
+
+    random.seed(seed)
+    expected_index = random.randrange(len(empty_tiles))
+
+    # when:
+    random.seed(seed)
+    board_utils.spawn_new_tile(board)
+
+    # then:
+    row_index, column_index = empty_tiles[expected_index]
+    assert board[row_index][column_index] is not None
+    assert sum(tile is None for row in board for tile in row) == 2
+
+
+def test_get_spawn_outcomes():
+    # given:
+    board: types.GameBoard = [[2, None], [4, None]]
+    new_tiles = (types.NewTile(value=2, weight=3), types.NewTile(value=8, weight=1))
+
+    # when:
+    outcomes = list(board_utils.get_spawn_outcomes(board, new_tiles))
+
+    # then:
+    assert board == [[2, None], [4, None]]
+    assert outcomes == [
+        board_utils.SpawnOutcome(board=((2, 2), (4, None)), probability=0.375),
+        board_utils.SpawnOutcome(board=((2, 8), (4, None)), probability=0.125),
+        board_utils.SpawnOutcome(board=((2, None), (4, 2)), probability=0.375),
+        board_utils.SpawnOutcome(board=((2, None), (4, 8)), probability=0.125),
+    ]
+
+
+def test_get_spawn_outcomes__full_board__yields_nothing():
+    assert list(board_utils.get_spawn_outcomes([[2, 4], [4, 2]])) == []
+
+
+@pytest.mark.parametrize(["seed"], [pytest.param(seed, id=f"seed-{seed}") for seed in range(5)])
+def test_get_spawn_outcomes__covers_spawn_new_tile(seed: int):
+    # given:
+    board: types.GameBoard = [[2, None, 4], [None, 8, None]]
+    outcomes = dict(board_utils.get_spawn_outcomes(board))
+
+    # when:
+    random.seed(seed)
+    board_utils.spawn_new_tile(board)
+
+    # then:
+    assert tuple(map(tuple, board)) in outcomes
+    assert sum(outcomes.values()) == pytest.approx(1)
+
+
 @pytest.mark.parametrize(
     ["board", "expected"],
     [
@@ -170,6 +356,22 @@ def test_score(board: types.GameBoard, expected: int):
     assert board_utils.get_score(board) == expected
 
 
+@pytest.mark.parametrize(
+    ["board", "expected"],
+    [
+        pytest.param([], board_utils.BoardSummary(0, 0, 0), id="empty-board"),
+        pytest.param([[None, None]], board_utils.BoardSummary(0, 0, 2), id="empty-tiles"),
+        pytest.param(
+            [[None, 8, 2, 2], [4, 2, None, 2], [None, None, None, None], [None, None, None, 2]],
+            board_utils.BoardSummary(score=22, max_tile=8, num_empty_tiles=9),
+            id="regular-board",
+        ),
+    ],
+)
+def test_summarize(board: types.GameBoard, expected: board_utils.BoardSummary):
+    assert board_utils.summarize(board) == expected
+
+
 def test_has_2048__empty_board():
     board: types.GameBoard = []
     assert not board_utils.has_2048(board)
@@ -270,3 +472,71 @@ def test_is_out_of_moves__moveable__returns_false(board: types.GameBoard):
 )
 def test_is_out_of_moves__mergeable__returns_false(board: types.GameBoard):
     assert not board_utils.is_out_of_moves(board)
+
+
+@pytest.mark.parametrize(
+    ["board", "expected"],
+    [
+        pytest.param([], frozenset(), id="empty-board"),
+        pytest.param([[None, None], [None, None]], frozenset(), id="no-tiles"),
+        pytest.param([[2, 4], [4, 2]], frozenset(), id="out-of-moves"),
+        pytest.param(
+            [[2, 2], [4, 8]],
+            frozenset({types.SlideDirection.LEFT, types.SlideDirection.RIGHT}),
+            id="horizontally-mergeable",
+        ),
+        pytest.param(
+            [[None, 2], [4, 8]],
+            frozenset({types.SlideDirection.LEFT, types.SlideDirection.UP}),
+            id="moveable",
+        ),
+    ],
+)
+def test_get_legal_moves(board: types.GameBoard, expected: frozenset[types.SlideDirection]):
+    assert board_utils.get_legal_moves(board) == expected
+
+
+def test_get_legal_moves__is_consistent_with_is_out_of_moves():
+    rng = random.Random(RANDOM_SEED)
+    tiles = (None, 2, 4, 8)
+
+    for _ in range(200):
+        board = [[rng.choice(tiles) for _ in range(3)] for __ in range(3)]
+        assert (not board_utils.get_legal_moves(board)) == board_utils.is_out_of_moves(board)
+
+
+@pytest.mark.parametrize(["seed"], [pytest.param(seed, id=f"seed-{seed}") for seed in range(5)])
+def test_create_new_board__with_rng__is_consistent_with_global_random(seed: int):
+    # given:
+    random.seed(seed)
+    expected = board_utils.create_new_board(num_initial_tiles=None)
+
+    random.seed(RANDOM_SEED)
+    expected_global_draw = random.random()
+
+    # when:
+    random.seed(RANDOM_SEED)
+    board = board_utils.create_new_board(num_initial_tiles=None, rng=random.Random(seed))
+
+    # then: the global random number generator is left untouched
+    assert board == expected
+    assert random.random() == expected_global_draw
+
+
+@pytest.mark.parametrize(["seed"], [pytest.param(seed, id=f"seed-{seed}") for seed in range(5)])
+def test_draw_spawn__is_consistent_with_spawn_new_tile(seed: int):
+    # given:
+    board: types.GameBoard = [[2, None, 4], [None, 8, None]]
+    expected = copy.deepcopy(board)
+
+    random.seed(seed)
+    board_utils.spawn_new_tile(expected)
+
+    # when:
+    random.seed(seed)
+    spawn = board_utils.draw_spawn(board)
+
+    # then: the board is left unchanged
+    assert spawn is not None
+    assert board[spawn.row][spawn.column] is None
+    assert expected[spawn.row][spawn.column] == spawn.value
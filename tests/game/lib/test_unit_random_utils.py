@@ -0,0 +1,195 @@
+"""Unit tests for `random_utils`."""
+
+import copy
+import random
+
+import pytest
+
+from python_2048.game import constants, state, types
+from python_2048.game.lib import bitboard_utils, random_utils
+
+RANDOM_SEED = 100
+
+
+def test_derive_seed__is_deterministic():
+    assert random_utils.derive_seed(RANDOM_SEED, 3) == random_utils.derive_seed(RANDOM_SEED, 3)
+
+
+@pytest.mark.parametrize(
+    ["keys", "other_keys"],
+    [
+        pytest.param((0,), (1,), id="different-index"),
+        pytest.param((0,), (0, "player"), id="nested-stream"),
+        pytest.param((1, 2), (12,), id="ambiguous-concatenation"),
+        pytest.param(("1",), (1,), id="string-and-integer"),
+    ],
+)
+def test_derive_seed__distinct_keys__distinct_seeds(
+    keys: tuple[int | str, ...], other_keys: tuple[int | str, ...]
+):
+    assert random_utils.derive_seed(RANDOM_SEED, *keys) != random_utils.derive_seed(
+        RANDOM_SEED, *other_keys
+    )
+
+
+def test_derive_seed__fits_64_bits():
+    seeds = [random_utils.derive_seed(RANDOM_SEED, index) for index in range(100)]
+    assert all(0 <= seed < 2**64 for seed in seeds)
+    assert len(set(seeds)) == len(seeds)
+
+
+def test_create_rng__is_independent_of_order():
+    # given:
+    rngs = [random_utils.create_rng(RANDOM_SEED, index) for index in range(3)]
+    draws = [[rng.random() for _ in range(5)] for rng in rngs]
+
+    # when: the streams are created and drawn in reverse
+    reversed_rngs = [random_utils.create_rng(RANDOM_SEED, index) for index in reversed(range(3))]
+    reversed_draws = [[rng.random() for _ in range(5)] for rng in reversed_rngs]
+
+    # then:
+    assert reversed_draws[::-1] == draws
+
+
+@pytest.mark.parametrize(
+    ["seed", "expected"],
+    [
+        pytest.param(RANDOM_SEED, RANDOM_SEED, id="given"),
+        pytest.param(0, 0, id="zero"),
+    ],
+)
+def test_create_master_seed(seed: int, expected: int):
+    assert random_utils.create_master_seed(seed) == expected
+
+
+def test_create_master_seed__without_seed__is_fresh():
+    seeds = {random_utils.create_master_seed() for _ in range(10)}
+    assert len(seeds) == 10
+
+
+def test_counter_random__seek__repeats_draws():
+    # given:
+    rng = random_utils.create_counter_rng(RANDOM_SEED, 0)
+    draws = [rng.random() for _ in range(10)]
+
+    # when:
+    rng.seek(7)
+
+    # then:
+    assert [rng.random() for _ in range(3)] == draws[7:]
+    assert rng.counter == 10
+
+
+def test_counter_random__takes_one_draw_for_each_randrange_and_random():
+    # given:
+    rng = random_utils.CounterRandom(RANDOM_SEED)
+
+    # when:
+    _ = rng.randrange(14), rng.random(), rng.randrange(3, 100, 7)
+
+    # then:
+    assert rng.counter == 3
+
+
+@pytest.mark.parametrize(
+    ["args", "expected_values"],
+    [
+        pytest.param((4,), set(range(4)), id="stop"),
+        pytest.param((3, 6), {3, 4, 5}, id="start-stop"),
+        pytest.param((0, 10, 3), {0, 3, 6, 9}, id="step"),
+        pytest.param((10, 0, -4), {10, 6, 2}, id="negative-step"),
+    ],
+)
+def test_counter_random__randrange(args: tuple[int, ...], expected_values: set[int]):
+    # given:
+    rng = random_utils.CounterRandom(RANDOM_SEED)
+
+    # when:
+    values = {rng.randrange(*args) for _ in range(200)}
+
+    # then:
+    assert values == expected_values
+
+
+@pytest.mark.parametrize(
+    ["args"],
+    [
+        pytest.param((0,), id="empty"),
+        pytest.param((5, 1), id="reversed"),
+        pytest.param((0, 5, 0), id="zero-step"),
+    ],
+)
+def test_counter_random__randrange__invalid_range__raises_value_error(args: tuple[int, ...]):
+    with pytest.raises(ValueError):
+        random_utils.CounterRandom(RANDOM_SEED).randrange(*args)
+
+
+def test_counter_random__randrange__beyond_64_bits():
+    # given:
+    rng = random_utils.CounterRandom(RANDOM_SEED)
+
+    # when:
+    values = [rng.randrange(2**100) for _ in range(10)]
+
+    # then:
+    assert all(0 <= value < 2**100 for value in values)
+    assert max(values) >= 2**64
+
+
+@pytest.mark.parametrize(["k"], [pytest.param(k, id=f"{k}-bits") for k in (0, 1, 64, 100)])
+def test_counter_random__getrandbits(k: int):
+    # given:
+    rng = random_utils.CounterRandom(RANDOM_SEED)
+
+    # when:
+    values = [rng.getrandbits(k) for _ in range(50)]
+
+    # then:
+    assert all(0 <= value < 2**k for value in values)
+    assert max(values).bit_length() == k
+
+
+def test_counter_random__state():
+    # given:
+    rng = random_utils.CounterRandom(RANDOM_SEED)
+    rng.random()
+    copied = copy.deepcopy(rng)
+
+    # then:
+    assert copied.getstate() == rng.getstate()
+    assert copied.random() == rng.random()
+
+    # when:
+    rng.seed(RANDOM_SEED)
+
+    # then:
+    assert rng.getstate() == random_utils.CounterRandom(RANDOM_SEED).getstate()
+
+
+def test_counter_random__without_key__is_fresh():
+    assert random_utils.CounterRandom().random() != random_utils.CounterRandom().random()
+
+
+def test_counter_random__computes_the_spawn_of_any_turn_directly():
+    # given: a game of effective moves, with the board before each of them
+    game_state = state.GameState(rng=random_utils.CounterRandom(RANDOM_SEED))
+    moves_rng = random.Random(RANDOM_SEED)
+    turns: list[tuple[types.FrozenGameBoard, types.SlideDirection]] = []
+
+    while not game_state.is_out_of_moves():
+        direction = moves_rng.choice(sorted(game_state.legal_moves()))
+        turns.append((game_state.board, direction))
+        game_state.slide(direction)
+
+    for turn in range(0, len(turns), 7):
+        board, direction = turns[turn]
+        afterstate = bitboard_utils.preview(bitboard_utils.encode(board), direction).afterstate
+        expected = turns[turn + 1][0] if turn + 1 < len(turns) else game_state.board
+
+        # when: the initial tiles are the first spawns
+        rng = random_utils.CounterRandom(RANDOM_SEED)
+        rng.seek((constants.DEFAULT_NUMBER_OF_INITIAL_TILES + turn) * random_utils.DRAWS_PER_SPAWN)
+
+        # then:
+        spawned = bitboard_utils.spawn_new_tile(afterstate, rng=rng)
+        assert bitboard_utils.decode_frozen(spawned) == expected, f"turn {turn}"
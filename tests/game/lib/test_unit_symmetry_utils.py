@@ -0,0 +1,190 @@
+"""Unit tests for `symmetry_utils`."""
+
+import random
+
+import pytest
+
+from python_2048.game import types
+from python_2048.game.lib import bitboard_utils, board_utils, symmetry_utils
+
+RANDOM_SEED = 100
+
+BOARD: types.GameBoard = [[2, 4, None], [8, None, 16]]
+
+U = types.SlideDirection.UP
+L = types.SlideDirection.LEFT
+D = types.SlideDirection.DOWN
+R = types.SlideDirection.RIGHT
+
+
+def _generate_random_boards(num_boards: int) -> list[types.GameBoard]:
+    random.seed(RANDOM_SEED)
+    return [
+        board_utils.create_new_board(num_initial_tiles=random.randint(1, 16))
+        for _ in range(num_boards)
+    ]
+
+
+RANDOM_BOARDS = _generate_random_boards(100)
+
+
+@pytest.mark.parametrize(
+    ["transform", "expected"],
+    [
+        pytest.param(
+            symmetry_utils.Transform.IDENTITY, ((2, 4, None), (8, None, 16)), id="identity"
+        ),
+        pytest.param(
+            symmetry_utils.Transform.ROTATE_CLOCKWISE,
+            ((8, 2), (None, 4), (16, None)),
+            id="rotate-clockwise",
+        ),
+        pytest.param(
+            symmetry_utils.Transform.ROTATE_HALF_TURN,
+            ((16, None, 8), (None, 4, 2)),
+            id="rotate-half-turn",
+        ),
+        pytest.param(
+            symmetry_utils.Transform.ROTATE_ANTICLOCKWISE,
+            ((None, 16), (4, None), (2, 8)),
+            id="rotate-anticlockwise",
+        ),
+        pytest.param(
+            symmetry_utils.Transform.FLIP_HORIZONTALLY,
+            ((None, 4, 2), (16, None, 8)),
+            id="flip-horizontally",
+        ),
+        pytest.param(
+            symmetry_utils.Transform.FLIP_VERTICALLY,
+            ((8, None, 16), (2, 4, None)),
+            id="flip-vertically",
+        ),
+        pytest.param(
+            symmetry_utils.Transform.TRANSPOSE, ((2, 8), (4, None), (None, 16)), id="transpose"
+        ),
+        pytest.param(
+            symmetry_utils.Transform.ANTI_TRANSPOSE,
+            ((16, None), (None, 4), (8, 2)),
+            id="anti-transpose",
+        ),
+    ],
+)
+def test_apply(transform: symmetry_utils.Transform, expected: types.FrozenGameBoard):
+    assert symmetry_utils.apply(BOARD, transform) == expected
+
+
+@pytest.mark.parametrize(
+    ["transform", "expected"],
+    [
+        pytest.param(symmetry_utils.Transform.IDENTITY, (U, L, D, R), id="identity"),
+        pytest.param(
+            symmetry_utils.Transform.ROTATE_CLOCKWISE, (R, U, L, D), id="rotate-clockwise"
+        ),
+        pytest.param(
+            symmetry_utils.Transform.ROTATE_HALF_TURN, (D, R, U, L), id="rotate-half-turn"
+        ),
+        pytest.param(
+            symmetry_utils.Transform.ROTATE_ANTICLOCKWISE, (L, D, R, U), id="rotate-anticlockwise"
+        ),
+        pytest.param(
+            symmetry_utils.Transform.FLIP_HORIZONTALLY, (U, R, D, L), id="flip-horizontally"
+        ),
+        pytest.param(symmetry_utils.Transform.FLIP_VERTICALLY, (D, L, U, R), id="flip-vertically"),
+        pytest.param(symmetry_utils.Transform.TRANSPOSE, (L, U, R, D), id="transpose"),
+        pytest.param(symmetry_utils.Transform.ANTI_TRANSPOSE, (R, D, L, U), id="anti-transpose"),
+    ],
+)
+def test_map_direction(
+    transform: symmetry_utils.Transform, expected: tuple[types.SlideDirection, ...]
+):
+    assert tuple(symmetry_utils.map_direction(d, transform) for d in (U, L, D, R)) == expected
+
+
+@pytest.mark.parametrize(
+    ["transform"],
+    [pytest.param(transform, id=transform.name.lower()) for transform in symmetry_utils.Transform],
+)
+def test_map_direction__is_consistent_with_slides(transform: symmetry_utils.Transform):
+    for board in RANDOM_BOARDS:
+        # given:
+        transformed = symmetry_utils.apply(board, transform)
+
+        for direction in types.SlideDirection:
+            # when:
+            preview = board_utils.preview(board, direction)
+            transformed_preview = board_utils.preview(
+                transformed, symmetry_utils.map_direction(direction, transform)
+            )
+
+            # then:
+            assert transformed_preview.afterstate == symmetry_utils.apply(
+                preview.afterstate, transform
+            )
+            assert transformed_preview.reward == preview.reward
+
+
+@pytest.mark.parametrize(
+    ["transform"],
+    [pytest.param(transform, id=transform.name.lower()) for transform in symmetry_utils.Transform],
+)
+def test_inverse(transform: symmetry_utils.Transform):
+    # when:
+    restored = symmetry_utils.apply(symmetry_utils.apply(BOARD, transform), transform.inverse)
+
+    # then:
+    assert restored == ((2, 4, None), (8, None, 16))
+    assert all(
+        symmetry_utils.map_direction(symmetry_utils.map_direction(d, transform), transform.inverse)
+        == d
+        for d in types.SlideDirection
+    )
+
+
+@pytest.mark.parametrize(
+    ["transform"],
+    [pytest.param(transform, id=transform.name.lower()) for transform in symmetry_utils.Transform],
+)
+def test_apply_to_bitboard__is_consistent_with_apply(transform: symmetry_utils.Transform):
+    for board in RANDOM_BOARDS:
+        # when:
+        bitboard = symmetry_utils.apply_to_bitboard(bitboard_utils.encode(board), transform)
+
+        # then:
+        assert bitboard_utils.decode_frozen(bitboard) == symmetry_utils.apply(board, transform)
+
+
+def test_canonicalize__symmetric_boards_share_representative():
+    for board in RANDOM_BOARDS:
+        # given:
+        canonical, transform = symmetry_utils.canonicalize(board)
+
+        for symmetric_transform in symmetry_utils.Transform:
+            # when:
+            symmetric = symmetry_utils.apply(board, symmetric_transform)
+
+            # then:
+            assert symmetry_utils.canonicalize(symmetric)[0] == canonical
+
+        assert symmetry_utils.apply(board, transform) == canonical
+
+
+def test_canonicalize__rectangular_board():
+    # when:
+    canonical, transform = symmetry_utils.canonicalize(BOARD)
+
+    # then: boards of fewer rows come first
+    assert canonical == ((8, None, 16), (2, 4, None))
+    assert transform == symmetry_utils.Transform.FLIP_VERTICALLY
+
+
+def test_canonicalize_bitboard__is_consistent_with_canonicalize():
+    for board in RANDOM_BOARDS:
+        # given:
+        expected_board, expected_transform = symmetry_utils.canonicalize(board)
+
+        # when:
+        canonical, transform = symmetry_utils.canonicalize_bitboard(bitboard_utils.encode(board))
+
+        # then:
+        assert bitboard_utils.decode_frozen(canonical) == expected_board
+        assert transform == expected_transform
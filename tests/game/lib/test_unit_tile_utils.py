@@ -1,10 +1,11 @@
 """Unit tests for the game logic related to tiles."""
 
+import random
 import typing
 
 import pytest
 
-from python_2048.game import exceptions, types
+from python_2048.game import constants, exceptions, types
 from python_2048.game.lib import tile_utils
 
 
@@ -162,3 +163,164 @@ def test_replace_column__irregular_board__raises_invalid_replacement():
 )
 def test_move_and_merge_tiles(tiles: typing.Iterable[int | None], expected: tuple[int | None, ...]):
     assert tile_utils.move_and_merge_tiles(tiles) == expected
+
+
+@pytest.mark.parametrize(
+    ["tiles", "towards_end", "expected"],
+    [
+        pytest.param(
+            (None, None, None, None),
+            True,
+            tile_utils.LineTransition(
+                (None, None, None, None), reward=0, changed=False, merged_tiles=()
+            ),
+            id="no-tiles",
+        ),
+        pytest.param(
+            (2, None, None, 4),
+            True,
+            tile_utils.LineTransition((None, None, 2, 4), reward=0, changed=True, merged_tiles=()),
+            id="towards-end-move",
+        ),
+        pytest.param(
+            (2, 2, 2, 2),
+            True,
+            tile_utils.LineTransition(
+                (None, None, 4, 4), reward=8, changed=True, merged_tiles=(4, 4)
+            ),
+            id="towards-end-merge",
+        ),
+        pytest.param(
+            (4, 2, None, 2),
+            False,
+            tile_utils.LineTransition(
+                (4, 4, None, None), reward=4, changed=True, merged_tiles=(4,)
+            ),
+            id="towards-start-move-and-merge",
+        ),
+        pytest.param(
+            (2, 4, 2, 4),
+            False,
+            tile_utils.LineTransition((2, 4, 2, 4), reward=0, changed=False, merged_tiles=()),
+            id="towards-start-no-move-and-merge",
+        ),
+    ],
+)
+def test_get_line_transitions(
+    tiles: tuple[int | None, ...],
+    towards_end: bool,
+    expected: tile_utils.LineTransition,
+):
+    # when:
+    transitions = tile_utils.get_line_transitions(towards_end)
+
+    # then:
+    assert transitions[tiles] == expected
+    assert tiles in transitions
+    assert tile_utils.get_line_transitions(towards_end) is transitions
+
+
+def test_get_line_transitions__long_line__is_not_memoized():
+    # given:
+    tiles = (2, 2, None, 4, 4, None, 8, 8)
+
+    # when:
+    transitions = tile_utils.get_line_transitions()
+
+    # then:
+    assert transitions[tiles] == tile_utils.LineTransition(
+        (None, None, None, None, None, 4, 8, 16),
+        reward=28,
+        changed=True,
+        merged_tiles=(16, 8, 4),
+    )
+    assert tiles not in transitions
+
+
+@pytest.mark.parametrize(
+    ["new_tiles"],
+    [
+        pytest.param(constants.DEFAULT_NEW_TILES, id="default"),
+        pytest.param([types.NewTile(2, 0.5), types.NewTile(4, 0.5)], id="list"),
+        pytest.param((types.NewTile(2, 1), types.NewTile(8, 2), types.NewTile(32, 3)), id="custom"),
+    ],
+)
+def test_draw_new_tile__is_consistent_with_random_choices(
+    new_tiles: typing.Sequence[types.NewTile],
+):
+    # given:
+    random.seed(100)
+    expected = [random.choices(*tuple(zip(*new_tiles)))[0] for _ in range(200)]
+
+    # when:
+    random.seed(100)
+    actual = [tile_utils.draw_new_tile(new_tiles) for _ in range(200)]
+
+    # then:
+    assert actual == expected
+
+
+def test_draw_new_tile__respects_new_tiles():
+    new_tiles = (types.NewTile(value=8, weight=1.0), types.NewTile(value=16, weight=0.0))
+    assert {tile_utils.draw_new_tile(new_tiles) for _ in range(100)} == {8}
+
+
+def test_draw_new_tile__compiles_new_tiles_once():
+    # given:
+    new_tiles = (types.NewTile(value=2, weight=0.3), types.NewTile(value=4, weight=0.7))
+    tile_utils._compile_new_tiles.cache_clear()
+
+    # when:
+    for _ in range(10):
+        tile_utils.draw_new_tile(new_tiles)
+        tile_utils.draw_new_tile(constants.DEFAULT_NEW_TILES)
+
+    # then: the default new tiles are precompiled, bypassing the cache
+    cache_info = tile_utils._compile_new_tiles.cache_info()
+    assert (cache_info.misses, cache_info.hits) == (1, 9)
+
+
+@pytest.mark.parametrize(
+    ["new_tiles", "expected"],
+    [
+        pytest.param(
+            constants.DEFAULT_NEW_TILES,
+            (types.NewTile(value=2, weight=0.9), types.NewTile(value=4, weight=0.1)),
+            id="default",
+        ),
+        pytest.param(
+            [types.NewTile(value=2, weight=3), types.NewTile(value=8, weight=1)],
+            (types.NewTile(value=2, weight=0.75), types.NewTile(value=8, weight=0.25)),
+            id="unnormalized",
+        ),
+        pytest.param(
+            [types.NewTile(value=8, weight=1.0), types.NewTile(value=16, weight=0.0)],
+            (types.NewTile(value=8, weight=1.0),),
+            id="impossible-tile",
+        ),
+    ],
+)
+def test_get_new_tile_probabilities(
+    new_tiles: typing.Sequence[types.NewTile], expected: tuple[types.NewTile, ...]
+):
+    # when:
+    probabilities = tile_utils.get_new_tile_probabilities(new_tiles)
+
+    # then:
+    assert [value for value, _ in probabilities] == [value for value, _ in expected]
+    assert [weight for _, weight in probabilities] == pytest.approx(
+        [weight for _, weight in expected]
+    )
+
+
+def test_draw_new_tile__with_rng__is_consistent_with_global_random():
+    # given:
+    random.seed(100)
+    expected = [tile_utils.draw_new_tile() for _ in range(200)]
+
+    # when:
+    rng = random.Random(100)
+    actual = [tile_utils.draw_new_tile(rng=rng) for _ in range(200)]
+
+    # then:
+    assert actual == expected
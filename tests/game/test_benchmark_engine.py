@@ -0,0 +1,57 @@
+"""Benchmarks for `GameEngine`."""
+
+import random
+import typing
+
+import pytest
+
+from python_2048.game import engine, rendering, state, types
+from python_2048.game.lib import board_utils
+from python_2048.players import base
+
+pytestmark = pytest.mark.benchmark
+
+RANDOM_SEED = 1
+
+
+class ScriptedPlayer(base.Player):
+    """A player that slides towards the first legal direction of a fixed order."""
+
+    ORDER = (
+        types.SlideDirection.LEFT,
+        types.SlideDirection.DOWN,
+        types.SlideDirection.RIGHT,
+        types.SlideDirection.UP,
+    )
+
+    def get_next_move(
+        self,
+        board: types.ReadOnlyGameBoard,
+        legal_moves: typing.AbstractSet[types.SlideDirection] | None = None,
+    ) -> types.PlayerDecision:
+        if legal_moves is None:
+            legal_moves = board_utils.get_legal_moves(board)
+
+        direction = next((move for move in self.ORDER if move in legal_moves), self.ORDER[0])
+        return types.PlayerDecision(direction=direction, reason="")
+
+
+@pytest.mark.parametrize(
+    "board_size",
+    [
+        pytest.param(4, id="bitboard"),
+        pytest.param(5, id="board"),
+    ],
+)
+def test_benchmark_start(benchmark: typing.Callable[..., float], board_size: int):
+    # the same seed plays the same game in every call, so that games/sec is comparable
+    def create_state() -> state.GameState:
+        rng = random.Random(RANDOM_SEED)
+        return state.GameState(board_utils.create_new_board(board_size, rng=rng), rng=rng)
+
+    benchmark(
+        lambda state_: engine.GameEngine(state_).start(
+            ScriptedPlayer(), renderer=rendering.DO_NOT_RENDER
+        ),
+        create_state,
+    )
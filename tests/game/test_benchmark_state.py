@@ -0,0 +1,54 @@
+"""Memory benchmarks for `GameState`."""
+
+import random
+import typing
+
+import pytest
+
+from python_2048.game import state, types
+from python_2048.game.lib import board_utils
+
+pytestmark = pytest.mark.benchmark
+
+RANDOM_SEED = 1
+
+
+def create_new_game(rng: random.Random) -> state.GameState:
+    return state.GameState(rng=rng)
+
+
+def create_played_game(rng: random.Random) -> state.GameState:
+    """Create a game that has been played for a few turns, with its caches populated."""
+
+    state_ = state.GameState(rng=rng)
+
+    for direction in list(types.SlideDirection) * 5:
+        state_.slide(direction)
+
+    _ = state_.board, state_.legal_moves(), state_.last_spawn
+    return state_
+
+
+def create_large_game(rng: random.Random) -> state.GameState:
+    return state.GameState(board_utils.create_new_board(5, rng=rng), rng=rng)
+
+
+@pytest.mark.parametrize(
+    ["factory", "budget"],
+    [
+        pytest.param(create_new_game, 170, id="new"),
+        pytest.param(create_played_game, 290, id="played"),
+        pytest.param(create_large_game, 920, id="5x5"),
+    ],
+)
+def test_benchmark_bytes_per_game(
+    memory_benchmark: typing.Callable[..., float],
+    factory: typing.Callable[[random.Random], state.GameState],
+    budget: int,
+):
+    # the generator is shared, as in a search frontier, so that it is not counted per game
+    rng = random.Random(RANDOM_SEED)
+
+    bytes_per_game = memory_benchmark(lambda: factory(rng))
+
+    assert bytes_per_game <= budget
@@ -0,0 +1,344 @@
+"""Unit tests for the batch game engine."""
+
+import copy
+import random
+
+import pytest
+
+from python_2048.game import exceptions, state, types
+from python_2048.game.lib import board_utils, tile_utils
+
+np = pytest.importorskip("numpy")
+batch_engine = pytest.importorskip("python_2048.game.batch_engine")
+
+RANDOM_SEED = 100
+
+MOVE_AND_MERGE = {
+    types.SlideDirection.UP: board_utils.move_and_merge_up,
+    types.SlideDirection.LEFT: board_utils.move_and_merge_left,
+    types.SlideDirection.DOWN: board_utils.move_and_merge_down,
+    types.SlideDirection.RIGHT: board_utils.move_and_merge_right,
+}
+
+
+def _generate_random_boards(number_of_boards: int) -> list[types.GameBoard]:
+    rng = random.Random(RANDOM_SEED)
+    tiles = (None, None, 2, 2, 4, 8, 16, 1024, 2048)
+    return [
+        [[rng.choice(tiles) for _ in range(4)] for __ in range(4)] for _ in range(number_of_boards)
+    ]
+
+
+def _get_reward(board: types.GameBoard, direction: types.SlideDirection) -> int:
+    towards_end = direction in (types.SlideDirection.DOWN, types.SlideDirection.RIGHT)
+    is_vertical = direction in (types.SlideDirection.UP, types.SlideDirection.DOWN)
+    lines = zip(*board) if is_vertical else map(tuple, board)
+    transitions = tile_utils.get_line_transitions(towards_end)
+    return sum(transitions[line].reward for line in lines)
+
+
+def test_init__spawns_initial_tiles():
+    # when:
+    engine = batch_engine.BatchGameEngine(100, seed=RANDOM_SEED, num_initial_tiles=3)
+
+    # then:
+    assert len(engine) == 100
+    assert ((engine.exponents > 0).sum(axis=(1, 2)) == 3).all()
+    assert set(np.unique(engine.exponents)) <= {0, 1, 2}
+
+
+def test_init__same_seed__same_boards():
+    engine_a = batch_engine.BatchGameEngine(10, seed=RANDOM_SEED)
+    engine_b = batch_engine.BatchGameEngine(10, seed=RANDOM_SEED)
+
+    assert (engine_a.exponents == engine_b.exponents).all()
+
+
+def test_from_boards():
+    # given:
+    boards = _generate_random_boards(10)
+
+    # when:
+    engine = batch_engine.BatchGameEngine.from_boards(boards)
+
+    # then:
+    assert [engine.get_board(i) for i in range(len(engine))] == boards
+    assert engine.scores.tolist() == [board_utils.get_score(board) for board in boards]
+    assert engine.has_won().tolist() == [board_utils.has_2048(board) for board in boards]
+
+
+def test_from_boards__not_encodable__raises_board_not_encodable():
+    with pytest.raises(exceptions.BoardNotEncodable):
+        _ = batch_engine.BatchGameEngine.from_boards([[[2, 4, 8]]])
+
+
+def test_exponents__is_read_only():
+    engine = batch_engine.BatchGameEngine(1)
+
+    with pytest.raises(ValueError):
+        engine.exponents[0, 0, 0] = 1
+
+
+@pytest.mark.parametrize(
+    ["board", "expected"],
+    [
+        pytest.param([[None] * 4 for _ in range(4)], True, id="empty-board"),
+        pytest.param(
+            [[2, 4, 2, 4], [4, 2, 4, 2], [2, 4, 2, 4], [4, 2, 4, 2]],
+            True,
+            id="full-board",
+        ),
+        pytest.param(
+            [[2, 4, 2, 4], [4, 2, 4, 2], [2, 4, 2, 4], [4, 2, 4, None]],
+            False,
+            id="moveable",
+        ),
+        pytest.param(
+            [[2, 4, 2, 4], [4, 2, 4, 2], [2, 4, 2, 4], [4, 2, 4, 4]],
+            False,
+            id="horizontally-mergeable",
+        ),
+        pytest.param(
+            [[2, 4, 2, 4], [4, 2, 4, 2], [2, 4, 2, 4], [2, 2, 4, 2]],
+            False,
+            id="vertically-mergeable",
+        ),
+    ],
+)
+def test_is_out_of_moves(board: types.GameBoard, expected: bool):
+    engine = batch_engine.BatchGameEngine.from_boards([board])
+    assert engine.is_out_of_moves().tolist() == [expected]
+
+
+def test_is_out_of_moves__is_consistent_with_board_utils():
+    boards = _generate_random_boards(200)
+    engine = batch_engine.BatchGameEngine.from_boards(boards)
+
+    assert engine.is_out_of_moves().tolist() == list(map(board_utils.is_out_of_moves, boards))
+
+
+def test_move__is_consistent_with_board_utils():
+    # given:
+    rng = random.Random(RANDOM_SEED)
+    boards = _generate_random_boards(400)
+    directions = [rng.choice(batch_engine.DIRECTIONS) for _ in boards]
+
+    engine = batch_engine.BatchGameEngine.from_boards(boards)
+
+    # when:
+    moved, rewards = engine.move(directions)
+
+    # then:
+    for i, (board, direction) in enumerate(zip(boards, directions)):
+        expected = copy.deepcopy(board)
+        assert moved[i] == MOVE_AND_MERGE[direction](expected)
+        assert rewards[i] == _get_reward(board, direction)
+        assert engine.get_board(i) == expected
+
+
+def test_move__with_direction_codes():
+    # given:
+    board: types.GameBoard = [[2, 2, None, None]] + [[None] * 4 for _ in range(3)]
+    engine = batch_engine.BatchGameEngine.from_boards([board, board])
+
+    # when:
+    moved, rewards = engine.move(np.array([1, 3]))
+
+    # then:
+    assert moved.tolist() == [True, True]
+    assert rewards.tolist() == [4, 4]
+    assert engine.get_board(0)[0] == [4, None, None, None]
+    assert engine.get_board(1)[0] == [None, None, None, 4]
+
+
+@pytest.mark.parametrize(
+    ["row", "direction"],
+    [
+        pytest.param([2**15, 2**15, 2, 2], types.SlideDirection.LEFT, id="largest-table-tiles"),
+        pytest.param([2**16, 2**16, 2, 2], types.SlideDirection.LEFT, id="beyond-table"),
+        pytest.param(
+            [None, 2**17, 2**16, 2**16], types.SlideDirection.RIGHT, id="beyond-table-right"
+        ),
+    ],
+)
+def test_move__large_tiles__is_consistent_with_board_utils(
+    row: list[int | None], direction: types.SlideDirection
+):
+    # given: large tiles can only be reached by merges in the engine
+    board: types.GameBoard = [list(row)] + [[2, None, 4, None] for _ in range(3)]
+    engine = batch_engine.BatchGameEngine.from_boards([[[None] * 4 for _ in range(4)]])
+    engine._exponents[0] = [[batch_engine._to_exponent(tile) for tile in row] for row in board]
+
+    expected = copy.deepcopy(board)
+    expected_moved = MOVE_AND_MERGE[direction](expected)
+
+    # when:
+    moved, rewards = engine.move([direction])
+
+    # then:
+    assert moved[0] == expected_moved
+    assert rewards[0] == _get_reward(board, direction)
+    assert engine.get_board(0) == expected
+
+
+def test_move__mismatched_directions__raises_value_error():
+    engine = batch_engine.BatchGameEngine(2)
+
+    with pytest.raises(ValueError):
+        _ = engine.move([types.SlideDirection.UP])
+
+
+@pytest.mark.parametrize(
+    ["directions"],
+    [
+        pytest.param(np.array(["a", "w"]), id="str-array"),
+        pytest.param(np.array([types.SlideDirection.LEFT, "w"], dtype=object), id="object-array"),
+    ],
+)
+def test_move__with_direction_array__maps_directions(directions: "np.ndarray"):
+    # given:
+    board: types.GameBoard = [[None, 2, None, 2]] + [[None] * 4 for _ in range(3)]
+    engine = batch_engine.BatchGameEngine.from_boards([board, board])
+
+    # when:
+    moved, _ = engine.move(directions)
+
+    # then:
+    assert moved.tolist() == [True, False]
+    assert engine.get_board(0)[0] == [4, None, None, None]
+
+
+@pytest.mark.parametrize(
+    ["directions"],
+    [
+        pytest.param(np.array([7, 9]), id="out-of-range"),
+        pytest.param(np.array([-1, 0]), id="negative"),
+        pytest.param(np.array(["x", "a"]), id="unknown-key"),
+        pytest.param(
+            np.array([types.SlideDirection.LEFT, types.SlideDirection.UP]),
+            id="str-enum-array",  # numpy truncates the members to their class names
+        ),
+        pytest.param(np.array([True, False]), id="bool-array"),
+    ],
+)
+def test_move__invalid_directions__raises_value_error(directions: "np.ndarray"):
+    engine = batch_engine.BatchGameEngine(2)
+
+    with pytest.raises(ValueError):
+        _ = engine.move(directions)
+
+
+def test_spawn__mismatched_mask__raises_value_error():
+    engine = batch_engine.BatchGameEngine(2, num_initial_tiles=0)
+
+    with pytest.raises(ValueError):
+        _ = engine.spawn(np.array([True]))
+
+
+def test_init__both_seed_and_python_rng__raises_value_error():
+    with pytest.raises(ValueError):
+        _ = batch_engine.BatchGameEngine(1, seed=RANDOM_SEED, python_rng=random.Random())
+
+
+def test_step__with_python_rng__is_consistent_with_game_state():
+    # given:
+    board: types.GameBoard = [[2, None, None, None], [None] * 4, [None, None, 4, None], [None] * 4]
+    engine = batch_engine.BatchGameEngine.from_boards(
+        [board], python_rng=random.Random(RANDOM_SEED)
+    )
+
+    random.seed(RANDOM_SEED)
+    game_state = state.GameState(board)
+    rng = random.Random(RANDOM_SEED)
+
+    for _ in range(300):
+        if game_state.is_out_of_moves():
+            break
+
+        # when:
+        direction = rng.choice(batch_engine.DIRECTIONS)
+        result = engine.step([direction])
+
+        # then:
+        assert result.moved[0] == game_state.slide(direction)
+        assert engine.get_board(0) == game_state.copy_board()
+        assert engine.scores[0] == game_state.score
+
+
+def test_spawn__with_python_rng__skips_full_boards():
+    # given:
+    full_board: types.GameBoard = [[2, 4, 2, 4], [4, 2, 4, 2], [2, 4, 2, 4], [4, 2, 4, 2]]
+    engine = batch_engine.BatchGameEngine.from_boards([full_board], python_rng=random.Random())
+
+    # when:
+    score_deltas = engine.spawn(np.array([True]))
+
+    # then:
+    assert score_deltas.tolist() == [0]
+    assert engine.get_board(0) == full_board
+
+
+def test_spawn__only_on_selected_boards_with_empty_tiles():
+    # given:
+    full_board: types.GameBoard = [[2, 4, 2, 4], [4, 2, 4, 2], [2, 4, 2, 4], [4, 2, 4, 2]]
+    empty_board: types.GameBoard = [[None] * 4 for _ in range(4)]
+    engine = batch_engine.BatchGameEngine.from_boards(
+        [full_board, empty_board, empty_board],
+        seed=RANDOM_SEED,
+    )
+
+    # when:
+    score_deltas = engine.spawn(np.array([True, True, False]))
+
+    # then:
+    assert engine.get_board(0) == full_board
+    assert engine.scores[1] == score_deltas[1] > 0
+    assert engine.get_board(2) == empty_board
+    assert score_deltas[[0, 2]].tolist() == [0, 0]
+
+
+def test_spawn__respects_new_tiles():
+    # given:
+    new_tiles = (types.NewTile(value=8, weight=1.0),)
+    engine = batch_engine.BatchGameEngine(1000, seed=RANDOM_SEED, new_tiles=new_tiles)
+
+    # then:
+    assert (engine.scores == 16).all()
+
+
+def test_step__same_seed__same_outcomes():
+    # given:
+    engine_a = batch_engine.BatchGameEngine(100, seed=RANDOM_SEED)
+    engine_b = batch_engine.BatchGameEngine(100, seed=RANDOM_SEED)
+    directions = [batch_engine.DIRECTIONS[i % 4] for i in range(100)]
+
+    # when:
+    result_a = engine_a.step(directions)
+    result_b = engine_b.step(directions)
+
+    # then:
+    for outcome_a, outcome_b in zip(result_a, result_b):
+        assert (outcome_a == outcome_b).all()
+
+    assert (engine_a.exponents == engine_b.exponents).all()
+
+
+def test_step__plays_until_all_games_end():
+    # given:
+    engine = batch_engine.BatchGameEngine(50, seed=RANDOM_SEED)
+    rng = np.random.default_rng(RANDOM_SEED)
+    scores = engine.scores
+    lost = engine.is_out_of_moves()
+
+    # when:
+    while not lost.all():
+        result = engine.step(rng.integers(0, 4, size=len(engine)))
+        scores = scores + result.score_deltas
+        lost = result.lost
+
+        # then: new tiles are only spawned on moved boards
+        assert ((result.score_deltas > 0) == result.moved).all()
+        assert (result.won == engine.has_won()).all()
+
+    # then:
+    assert (scores == engine.scores).all()
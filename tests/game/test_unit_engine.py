@@ -2,8 +2,10 @@
 
 from unittest import mock
 
+import pytest
+
 from python_2048.game import engine as game_engine
-from python_2048.game import rendering
+from python_2048.game import rendering, replay, timing, types
 from python_2048.game import state as game_state
 from python_2048.players import base as base_player
 
@@ -54,3 +56,75 @@ def test_start__play_until_out_of_moves__returns_false():
 
     # then:
     assert not has_won
+
+
+def test_start__passes_legal_moves_to_player():
+    # given:
+    state = mock.Mock(spec_set=game_state.GameState)
+    state.has_won.return_value = False
+    state.is_out_of_moves.side_effect = [False, True]
+
+    player = mock.Mock(spec_set=base_player.Player)
+    game = game_engine.GameEngine(state)
+
+    # when:
+    _ = game.start(player, renderer=rendering.DO_NOT_RENDER)
+
+    # then:
+    player.get_next_move.assert_called_once_with(state.board, state.legal_moves.return_value)
+
+
+@pytest.mark.parametrize(
+    ["records_spawns", "expected_spawn"],
+    [
+        pytest.param(True, types.Spawn(0, 1, 2), id="with-spawns"),
+        pytest.param(False, None, id="without-spawns"),
+    ],
+)
+def test_start__records_effective_moves(records_spawns: bool, expected_spawn: types.Spawn | None):
+    # given:
+    state = mock.Mock(spec_set=game_state.GameState)
+    state.has_won.return_value = False
+    state.is_out_of_moves.side_effect = [False, False, True]
+    state.slide.side_effect = [True, False]
+    state.last_spawn = types.Spawn(0, 1, 2)
+
+    player = mock.Mock(spec_set=base_player.Player)
+    player.get_next_move.return_value = types.PlayerDecision(
+        direction=types.SlideDirection.UP, reason=""
+    )
+
+    recorder = mock.Mock(spec_set=replay.ReplayRecorder)
+    recorder.records_spawns = records_spawns
+    game = game_engine.GameEngine(state, recorder=recorder)
+
+    # when:
+    _ = game.start(player, renderer=rendering.DO_NOT_RENDER)
+
+    # then: the ineffective move is not recorded
+    recorder.record.assert_called_once_with(types.SlideDirection.UP, expected_spawn)
+
+
+def test_start__with_phase_timer__times_every_phase():
+    # given:
+    state = mock.Mock(spec_set=game_state.GameState)
+    state.has_won.return_value = False
+    state.is_out_of_moves.side_effect = [False, False, True]
+
+    player = mock.Mock(spec_set=base_player.Player)
+    timer = timing.PhaseTimer()
+    game = game_engine.GameEngine(state, phase_timer=timer)
+
+    # when:
+    _ = game.start(player, renderer=rendering.DO_NOT_RENDER)
+
+    # then:
+    assert {phase: phase_timing.num_calls for phase, phase_timing in timer.timings().items()} == {
+        timing.Phase.ON_START: 3,
+        timing.Phase.HAS_WON: 3,
+        timing.Phase.IS_OUT_OF_MOVES: 3,
+        timing.Phase.LEGAL_MOVES: 2,
+        timing.Phase.GET_NEXT_MOVE: 2,
+        timing.Phase.AFTER_NEXT_MOVE: 2,
+        timing.Phase.SLIDE: 2,
+    }
@@ -0,0 +1,374 @@
+"""Unit tests for `replay`."""
+
+import copy
+import io
+import random
+from unittest import mock
+
+import pytest
+
+from python_2048.game import engine, exceptions, rendering, replay, state, types
+from python_2048.game.lib import random_utils
+from python_2048.players import random_moves
+
+RANDOM_SEED = 100
+
+IRREGULAR_BOARD: types.GameBoard = [[None, 8, 2, 2, 4], [4, 2, None, 2, 4], [2, None, None, 4, 8]]
+
+
+def record_game(
+    board: types.GameBoard | None = None,
+    *,
+    rng: random.Random | None = None,
+    record_spawns: bool = True,
+) -> tuple[bytes, state.GameState]:
+    """Play a game by random moves, and return its replay with the final state."""
+
+    file = io.BytesIO()
+    state_ = state.GameState(copy.deepcopy(board), rng=rng)
+    recorder = replay.ReplayRecorder(file, state_.board, rng=rng, record_spawns=record_spawns)
+
+    engine.GameEngine(state_, recorder=recorder).start(
+        random_moves.RandomPlayer(seed=RANDOM_SEED), renderer=rendering.DO_NOT_RENDER
+    )
+
+    return file.getvalue(), state_
+
+
+def read(data: bytes) -> replay.Replay:
+    return replay.read_replay(io.BytesIO(data))
+
+
+def header(fields: bytes) -> bytes:
+    return bytes((len(fields),)) + fields
+
+
+@pytest.mark.parametrize(
+    ["board", "rng", "record_spawns"],
+    [
+        pytest.param(None, random_utils.CounterRandom(RANDOM_SEED), True, id="counter-spawns"),
+        pytest.param(None, random_utils.CounterRandom(RANDOM_SEED), False, id="counter-moves"),
+        pytest.param(None, random.Random(RANDOM_SEED), False, id="mersenne"),
+        pytest.param(
+            IRREGULAR_BOARD, random_utils.CounterRandom(RANDOM_SEED), True, id="irregular-spawns"
+        ),
+        pytest.param(
+            IRREGULAR_BOARD, random_utils.CounterRandom(RANDOM_SEED), False, id="irregular-moves"
+        ),
+    ],
+)
+def test_play_back__reproduces_recorded_game(
+    board: types.GameBoard | None, rng: random.Random, record_spawns: bool
+):
+    # given:
+    data, state_ = record_game(board, rng=rng, record_spawns=record_spawns)
+
+    # when:
+    result = replay.play_back(read(data), verify=True)
+
+    # then:
+    assert result.board == state_.board
+    assert result.score == state_.score
+    assert result.max_tile == state_.max_tile
+    assert result.num_moves > 10
+
+
+def test_record__takes_one_byte_per_move():
+    # given:
+    data, _ = record_game(rng=random_utils.CounterRandom(RANDOM_SEED))
+    recorded = read(data)
+
+    # then:
+    assert data.startswith(replay.MAGIC)
+    assert len(data) - data.index(b"}") - 1 == len(recorded.turns)
+    assert all(turn.spawn is not None for turn in recorded.turns)
+
+
+def test_record__without_spawn__raises_value_error():
+    # given:
+    recorder = replay.ReplayRecorder(io.BytesIO(), [[None, 2]])
+
+    # then:
+    with pytest.raises(ValueError):
+        recorder.record(types.SlideDirection.LEFT)
+
+    with pytest.raises(ValueError):
+        recorder.record(types.SlideDirection.LEFT, types.Spawn(0, 1, 3))
+
+
+def test_record__large_board__spans_multiple_bytes():
+    # given:
+    file = io.BytesIO()
+    board: types.GameBoard = [[None] * 6 for _ in range(6)]
+    recorder = replay.ReplayRecorder(file, board)
+
+    # when:
+    recorder.record(types.SlideDirection.RIGHT, types.Spawn(5, 5, 4))
+
+    # then:
+    assert read(file.getvalue()).turns == [
+        replay.Turn(types.SlideDirection.RIGHT, types.Spawn(5, 5, 4))
+    ]
+
+
+def test_play_back__overflowing_bitboard__continues_on_board():
+    # given:
+    file = io.BytesIO()
+    board: types.GameBoard = [
+        [2**14, 2**14, None, None],
+        [None, None, None, None],
+        [None, None, None, None],
+        [None, None, None, None],
+    ]
+    recorder = replay.ReplayRecorder(file, board)
+    recorder.record(types.SlideDirection.LEFT, types.Spawn(3, 3, 2))
+    recorder.record(types.SlideDirection.RIGHT, types.Spawn(0, 0, 4))
+
+    # when:
+    result = replay.play_back(read(file.getvalue()))
+
+    # then:
+    assert result.board == (
+        (4, None, None, 2**15),
+        (None, None, None, None),
+        (None, None, None, None),
+        (None, None, None, 2),
+    )
+    assert result.num_moves == 2
+
+
+@pytest.mark.parametrize(
+    ["board"],
+    [
+        pytest.param(None, id="bitboard"),
+        pytest.param(IRREGULAR_BOARD, id="board"),
+    ],
+)
+def test_play_back__tampered_spawn__raises_replay_diverged(board: types.GameBoard | None):
+    # given:
+    data, _ = record_game(board, rng=random_utils.CounterRandom(RANDOM_SEED))
+    recorded = read(data)
+
+    # the last spawn is altered, so that the moves stay effective without verification
+    last_index = len(recorded.turns) - 1
+    recorded.turns[last_index] = alter_spawn(recorded, last_index)
+
+    # then:
+    assert replay.play_back(recorded).num_moves == len(recorded.turns)
+
+    with pytest.raises(exceptions.ReplayDiverged) as error:
+        replay.play_back(recorded, verify=True)
+
+    assert error.value.move_index == last_index
+
+
+@pytest.mark.parametrize(
+    ["board"],
+    [
+        pytest.param(None, id="bitboard"),
+        pytest.param(IRREGULAR_BOARD, id="board"),
+    ],
+)
+def test_play_back__spawn_onto_tile__raises_invalid_replay(board: types.GameBoard | None):
+    # given:
+    data, _ = record_game(board, rng=random_utils.CounterRandom(RANDOM_SEED))
+    recorded = read(data)
+    recorded.turns[0] = recorded.turns[0]._replace(spawn=types.Spawn(*find_tile(recorded), 2))
+
+    # then:
+    with pytest.raises(exceptions.InvalidReplay):
+        replay.play_back(recorded)
+
+
+@pytest.mark.parametrize(
+    ["board"],
+    [
+        pytest.param([[2, None, None, None]] + [[None] * 4] * 3, id="bitboard"),
+        pytest.param([[2, None, None]], id="board"),
+    ],
+)
+def test_play_back__ineffective_move__raises_invalid_replay(board: types.GameBoard):
+    # given:
+    file = io.BytesIO()
+    recorder = replay.ReplayRecorder(file, board)
+    recorder.record(types.SlideDirection.LEFT, types.Spawn(0, 1, 2))
+
+    # then:
+    with pytest.raises(exceptions.InvalidReplay):
+        replay.play_back(read(file.getvalue()))
+
+
+@pytest.mark.parametrize(
+    ["data"],
+    [
+        pytest.param(b"not-a-replay", id="magic"),
+        pytest.param(replay.MAGIC + b"\x85", id="truncated-length"),
+        pytest.param(replay.MAGIC + b"\x02{}", id="missing-fields"),
+        pytest.param(replay.MAGIC + b"\x02[[", id="malformed-header"),
+        pytest.param(
+            replay.MAGIC + header(b'{"board":[[null]],"rng":null,"spawns":false}'),
+            id="nothing-to-replay",
+        ),
+        pytest.param(
+            replay.MAGIC + header(b'{"board":[[null]],"rng":[1,0],"spawns":false}') + b"\x04",
+            id="invalid-direction",
+        ),
+        pytest.param(
+            replay.MAGIC
+            + header(b'{"board":[[null,null,null]],"rng":null,"spawns":true}')
+            + b"\x0c",
+            id="spawn-off-board",
+        ),
+        pytest.param(
+            replay.MAGIC + header(b'{"board":[[null]],"rng":null,"spawns":true}') + b"\x80",
+            id="truncated-move",
+        ),
+    ],
+)
+def test_read_replay__invalid__raises_invalid_replay(data: bytes):
+    with pytest.raises(exceptions.InvalidReplay):
+        read(data)
+
+
+def test_replay_cursor__restore():
+    # given:
+    data, state_ = record_game(rng=random_utils.CounterRandom(RANDOM_SEED))
+    recorded = read(data)
+    cursor = replay.ReplayCursor(recorded)
+
+    for _ in range(10):
+        cursor.step()
+
+    board = cursor.board
+
+    # when: restored from a board known after 10 moves
+    other_cursor = replay.ReplayCursor(recorded)
+    other_cursor.restore(board, 10)
+
+    while other_cursor.step():
+        pass
+
+    # then:
+    assert other_cursor.board == state_.board
+    assert other_cursor.move_index == other_cursor.num_moves == len(recorded.turns)
+
+
+def alter_spawn(recorded: replay.Replay, move_index: int) -> replay.Turn:
+    """Swap the spawn of a move for another one on the same empty tile."""
+
+    turn = recorded.turns[move_index]
+    assert turn.spawn is not None
+    return turn._replace(spawn=turn.spawn._replace(value=6 - turn.spawn.value))
+
+
+def find_tile(recorded: replay.Replay) -> tuple[int, int]:
+    """Find a tile that is occupied right after the first move, before its spawn."""
+
+    cursor = replay.ReplayCursor(recorded)
+    cursor.step()
+    spawn = recorded.turns[0].spawn
+
+    return next(
+        (row_index, column_index)
+        for row_index, row in enumerate(cursor.board)
+        for column_index, tile in enumerate(row)
+        if tile is not None and spawn and (row_index, column_index) != spawn[:2]
+    )
+
+
+def record_boards(recorded: replay.Replay) -> list[types.FrozenGameBoard]:
+    """Play every move of a replay, and return the game board after every move."""
+
+    cursor = replay.ReplayCursor(recorded)
+    boards = [cursor.board]
+
+    while cursor.step():
+        boards.append(cursor.board)
+
+    return boards
+
+
+def test_build_keyframes():
+    # given:
+    data, _ = record_game(rng=random_utils.CounterRandom(RANDOM_SEED))
+    recorded = read(data)
+    boards = record_boards(recorded)
+
+    # when:
+    keyframes = replay.build_keyframes(recorded, interval=7)
+
+    # then:
+    assert keyframes.interval == 7
+    assert keyframes.boards == boards[::7]
+
+
+@pytest.mark.parametrize(
+    ["interval", "record_spawns"],
+    [
+        pytest.param(None, True, id="no-keyframes"),
+        pytest.param(1, True, id="every-move"),
+        pytest.param(7, True, id="spawns"),
+        pytest.param(7, False, id="moves"),
+    ],
+)
+def test_replay_cursor__seek(interval: int | None, record_spawns: bool):
+    # given:
+    data, _ = record_game(rng=random_utils.CounterRandom(RANDOM_SEED), record_spawns=record_spawns)
+    recorded = read(data)
+    boards = record_boards(recorded)
+    keyframes = replay.build_keyframes(recorded, interval=interval) if interval else None
+    cursor = replay.ReplayCursor(recorded, verify=True)
+
+    # when: seeking forwards, backwards, and out of the bounds
+    for move_index in [20, 22, 21, 3, 0, len(boards) - 1, 15, -5, len(boards) + 5]:
+        cursor.seek(move_index, keyframes)
+
+        # then:
+        expected_index = min(max(move_index, 0), len(boards) - 1)
+        assert cursor.move_index == expected_index
+        assert cursor.board == boards[expected_index]
+
+
+def test_replay_cursor__seek__plays_at_most_interval_moves():
+    # given:
+    data, _ = record_game(rng=random_utils.CounterRandom(RANDOM_SEED))
+    recorded = read(data)
+    keyframes = replay.build_keyframes(recorded, interval=4)
+    cursor = replay.ReplayCursor(recorded)
+    cursor.seek(30, keyframes)
+
+    # when:
+    with mock.patch.object(cursor, "step", wraps=cursor.step) as step:
+        cursor.seek(29, keyframes)
+
+    # then:
+    assert step.call_count == 29 % 4
+
+
+def test_write_keyframes__then_read():
+    # given:
+    data, _ = record_game(rng=random_utils.CounterRandom(RANDOM_SEED))
+    keyframes = replay.build_keyframes(read(data), interval=5)
+    file = io.StringIO()
+
+    # when:
+    replay.write_keyframes(file, keyframes, replay_digest="digest")
+    file.seek(0)
+
+    # then:
+    assert replay.read_keyframes(file, replay_digest="digest") == keyframes
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        pytest.param("[", id="not-json"),
+        pytest.param('{"replay":"digest","boards":[]}', id="no-interval"),
+        pytest.param('{"replay":"other","interval":1,"boards":[[[2]]]}', id="other-replay"),
+        pytest.param('{"replay":"digest","interval":0,"boards":[[[2]]]}', id="zero-interval"),
+        pytest.param('{"replay":"digest","interval":1,"boards":[]}', id="no-boards"),
+    ],
+)
+def test_read_keyframes__invalid__raises_invalid_replay(text: str):
+    with pytest.raises(exceptions.InvalidReplay):
+        replay.read_keyframes(io.StringIO(text), replay_digest="digest")
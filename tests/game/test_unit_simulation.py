@@ -0,0 +1,96 @@
+"""Unit tests for `simulation`."""
+
+import pathlib
+import random
+
+import pytest
+
+from python_2048.game import replay, simulation
+from python_2048.game.lib import random_utils
+from python_2048.players import random_moves
+
+
+def test_play_game__recorded(tmp_path: pathlib.Path):
+    # given:
+    record_path = tmp_path / "game.replay"
+
+    # when:
+    result = simulation.play_game(
+        random_moves.RandomPlayer(seed=1),
+        rng=random_utils.CounterRandom(1),
+        record_path=record_path,
+    )
+
+    # then:
+    with record_path.open("rb") as file:
+        replayed = replay.play_back(replay.read_replay(file), verify=True)
+
+    assert replayed.num_moves == result.num_moves
+    assert (replayed.score, replayed.max_tile) == (result.score, result.max_tile)
+
+
+def test_play_game():
+    # when:
+    result = simulation.play_game(random_moves.RandomPlayer(seed=1), rng=random.Random(1))
+
+    # then:
+    assert not result.won
+    assert result.num_moves > 0
+    assert result.max_tile <= result.score
+    assert result == simulation.play_game(random_moves.RandomPlayer(seed=1), rng=random.Random(1))
+
+
+@pytest.mark.parametrize(
+    ["results", "expected"],
+    [
+        pytest.param(
+            [],
+            simulation.SimulationSummary(0, 0, 0, {}, {}),
+            id="no-games",
+        ),
+        pytest.param(
+            [simulation.GameResult(100, 32, False, 50)],
+            simulation.SimulationSummary(
+                1, 0, 50, {10: 100, 25: 100, 50: 100, 75: 100, 90: 100}, {32: 1}
+            ),
+            id="one-game",
+        ),
+        pytest.param(
+            [
+                simulation.GameResult(score, max_tile, max_tile == 2048, 10)
+                for score, max_tile in [
+                    (400, 128),
+                    (2100, 2048),
+                    (100, 32),
+                    (300, 128),
+                ]
+            ],
+            simulation.SimulationSummary(
+                4, 1, 40, {10: 100, 25: 100, 50: 300, 75: 400, 90: 2100}, {32: 1, 128: 2, 2048: 1}
+            ),
+            id="many-games",
+        ),
+    ],
+)
+def test_summarize(results: list[simulation.GameResult], expected: simulation.SimulationSummary):
+    # when:
+    summary = simulation.summarize(results)
+
+    # then:
+    assert summary == expected
+    assert list(summary.max_tiles) == sorted(summary.max_tiles)
+
+
+@pytest.mark.parametrize(
+    ["num_games", "num_wins", "expected"],
+    [
+        pytest.param(0, 0, 0.0, id="no-games"),
+        pytest.param(4, 1, 0.25, id="some-wins"),
+    ],
+)
+def test_win_rate(num_games: int, num_wins: int, expected: float):
+    # when:
+    summary = simulation.SimulationSummary(num_games, num_wins, 0, {}, {})
+
+    # then:
+    assert summary.win_rate == expected
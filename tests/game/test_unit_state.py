@@ -1,9 +1,16 @@
 """Unit tests of the `GameState`."""
 
+import copy
+import random
+import typing
 from unittest import mock
 
+import pytest
+
 from python_2048.game import state, types
-from python_2048.game.lib import board_utils
+from python_2048.game.lib import bitboard_utils, board_utils
+
+RANDOM_SEED = 100
 
 
 def test_init__with_board__uses_provided_board():
@@ -14,7 +21,7 @@ def test_init__with_board__uses_provided_board():
     game_state = state.GameState(board)
 
     # then:
-    assert game_state.board == board
+    assert game_state.copy_board() == board
 
 
 @mock.patch.object(board_utils, "create_new_board")
@@ -27,71 +34,164 @@ def test_init__without_board__creates_new_board(mock_create_new_board: mock.Magi
     game_state = state.GameState()
 
     # then:
-    assert game_state.board == board
+    assert game_state.copy_board() == board
+
+
+@pytest.mark.parametrize(
+    "board",
+    [
+        pytest.param(None, id="bitboard"),
+        pytest.param([[2, None, 4]], id="board"),
+    ],
+)
+def test_init__has_no_instance_dict(board: types.GameBoard | None):
+    # when:
+    game_state = state.GameState(board)
 
+    # then: every attribute is slotted
+    assert not hasattr(game_state, "__dict__")
 
-def test_board__mutation__has_no_effect():
+    with pytest.raises(AttributeError):
+        game_state.unknown = 1  # type: ignore[attr-defined]
+
+
+def test_board__is_immutable():
     # given:
     board: types.GameBoard = [[1, 2, 3]]
     game_state = state.GameState(board)
 
     # when:
-    game_state.board[0][0] = None
+    with pytest.raises(TypeError):
+        game_state.board[0][0] = None  # type: ignore
 
     # then:
-    assert game_state.board == [[1, 2, 3]]
+    assert game_state.board == ((1, 2, 3),)
 
 
-@mock.patch.object(board_utils, "get_score")
-def test_score(mock_get_score: mock.MagicMock):
+def test_board__is_cached_until_mutation():
     # given:
-    board = mock.MagicMock()
+    board: types.GameBoard = [[2, None, None, None]] + [[None] * 4 for _ in range(3)]
     game_state = state.GameState(board)
+    snapshot = game_state.board
 
     # when:
-    assert game_state.score == mock_get_score.return_value
+    assert game_state.board is snapshot
+    assert game_state.slide(types.SlideDirection.RIGHT)
+
+    # then:
+    assert game_state.board is not snapshot
+    assert game_state.board[0][3] == 2
 
 
-def test_has_won__when_reached_2048__returns_true():
+def test_copy_board__mutation__has_no_effect():
     # given:
-    board = mock.MagicMock()
+    board: types.GameBoard = [[1, 2, 3]]
     game_state = state.GameState(board)
 
     # when:
-    with mock.patch.object(board_utils, "has_2048", return_value=True, autospec=True):
-        assert game_state.has_won()
+    game_state.copy_board()[0][0] = None
+
+    # then:
+    assert game_state.copy_board() == [[1, 2, 3]]
 
 
-def test_has_won__when_not_reached_2048__returns_false():
+@mock.patch.object(board_utils, "summarize")
+def test_score(mock_summarize: mock.MagicMock):
     # given:
     board = mock.MagicMock()
-    game_state = state.GameState(board)
+    mock_summarize.return_value = board_utils.BoardSummary(score=6, max_tile=4, num_empty_tiles=1)
 
     # when:
-    with mock.patch.object(board_utils, "has_2048", return_value=False, autospec=True):
-        assert not game_state.has_won()
+    game_state = state.GameState(board)
+
+    # then:
+    assert game_state.score == 6
+    assert game_state.max_tile == 4
+    assert game_state.num_empty_tiles == 1
+    mock_summarize.assert_called_once_with(board)
+
+
+@pytest.mark.parametrize(
+    ["board", "expected"],
+    [
+        pytest.param([[2048, None, 2]], True, id="2048"),
+        pytest.param([[4096, 2048, 2]], True, id="2048-below-max-tile"),
+        pytest.param([[1024, None, 2]], False, id="below-2048"),
+        pytest.param([[4096, None, 2]], False, id="above-2048"),
+    ],
+)
+def test_has_won(board: types.GameBoard, expected: bool):
+    game_state = state.GameState(board)
+    assert game_state.has_won() == expected
 
 
-def test_is_out_of_moves__returns_true():
+def test_is_out_of_moves__no_legal_moves__returns_true():
     # given:
     board = mock.MagicMock()
     game_state = state.GameState(board)
 
     # when:
-    with mock.patch.object(board_utils, "is_out_of_moves", return_value=True, autospec=True):
+    with mock.patch.object(board_utils, "get_legal_moves", return_value=frozenset()):
         assert game_state.is_out_of_moves()
 
 
-def test_is_out_of_moves__returns_false():
+def test_is_out_of_moves__with_legal_moves__returns_false():
     # given:
     board = mock.MagicMock()
     game_state = state.GameState(board)
 
     # when:
-    with mock.patch.object(board_utils, "is_out_of_moves", return_value=False, autospec=True):
+    with mock.patch.object(
+        board_utils, "get_legal_moves", return_value=frozenset({types.SlideDirection.UP})
+    ):
         assert not game_state.is_out_of_moves()
 
 
+@pytest.mark.parametrize(
+    ["board", "expected"],
+    [
+        pytest.param(
+            [[None, 8, 2, 2], [4, 2, None, 2], [None, None, None, None], [None, None, None, 2]],
+            frozenset(types.SlideDirection),
+            id="regular-board",
+        ),
+        pytest.param(
+            [[2, 4, 2, 4], [4, 2, 4, 2], [2, 4, 2, 4], [4, 2, 4, None]],
+            frozenset({types.SlideDirection.DOWN, types.SlideDirection.RIGHT}),
+            id="regular-board-one-empty-tile",
+        ),
+        pytest.param(
+            [[2, 4, 2], [None, 2, 4]],
+            frozenset({types.SlideDirection.LEFT, types.SlideDirection.DOWN}),
+            id="irregular-board",
+        ),
+        pytest.param([[2, 4, 2], [4, 2, 4]], frozenset(), id="irregular-board-out-of-moves"),
+    ],
+)
+def test_legal_moves(board: types.GameBoard, expected: frozenset[types.SlideDirection]):
+    game_state = state.GameState(board)
+    assert game_state.legal_moves() == expected
+
+
+def test_legal_moves__is_cached_until_mutation():
+    # given:
+    board: types.GameBoard = [[2, 2, None, None]] + [[None] * 4 for _ in range(3)]
+    game_state = state.GameState(board)
+    legal_moves = game_state.legal_moves()
+
+    # then:
+    assert game_state.legal_moves() is legal_moves
+
+    # when:
+    game_state.slide_left()
+
+    # then:
+    assert game_state.legal_moves() is not legal_moves
+    assert game_state.legal_moves() == bitboard_utils.get_legal_moves(
+        bitboard_utils.encode(game_state.copy_board())
+    )
+
+
 @mock.patch.object(state.GameState, "slide_up")
 def test_slide__upward__calls_slide_up(mock_slide_up: mock.MagicMock):
     # given:
@@ -148,145 +248,323 @@ def test_slide__right_direction__calls_slide_right(mock_slide_right: mock.MagicM
     assert succeeded == mock_slide_right.return_value
 
 
-@mock.patch.object(board_utils, "spawn_new_tile")
-@mock.patch.object(board_utils, "move_and_merge_up")
-def test_slide_up__when_effective__spawns_new_tile(
-    mock_move_and_merge_up: mock.MagicMock,
-    mock_spawn_new_tile: mock.MagicMock,
+SLIDES = [
+    pytest.param(state.GameState.slide_up, types.SlideDirection.UP, id="up"),
+    pytest.param(state.GameState.slide_left, types.SlideDirection.LEFT, id="left"),
+    pytest.param(state.GameState.slide_down, types.SlideDirection.DOWN, id="down"),
+    pytest.param(state.GameState.slide_right, types.SlideDirection.RIGHT, id="right"),
+]
+
+
+@pytest.mark.parametrize(["slide", "direction"], SLIDES)
+@mock.patch.object(board_utils, "draw_spawn")
+@mock.patch.object(board_utils, "move_and_merge")
+def test_slide__when_effective__spawns_new_tile(
+    mock_move_and_merge: mock.MagicMock,
+    mock_draw_spawn: mock.MagicMock,
+    slide: typing.Callable[[state.GameState], bool],
+    direction: types.SlideDirection,
 ):
     # given:
     board = mock.MagicMock()
     game_state = state.GameState(board)
-    mock_move_and_merge_up.return_value = True
+    mock_move_and_merge.return_value = board_utils.MoveOutcome(
+        changed=True, reward=4, merged_tiles=(4,)
+    )
+    mock_draw_spawn.return_value = types.Spawn(row=1, column=2, value=2)
 
     # when:
-    assert game_state.slide_up()
+    assert slide(game_state)
 
     # then:
-    mock_spawn_new_tile.assert_called_once_with(board)
-
-
-@mock.patch.object(board_utils, "spawn_new_tile")
-@mock.patch.object(board_utils, "move_and_merge_up")
-def test_slide_up__when_not_effective__does_not_spawn_new_tile(
-    mock_move_and_merge_up: mock.MagicMock,
-    mock_spawn_new_tile: mock.MagicMock,
+    mock_move_and_merge.assert_called_once_with(board, direction)
+    mock_draw_spawn.assert_called_once_with(board, num_empty_tiles=1, rng=None)
+    board[1].__setitem__.assert_called_once_with(2, 2)
+    assert game_state.last_spawn == types.Spawn(row=1, column=2, value=2)
+    assert game_state.score == 2
+    assert game_state.max_tile == 4
+    assert game_state.num_empty_tiles == 0
+
+
+@pytest.mark.parametrize(["slide", "direction"], SLIDES)
+@mock.patch.object(board_utils, "draw_spawn")
+@mock.patch.object(board_utils, "move_and_merge")
+def test_slide__when_not_effective__does_not_spawn_new_tile(
+    mock_move_and_merge: mock.MagicMock,
+    mock_draw_spawn: mock.MagicMock,
+    slide: typing.Callable[[state.GameState], bool],
+    direction: types.SlideDirection,
 ):
     # given:
     board = mock.MagicMock()
     game_state = state.GameState(board)
-    mock_move_and_merge_up.return_value = False
+    mock_move_and_merge.return_value = board_utils.MoveOutcome(
+        changed=False, reward=0, merged_tiles=()
+    )
 
     # when:
-    assert not game_state.slide_up()
+    assert not slide(game_state)
 
     # then:
-    mock_spawn_new_tile.assert_not_called()
+    mock_move_and_merge.assert_called_once_with(board, direction)
+    mock_draw_spawn.assert_not_called()
 
 
-@mock.patch.object(board_utils, "spawn_new_tile")
-@mock.patch.object(board_utils, "move_and_merge_left")
-def test_slide_left__when_effective__spawns_new_tile(
-    mock_move_and_merge_left: mock.MagicMock,
-    mock_spawn_new_tile: mock.MagicMock,
-):
+@mock.patch.object(board_utils, "draw_spawn", return_value=None)
+def test_slide__when_no_tile_spawned__keeps_summary(mock_draw_spawn: mock.MagicMock):
     # given:
-    board = mock.MagicMock()
-    game_state = state.GameState(board)
-    mock_move_and_merge_left.return_value = True
+    game_state = state.GameState([[2, 2, 4]])
 
     # when:
     assert game_state.slide_left()
 
     # then:
-    mock_spawn_new_tile.assert_called_once_with(board)
+    mock_draw_spawn.assert_called_once()
+    assert game_state.last_spawn is None
+    assert (game_state.score, game_state.max_tile, game_state.num_empty_tiles) == (8, 4, 1)
 
 
-@mock.patch.object(board_utils, "spawn_new_tile")
-@mock.patch.object(board_utils, "move_and_merge_left")
-def test_slide_left__when_not_effective__does_not_spawn_new_tile(
-    mock_move_and_merge_left: mock.MagicMock,
-    mock_spawn_new_tile: mock.MagicMock,
-):
+def test_init__with_regular_board__uses_bitboard():
     # given:
-    board = mock.MagicMock()
-    game_state = state.GameState(board)
-    mock_move_and_merge_left.return_value = False
+    board: types.GameBoard = [
+        [None, 8, 2, 2],
+        [4, 2, None, 2],
+        [None, None, None, None],
+        [None, None, None, 2],
+    ]
 
     # when:
-    assert not game_state.slide_left()
+    game_state = state.GameState(board)
+    game_state.copy_board()[0][0] = 1024
 
     # then:
-    mock_spawn_new_tile.assert_not_called()
+    assert game_state.copy_board() == board
+    assert game_state.score == 22
+    assert not game_state.has_won()
+    assert not game_state.is_out_of_moves()
 
 
-@mock.patch.object(board_utils, "spawn_new_tile")
-@mock.patch.object(board_utils, "move_and_merge_down")
-def test_slide_down__when_effective__spawns_new_tile(
-    mock_move_and_merge_down: mock.MagicMock,
-    mock_spawn_new_tile: mock.MagicMock,
-):
+def test_init__with_regular_board__detaches_from_provided_board():
     # given:
-    board = mock.MagicMock()
+    board: types.GameBoard = [[2, None, None, None]] + [[None] * 4 for _ in range(3)]
     game_state = state.GameState(board)
-    mock_move_and_merge_down.return_value = True
 
     # when:
-    assert game_state.slide_down()
+    board[0][0] = 1024
 
     # then:
-    mock_spawn_new_tile.assert_called_once_with(board)
+    assert game_state.board[0][0] == 2
+
+
+@pytest.mark.parametrize(
+    ["board", "expected"],
+    [
+        pytest.param([[2048, 4096, None, None]] + [[None] * 4 for _ in range(3)], True, id="2048"),
+        pytest.param(
+            [[1024, 4096, None, None]] + [[None] * 4 for _ in range(3)], False, id="above-2048"
+        ),
+    ],
+)
+def test_has_won__with_regular_board(board: types.GameBoard, expected: bool):
+    game_state = state.GameState(board)
+    assert game_state.has_won() == expected
+
 
+def test_is_out_of_moves__with_regular_board__returns_true():
+    # given:
+    board: types.GameBoard = [[2, 4, 2, 4], [4, 2, 4, 2], [2, 4, 2, 4], [4, 2, 4, 2]]
+
+    # when:
+    game_state = state.GameState(board)
 
-@mock.patch.object(board_utils, "spawn_new_tile")
-@mock.patch.object(board_utils, "move_and_merge_down")
-def test_slide_down__when_not_effective__does_not_spawn_new_tile(
-    mock_move_and_merge_down: mock.MagicMock,
+    # then:
+    assert game_state.is_out_of_moves()
+
+
+@pytest.mark.parametrize(
+    ["direction", "expected"],
+    [
+        pytest.param(
+            types.SlideDirection.UP,
+            [[4, 8, 2, 4], [None, 2, None, 2], [None, None, None, None], [None, None, None, None]],
+            id="up",
+        ),
+        pytest.param(
+            types.SlideDirection.LEFT,
+            [
+                [8, 4, None, None],
+                [4, 4, None, None],
+                [None, None, None, None],
+                [2, None, None, None],
+            ],
+            id="left",
+        ),
+        pytest.param(
+            types.SlideDirection.DOWN,
+            [[None, None, None, None], [None, None, None, None], [None, 8, None, 2], [4, 2, 2, 4]],
+            id="down",
+        ),
+        pytest.param(
+            types.SlideDirection.RIGHT,
+            [
+                [None, None, 8, 4],
+                [None, None, 4, 4],
+                [None, None, None, None],
+                [None, None, None, 2],
+            ],
+            id="right",
+        ),
+    ],
+)
+@mock.patch.object(bitboard_utils, "spawn_new_tile", side_effect=lambda bitboard, **_: bitboard)
+def test_slide__with_regular_board__moves_and_spawns(
     mock_spawn_new_tile: mock.MagicMock,
+    direction: types.SlideDirection,
+    expected: types.GameBoard,
 ):
     # given:
-    board = mock.MagicMock()
+    board: types.GameBoard = [
+        [None, 8, 2, 2],
+        [4, 2, None, 2],
+        [None, None, None, None],
+        [None, None, None, 2],
+    ]
+
     game_state = state.GameState(board)
-    mock_move_and_merge_down.return_value = False
 
     # when:
-    assert not game_state.slide_down()
+    assert game_state.slide(direction)
 
     # then:
-    mock_spawn_new_tile.assert_not_called()
+    mock_spawn_new_tile.assert_called_once()
+    assert game_state.copy_board() == expected
 
 
-@mock.patch.object(board_utils, "spawn_new_tile")
-@mock.patch.object(board_utils, "move_and_merge_right")
-def test_slide_right__when_effective__spawns_new_tile(
-    mock_move_and_merge_right: mock.MagicMock,
+@mock.patch.object(bitboard_utils, "spawn_new_tile")
+def test_slide__with_regular_board__when_not_effective__does_not_spawn_new_tile(
     mock_spawn_new_tile: mock.MagicMock,
 ):
     # given:
-    board = mock.MagicMock()
+    board: types.GameBoard = [[2, None, None, None]] + [[None] * 4 for _ in range(3)]
     game_state = state.GameState(board)
-    mock_move_and_merge_right.return_value = True
 
     # when:
-    assert game_state.slide_right()
+    assert not game_state.slide(types.SlideDirection.UP)
 
     # then:
-    mock_spawn_new_tile.assert_called_once_with(board)
+    mock_spawn_new_tile.assert_not_called()
+    assert game_state.copy_board() == board
 
 
-@mock.patch.object(board_utils, "spawn_new_tile")
-@mock.patch.object(board_utils, "move_and_merge_right")
-def test_slide_right__when_not_effective__does_not_spawn_new_tile(
-    mock_move_and_merge_right: mock.MagicMock,
-    mock_spawn_new_tile: mock.MagicMock,
-):
+@mock.patch.object(bitboard_utils, "spawn_new_tile", side_effect=lambda bitboard, **_: bitboard)
+def test_slide__with_regular_board__reaching_max_exponent__continues_on_game_board(_):
     # given:
-    board = mock.MagicMock()
+    board: types.GameBoard = [
+        [2**14, 2**14, None, None],
+        [2**14, 2**14, None, None],
+        [None, None, None, None],
+        [None, None, None, None],
+    ]
+
     game_state = state.GameState(board)
-    mock_move_and_merge_right.return_value = False
 
-    # when:
-    assert not game_state.slide_right()
+    # when: tiles of 2 ** 15 are created, then merged
+    assert game_state.slide(types.SlideDirection.LEFT)
+    assert game_state.slide(types.SlideDirection.UP)
 
     # then:
-    mock_spawn_new_tile.assert_not_called()
+    assert game_state.board[0][0] == 2**16
+    assert game_state.score >= 2**16
+
+
+@pytest.mark.parametrize(
+    ["board"],
+    [
+        pytest.param(
+            [[None, 8, 2, 2], [4, 2, None, 2], [None, None, None, None], [None, None, None, 2]],
+            id="regular-board",
+        ),
+        pytest.param([[None, 8, 2, 2, 4], [4, 2, None, 2, 4]], id="irregular-board"),
+    ],
+)
+def test_slide__keeps_summary_up_to_date(board: types.GameBoard):
+    # given:
+    random.seed(RANDOM_SEED)
+    game_state = state.GameState(board)
+
+    for turn in range(200):
+        # when:
+        game_state.slide(random.choice(tuple(types.SlideDirection)))
+
+        # then:
+        expected = board_utils.summarize(game_state.board)
+        assert game_state.score == expected.score, f"turn {turn}"
+        assert game_state.max_tile == expected.max_tile, f"turn {turn}"
+        assert game_state.num_empty_tiles == expected.num_empty_tiles, f"turn {turn}"
+        assert game_state.has_won() == board_utils.has_2048(game_state.board), f"turn {turn}"
+
+
+@pytest.mark.parametrize(
+    ["board"],
+    [
+        pytest.param(None, id="new-board"),
+        pytest.param([[None, 8, 2, 2, 4], [4, 2, None, 2, 4]], id="irregular-board"),
+    ],
+)
+def test_slide__with_rng__is_independent_of_other_games(board: types.GameBoard | None):
+    # given:
+    moves = random.Random(RANDOM_SEED).choices(list(types.SlideDirection), k=100)
+
+    game_state = state.GameState(copy.deepcopy(board), rng=random.Random(RANDOM_SEED))
+
+    for direction in moves:
+        game_state.slide(direction)
+
+    # when: the same game is interleaved with other games, and draws from the global random
+    interleaved = state.GameState(copy.deepcopy(board), rng=random.Random(RANDOM_SEED))
+    other_games = [state.GameState(copy.deepcopy(board), rng=random.Random()) for _ in range(3)]
+
+    for direction in moves:
+        for other_game in other_games:
+            other_game.slide(direction)
+            random.random()
+
+        interleaved.slide(direction)
+
+    # then:
+    assert interleaved.board == game_state.board
+    assert interleaved.score == game_state.score
+
+
+@pytest.mark.parametrize(
+    ["board"],
+    [
+        pytest.param(
+            [[None, 8, 2, 2], [4, 2, None, 2], [None, None, None, None], [None, None, None, 2]],
+            id="regular-board",
+        ),
+        pytest.param([[None, 8, 2, 2, 4], [4, 2, None, 2, 4]], id="irregular-board"),
+    ],
+)
+def test_last_spawn(board: types.GameBoard):
+    # given:
+    game_state = state.GameState(board, rng=random.Random(RANDOM_SEED))
+    assert game_state.last_spawn is None
+
+    for direction in random.Random(RANDOM_SEED).choices(list(types.SlideDirection), k=50):
+        before = game_state.board
+
+        # when:
+        moved = game_state.slide(direction)
+
+        # then: the spawn is the only tile that a slide on a copy does not account for
+        if not moved:
+            continue
+
+        afterstate = board_utils.preview(before, direction).afterstate
+        spawn = game_state.last_spawn
+
+        assert spawn is not None
+        assert afterstate[spawn.row][spawn.column] is None
+        assert game_state.board[spawn.row][spawn.column] == spawn.value
+        assert game_state.last_spawn == spawn
@@ -0,0 +1,69 @@
+"""Unit tests for `timing`."""
+
+from unittest import mock
+
+import pytest
+
+from python_2048.game import timing
+
+
+def test_wrap__times_every_call():
+    # given:
+    timer = timing.PhaseTimer()
+    function = timer.wrap(timing.Phase.SLIDE, lambda value, *, offset: value + offset)
+
+    # when:
+    with (
+        mock.patch("time.perf_counter_ns", side_effect=[0, 100, 1000, 1300]),
+        mock.patch("time.process_time_ns", side_effect=[0, 50, 500, 800]),
+    ):
+        results = [function(1, offset=2), function(3, offset=4)]
+
+    # then:
+    assert results == [3, 7]
+    assert timer.timings()[timing.Phase.SLIDE] == timing.PhaseTiming(
+        num_calls=2, wall_time=400e-9, cpu_time=350e-9, histogram={128: 1, 512: 1}
+    )
+
+
+def test_wrap__raising_function__is_timed():
+    # given:
+    timer = timing.PhaseTimer()
+    function = timer.wrap(timing.Phase.GET_NEXT_MOVE, mock.Mock(side_effect=KeyError))
+
+    # when:
+    with pytest.raises(KeyError):
+        function()
+
+    # then:
+    assert timer.timings()[timing.Phase.GET_NEXT_MOVE].num_calls == 1
+
+
+def test_timings__without_calls():
+    # when:
+    timings = timing.PhaseTimer().timings()
+
+    # then:
+    assert list(timings) == list(timing.Phase)
+    assert all(phase_timing.num_calls == 0 for phase_timing in timings.values())
+    assert timings[timing.Phase.ON_START].percentile(50) == 0
+
+
+@pytest.mark.parametrize(
+    ["percentile", "expected_upper_bound"],
+    [
+        pytest.param(0, 2, id="p0"),
+        pytest.param(10, 2, id="p10"),
+        pytest.param(50, 8, id="p50"),
+        pytest.param(90, 16, id="p90"),
+        pytest.param(100, 16, id="p100"),
+    ],
+)
+def test_percentile(percentile: float, expected_upper_bound: int):
+    # given:
+    phase_timing = timing.PhaseTiming(
+        num_calls=10, wall_time=0, cpu_time=0, histogram={2: 1, 4: 3, 8: 2, 16: 4}
+    )
+
+    # then:
+    assert phase_timing.percentile(percentile) == expected_upper_bound
@@ -79,3 +79,44 @@ def test_get_next_move__unrecognized_option__prompts_until_valid(
 
     # when:
     assert player.get_next_move(board).direction == types.SlideDirection.UP
+
+
+@mock.patch.object(human_local.LocalHumanPlayer, "_prompt_for_option")
+def test_get_next_move__illegal_move__prompts_until_legal(
+    mock_prompt_for_option: mock.MagicMock,
+    capsys: pytest.CaptureFixture[str],
+):
+    # given:
+    board = mock.Mock()
+    player = human_local.LocalHumanPlayer()
+    mock_prompt_for_option.side_effect = ["w", "a", "s"]
+    legal_moves = frozenset({types.SlideDirection.DOWN})
+
+    # when:
+    decision = player.get_next_move(board, legal_moves)
+
+    # then:
+    assert decision.direction == types.SlideDirection.DOWN
+    assert mock_prompt_for_option.call_count == 3
+    assert "Cannot slide UP" in capsys.readouterr().out
+
+
+@mock.patch.object(human_local.LocalHumanPlayer, "_prompt_for_option")
+def test_get_next_move__press_h__passes_legal_moves_to_assistant(
+    mock_prompt_for_option: mock.MagicMock,
+):
+    # given:
+    board = mock.Mock()
+    assistant = mock.Mock()
+    assistant.get_next_move.return_value = types.PlayerDecision(
+        direction=types.SlideDirection.DOWN, reason=""
+    )
+    player = human_local.LocalHumanPlayer(assistant=assistant)
+    mock_prompt_for_option.side_effect = "hs"
+    legal_moves = frozenset({types.SlideDirection.DOWN})
+
+    # when:
+    _ = player.get_next_move(board, legal_moves)
+
+    # then:
+    assistant.get_next_move.assert_called_once_with(board, legal_moves)
@@ -57,3 +57,19 @@ def test_get_next_move__unexpected_model_behavior__raises_llm_exception(
     # when:
     with pytest.raises(exceptions.LlmException):
         _ = llm_player.get_next_move(board)
+
+
+@mock.patch.object(pydantic_ai, "Agent")
+def test_get_next_move__with_legal_moves__lists_valid_moves(mock_agent_cls: mock.MagicMock):
+    # given:
+    board = [[2, 2], [None, None]]
+    legal_moves = frozenset({types.SlideDirection.RIGHT, types.SlideDirection.DOWN})
+
+    agent = mock_agent_cls.return_value
+    llm_player = llm.LlmPlayer(mock.Mock(spec_set=pydantic_ai.models.Model))
+
+    # when:
+    _ = llm_player.get_next_move(board, legal_moves)
+
+    # then:
+    agent.run_sync.assert_called_once_with(f"{json.dumps(board)}\nValid moves: s, d")
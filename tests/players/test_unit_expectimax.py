@@ -0,0 +1,134 @@
+"""Unit tests for `ExpectimaxPlayer`."""
+
+import random
+
+import pytest
+
+from python_2048.game import types
+from python_2048.game.lib import bitboard_utils, board_utils
+from python_2048.players import expectimax, transposition
+
+RANDOM_SEED = 100
+
+
+@pytest.mark.parametrize(
+    ["exponents", "expected"],
+    [
+        pytest.param([0, 0, 0, 0], 200_000 + 4 * 270, id="empty-line"),
+        pytest.param([1, 1, 0, 0], 200_000 + 2 * 270 + 2 * 700 - 2 * 11, id="pending-merge"),
+        pytest.param(
+            [1, 2, 1, 0],
+            200_000 + 270 - 47 * 15 - 11 * (2 + 2**3.5),
+            id="not-monotonic",
+        ),
+    ],
+)
+def test_evaluate_line(exponents: list[int], expected: float):
+    assert expectimax._evaluate_line(exponents) == pytest.approx(expected)
+
+
+def test_evaluate_bitboard__is_consistent_with_evaluate_board():
+    random.seed(RANDOM_SEED)
+
+    for _ in range(50):
+        # given:
+        board = board_utils.create_new_board(num_initial_tiles=random.randint(0, 16))
+
+        # when:
+        value = expectimax._evaluate_bitboard(bitboard_utils.encode(board))
+
+        # then:
+        assert value == pytest.approx(expectimax._evaluate_board(board))
+
+
+def test_init__non_positive_max_depth__raises_value_error():
+    with pytest.raises(ValueError):
+        _ = expectimax.ExpectimaxPlayer(max_depth=0)
+
+
+def test_get_next_move__only_one_move():
+    # given:
+    board = [[2, 4, 8, 16], [4, 8, 16, 32], [8, 16, 32, 64], [16, 32, 64, None]]
+
+    # when:
+    decision = expectimax.ExpectimaxPlayer(time_budget=10).get_next_move(board)
+
+    # then:
+    assert decision.direction in {types.SlideDirection.DOWN, types.SlideDirection.RIGHT}
+    assert decision.reason.startswith("Expected scores at depth 3: DOWN")
+
+
+def test_get_next_move__respects_legal_moves():
+    # given:
+    board = [[2, 2, None, None], [None, None, None, None], [None] * 4, [None] * 4]
+    legal_moves = frozenset({types.SlideDirection.UP, types.SlideDirection.DOWN})
+
+    # when:
+    decision = expectimax.ExpectimaxPlayer(max_depth=1).get_next_move(board, legal_moves)
+
+    # then:
+    assert decision.direction == types.SlideDirection.DOWN
+    assert "LEFT" not in decision.reason
+    assert "RIGHT" not in decision.reason
+
+
+def test_get_next_move__no_time_budget__searches_one_move_ahead():
+    # given:
+    board = [[2, 4, None, None], [None, 2, None, None], [None] * 4, [None, None, None, 4]]
+
+    # when:
+    decision = expectimax.ExpectimaxPlayer(time_budget=0).get_next_move(board)
+
+    # then:
+    assert decision.reason.startswith("Expected scores at depth 1:")
+
+
+def test_get_next_move__irregular_board():
+    # given: a board that cannot be encoded into a bitboard
+    board = [[2, 2, None], [None, 4, None], [8, None, 2**15]]
+
+    # when:
+    decision = expectimax.ExpectimaxPlayer(max_depth=2, time_budget=10).get_next_move(board)
+
+    # then:
+    assert decision.direction in board_utils.get_legal_moves(board)
+    assert decision.reason.startswith("Expected scores at depth 2:")
+
+
+def test_get_next_move__out_of_moves():
+    # given:
+    board = [[2, 4], [4, 2]]
+
+    # when:
+    decision = expectimax.ExpectimaxPlayer().get_next_move(board, frozenset())
+
+    # then:
+    assert decision.direction == types.SlideDirection.UP
+    assert decision.reason == "No tile can be moved."
+
+
+def test_get_next_move__merges_towards_a_win():
+    # given:
+    board = [[1024, 1024, None, None], [None] * 4, [None] * 4, [None] * 4]
+
+    # when:
+    decision = expectimax.ExpectimaxPlayer(max_depth=1).get_next_move(board)
+
+    # then:
+    assert decision.direction in {types.SlideDirection.LEFT, types.SlideDirection.RIGHT}
+
+
+def test_get_next_move__reuses_transposition_table():
+    # given:
+    board = [[2, 4, None, None], [None, 2, None, None], [None] * 4, [None, None, None, 4]]
+    table = transposition.TranspositionTable(1024)
+    player = expectimax.ExpectimaxPlayer(max_depth=2, time_budget=10, transposition_table=table)
+
+    # when:
+    first = player.get_next_move(board)
+    second = player.get_next_move(board)
+
+    # then:
+    assert player.transposition_table is table
+    assert second.direction == first.direction
+    assert table.stats.hits > 0
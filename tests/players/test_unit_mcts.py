@@ -0,0 +1,164 @@
+"""Unit tests for `MctsPlayer`."""
+
+import pytest
+
+from python_2048.game import types
+from python_2048.game.lib import bitboard_utils
+from python_2048.players import mcts
+
+RANDOM_SEED = 100
+
+BOARD: types.GameBoard = [
+    [2, 4, None, None],
+    [None, 2, None, None],
+    [None, None, None, None],
+    [None, None, None, 4],
+]
+
+
+@pytest.fixture(scope="module")
+def player():
+    with mcts.MctsPlayer(num_rollouts=20, num_workers=2, seed=RANDOM_SEED) as player_:
+        yield player_
+
+
+@pytest.mark.parametrize(
+    ["num_rollouts", "rollouts_per_task"],
+    [
+        pytest.param(0, 1, id="no-rollouts"),
+        pytest.param(1, 0, id="no-rollouts-per-task"),
+    ],
+)
+def test_init__non_positive_rollouts__raises_value_error(num_rollouts: int, rollouts_per_task: int):
+    with pytest.raises(ValueError):
+        _ = mcts.MctsPlayer(num_rollouts=num_rollouts, rollouts_per_task=rollouts_per_task)
+
+
+def test_get_next_move(player: mcts.MctsPlayer):
+    # when:
+    decision = player.get_next_move(BOARD)
+
+    # then:
+    assert decision.reason.startswith("Mean scores over 80 rollouts: UP ")
+
+
+def test_get_next_move__same_seed__same_decision():
+    # given:
+    with (
+        mcts.MctsPlayer(num_rollouts=20, num_workers=1, seed=RANDOM_SEED) as player_,
+        mcts.MctsPlayer(num_rollouts=20, num_workers=2, seed=RANDOM_SEED) as other_player,
+    ):
+        # when:
+        decisions = [player_.get_next_move(BOARD) for _ in range(2)]
+        other_decisions = [other_player.get_next_move(BOARD) for _ in range(2)]
+
+    # then: the decisions are independent of the number of workers
+    assert decisions == other_decisions
+
+
+def test_get_next_move__respects_legal_moves(player: mcts.MctsPlayer):
+    # given:
+    legal_moves = frozenset({types.SlideDirection.DOWN})
+
+    # when:
+    decision = player.get_next_move(BOARD, legal_moves)
+
+    # then:
+    assert decision.direction == types.SlideDirection.DOWN
+    assert decision.reason.startswith("Mean scores over 20 rollouts: DOWN ")
+
+
+def test_get_next_move__irregular_board(player: mcts.MctsPlayer):
+    # given:
+    board = [[2, 2, None], [None, 4, None], [8, None, 2**15]]
+
+    # when:
+    decision = player.get_next_move(board)
+
+    # then:
+    assert decision.reason.startswith("Mean scores over 80 rollouts:")
+
+
+def test_get_next_move__out_of_moves(player: mcts.MctsPlayer):
+    # when:
+    decision = player.get_next_move([[2, 4], [4, 2]], frozenset())
+
+    # then:
+    assert decision.direction == types.SlideDirection.UP
+    assert decision.reason == "No tile can be moved."
+
+
+def test_get_next_move__time_budget__plays_at_least_one_rollout_per_task():
+    # given:
+    with mcts.MctsPlayer(num_rollouts=20, time_budget=0, num_workers=1) as player_:
+        # when:
+        decision = player_.get_next_move(BOARD, frozenset({types.SlideDirection.LEFT}))
+
+    # then: 2 tasks of 10 rollouts
+    assert decision.reason.startswith("Mean scores over 2 rollouts: LEFT ")
+
+
+def test_get_next_move__reuses_workers(player: mcts.MctsPlayer):
+    # given:
+    player.get_next_move(BOARD)
+    executor = player._executor
+
+    # when:
+    player.get_next_move(BOARD)
+
+    # then:
+    assert player._executor is executor
+
+
+def test_close__shuts_down_workers():
+    # given:
+    player_ = mcts.MctsPlayer(num_rollouts=1, num_workers=1)
+    player_.get_next_move(BOARD)
+
+    # when:
+    player_.close()
+    player_.close()
+
+    # then:
+    assert player_._executor is None
+
+
+@pytest.mark.parametrize(
+    ["afterstate"],
+    [
+        pytest.param(bitboard_utils.encode(BOARD), id="bitboard"),
+        pytest.param(tuple(map(tuple, BOARD)), id="board"),
+    ],
+)
+def test_run_rollouts(afterstate: types.Bitboard | types.FrozenGameBoard):
+    # when:
+    result = mcts._run_rollouts(afterstate, 3, seed=RANDOM_SEED)
+
+    # then: every rollout spawns at least one tile, and plays until the game is over
+    assert result.num_rollouts == 3
+    assert result.total_score > 3 * (12 + 2)
+    assert result == mcts._run_rollouts(afterstate, 3, seed=RANDOM_SEED)
+
+
+@pytest.mark.parametrize(
+    ["afterstate"],
+    [
+        pytest.param(bitboard_utils.encode(BOARD), id="bitboard"),
+        pytest.param(tuple(map(tuple, BOARD)), id="board"),
+    ],
+)
+def test_run_rollouts__max_moves(afterstate: types.Bitboard | types.FrozenGameBoard):
+    # when:
+    result = mcts._run_rollouts(afterstate, 1, max_moves=2, seed=RANDOM_SEED)
+
+    # then: only 2 tiles of 2/4 are spawned
+    assert result.num_rollouts == 1
+    assert 12 + 4 <= result.total_score <= 12 + 8
+
+
+def test_run_rollouts__past_deadline__plays_one_rollout():
+    # when:
+    result = mcts._run_rollouts(bitboard_utils.encode(BOARD), 10, deadline=0)
+
+    # then:
+    assert result.num_rollouts == 1
@@ -0,0 +1,223 @@
+"""Unit tests for `NTupleNetwork` and `NTuplePlayer`."""
+
+import array
+import pathlib
+import random
+
+import pytest
+
+from python_2048.game import types
+from python_2048.game.lib import bitboard_utils, board_utils, symmetry_utils
+from python_2048.players import exceptions, ntuple
+
+RANDOM_SEED = 100
+
+PATTERNS = ((0, 1), (0, 4, 5))
+
+
+@pytest.fixture
+def network() -> ntuple.NTupleNetwork:
+    random.seed(RANDOM_SEED)
+    weights = array.array("f", (random.uniform(-1, 1) for _ in range(16**2 + 16**3)))
+    return ntuple.NTupleNetwork(PATTERNS, weights)
+
+
+@pytest.mark.parametrize(
+    ["patterns"],
+    [
+        pytest.param(((),), id="empty-tuple"),
+        pytest.param(((0, 16),), id="out-of-board"),
+    ],
+)
+def test_init__invalid_patterns__raises_value_error(patterns: tuple[tuple[int, ...], ...]):
+    with pytest.raises(ValueError):
+        _ = ntuple.NTupleNetwork(patterns)
+
+
+def test_init__wrong_number_of_weights__raises_value_error():
+    with pytest.raises(ValueError):
+        _ = ntuple.NTupleNetwork(PATTERNS, array.array("f", [0.0] * 16))
+
+
+def test_init__zero_weights():
+    # when:
+    network = ntuple.NTupleNetwork(PATTERNS)
+
+    # then:
+    assert network.patterns == PATTERNS
+    assert len(network.weights) == 16**2 + 16**3
+    assert network.evaluate(0x1234_5678_9ABC_DEF1) == 0.0
+
+
+def test_evaluate():
+    # given: a single pair of tiles, whose weight is 1.0 for exponents (1, 2) only
+    network = ntuple.NTupleNetwork(((0, 1),))
+    network.weights[0x12] = 1.0
+
+    # when:
+    values = [
+        network.evaluate(0x0000_0000_0000_0021),
+        network.evaluate(0x1000_0000_0000_0000 | 0x0200_0000_0000_0000),
+        network.evaluate(0x0000_0000_0000_0012),
+    ]
+
+    # then: the pair is sampled in every symmetry
+    assert values == [1.0, 1.0, 0.0]
+
+
+def test_evaluate__symmetric_boards_evaluate_alike(network: ntuple.NTupleNetwork):
+    random.seed(RANDOM_SEED)
+
+    for _ in range(20):
+        # given:
+        bitboard = bitboard_utils.encode(board_utils.create_new_board(num_initial_tiles=10))
+        expected = network.evaluate(bitboard)
+
+        for transform in symmetry_utils.Transform:
+            # when:
+            value = network.evaluate(symmetry_utils.apply_to_bitboard(bitboard, transform))
+
+            # then:
+            assert value == pytest.approx(expected)
+
+
+def test_save_and_load(network: ntuple.NTupleNetwork, tmp_path: pathlib.Path):
+    # given:
+    file_path = tmp_path / "weights.bin"
+    bitboard = 0x1234_5678_9ABC_DEF1
+
+    # when:
+    network.save(file_path)
+    loaded = ntuple.NTupleNetwork.load(file_path)
+
+    # then:
+    assert loaded.patterns == PATTERNS
+    assert list(loaded.weights) == list(network.weights)
+    assert loaded.evaluate(bitboard) == network.evaluate(bitboard)
+
+    # then: the weights are a read-only view of the file
+    with pytest.raises(TypeError):
+        loaded.weights[0] = 1.0
+
+    loaded.close()
+    loaded.close()
+
+
+def test_load__writable__writes_through(network: ntuple.NTupleNetwork, tmp_path: pathlib.Path):
+    # given:
+    file_path = tmp_path / "weights.bin"
+    network.save(file_path)
+    writable = ntuple.NTupleNetwork.load(file_path, writable=True)
+    reader = ntuple.NTupleNetwork.load(file_path)
+
+    # when:
+    writable.weights[3] = 42.0
+    writable.flush()
+
+    # then:
+    assert reader.weights[3] == 42.0
+    writable.close()
+    reader.close()
+
+
+def test_flush__in_memory__does_nothing(network: ntuple.NTupleNetwork):
+    network.flush()
+    network.close()
+
+
+def test_get_indices(network: ntuple.NTupleNetwork):
+    # given:
+    bitboard = 0x1234_5678_9ABC_DEF1
+
+    # when:
+    indices = network.get_indices(bitboard)
+
+    # then:
+    assert len(indices) == network.num_features == 2 * 8
+    assert sum(network.weights[index] for index in indices) == pytest.approx(
+        network.evaluate(bitboard)
+    )
+
+
+def test_save__non_array_weights(tmp_path: pathlib.Path, network: ntuple.NTupleNetwork):
+    # given:
+    file_path = tmp_path / "weights.bin"
+    network.save(file_path)
+    loaded = ntuple.NTupleNetwork.load(file_path)
+    other_file_path = tmp_path / "other-weights.bin"
+
+    # when:
+    loaded.save(other_file_path)
+
+    # then:
+    assert other_file_path.read_bytes() == file_path.read_bytes()
+    loaded.close()
+
+
+@pytest.mark.parametrize(
+    ["content"],
+    [
+        pytest.param(b"not-weights", id="bad-magic"),
+        pytest.param(b"2048NTN1\x02", id="truncated-header"),
+        pytest.param(b"2048NTN1\x02\x00\x00\x00{}", id="missing-patterns"),
+        pytest.param(b'2048NTN1\x12\x00\x00\x00{"patterns":[[0]]}', id="truncated-weights"),
+    ],
+)
+def test_load__invalid_file__raises_invalid_weights_file(content: bytes, tmp_path: pathlib.Path):
+    # given:
+    file_path = tmp_path / "weights.bin"
+    file_path.write_bytes(content)
+
+    # when:
+    with pytest.raises(exceptions.InvalidWeightsFile) as exc_info:
+        _ = ntuple.NTupleNetwork.load(file_path)
+
+    # then:
+    assert str(exc_info.value) == f"Failed to load the n-tuple network weights: {file_path}"
+
+
+def test_get_next_move__maximizes_reward_plus_value():
+    # given: a network that values a 4 at the top-left corner
+    network = ntuple.NTupleNetwork(((0,),))
+    network.weights[2] = 10.0
+    board = [[None, 2, 2, None], [None] * 4, [None] * 4, [None] * 4]
+
+    # when:
+    decision = ntuple.NTuplePlayer(network).get_next_move(board)
+
+    # then: a corner is sampled by two of the symmetries
+    assert decision.direction in {types.SlideDirection.LEFT, types.SlideDirection.RIGHT}
+    assert decision.reason == "Reward plus afterstate value: LEFT 24.0, DOWN 0.0, RIGHT 24.0."
+
+
+def test_get_next_move__respects_legal_moves(network: ntuple.NTupleNetwork):
+    # given:
+    board = [[None, 2, 2, None], [None] * 4, [None] * 4, [None] * 4]
+
+    # when:
+    decision = ntuple.NTuplePlayer(network).get_next_move(
+        board, frozenset({types.SlideDirection.DOWN})
+    )
+
+    # then:
+    assert decision.direction == types.SlideDirection.DOWN
+
+
+def test_get_next_move__irregular_board__maximizes_reward(network: ntuple.NTupleNetwork):
+    # given:
+    board = [[2, 2, None], [None, 4, None], [8, None, 2**15]]
+
+    # when:
+    decision = ntuple.NTuplePlayer(network).get_next_move(board)
+
+    # then:
+    assert decision.direction in {types.SlideDirection.LEFT, types.SlideDirection.RIGHT}
+
+
+def test_get_next_move__out_of_moves(network: ntuple.NTupleNetwork):
+    # when:
+    decision = ntuple.NTuplePlayer(network).get_next_move([[2, 4], [4, 2]], frozenset())
+
+    # then:
+    assert decision.direction == types.SlideDirection.UP
+    assert decision.reason == "No tile can be moved."
@@ -0,0 +1,62 @@
+"""Unit tests for `RandomPlayer`."""
+
+import pytest
+
+from python_2048.game import types
+from python_2048.players import random_moves
+
+BOARD: types.GameBoard = [
+    [2, 4, None, None],
+    [None, 2, None, None],
+    [None, None, None, None],
+    [None, None, None, 4],
+]
+
+FULL_BOARD: types.GameBoard = [
+    [2, 4, 2, 4],
+    [4, 2, 4, 2],
+    [2, 4, 2, 4],
+    [4, 2, 4, 2],
+]
+
+
+@pytest.mark.parametrize(
+    ["legal_moves", "expected_directions"],
+    [
+        pytest.param(None, set(types.SlideDirection), id="unknown-legal-moves"),
+        pytest.param(
+            frozenset({types.SlideDirection.LEFT}), {types.SlideDirection.LEFT}, id="known"
+        ),
+    ],
+)
+def test_get_next_move(
+    legal_moves: frozenset[types.SlideDirection] | None,
+    expected_directions: set[types.SlideDirection],
+):
+    # given:
+    player = random_moves.RandomPlayer(seed=1)
+
+    # when:
+    directions = {player.get_next_move(BOARD, legal_moves).direction for _ in range(20)}
+
+    # then:
+    assert directions == expected_directions
+
+
+def test_get_next_move__same_seed__same_moves():
+    # given:
+    players = random_moves.RandomPlayer(seed=1), random_moves.RandomPlayer(seed=1)
+
+    # when:
+    moves = [[player.get_next_move(BOARD).direction for _ in range(10)] for player in players]
+
+    # then:
+    assert moves[0] == moves[1]
+
+
+def test_get_next_move__out_of_moves():
+    # when:
+    decision = random_moves.RandomPlayer().get_next_move(FULL_BOARD)
+
+    # then:
+    assert decision.reason == "No tile can be moved."
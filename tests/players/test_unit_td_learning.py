@@ -0,0 +1,35 @@
+"""Unit tests for `td_learning`."""
+
+import random
+
+from python_2048.players import ntuple, td_learning
+
+RANDOM_SEED = 100
+
+
+def test_play_training_games():
+    # given:
+    network = ntuple.NTupleNetwork(((0, 1), (0, 4, 5)))
+    # when:
+    result = td_learning.play_training_games(network, 3, rng=random.Random(RANDOM_SEED))
+
+    # then: the network itself is left unchanged
+    assert not any(network.weights)
+    assert result.updates
+    assert result.num_games == 3
+    assert result.num_moves > 3 * 10
+    assert result.total_score > 3 * 20
+    assert result.max_tile >= 64
+    assert result == td_learning.play_training_games(network, 3, rng=random.Random(RANDOM_SEED))
+
+
+def test_apply_updates():
+    # given:
+    network = ntuple.NTupleNetwork(((0,),))
+
+    # when:
+    td_learning.apply_updates(network, {1: 0.5, 3: -1.0})
+    td_learning.apply_updates(network, {1: 0.25})
+
+    # then:
+    assert list(network.weights[:4]) == [0.0, 0.75, 0.0, -1.0]
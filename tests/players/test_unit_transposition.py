@@ -0,0 +1,115 @@
+"""Unit tests for `TranspositionTable`."""
+
+import pytest
+
+from python_2048.game import types
+from python_2048.players import transposition
+
+
+def test_init__non_positive_max_entries__raises_value_error():
+    with pytest.raises(ValueError):
+        _ = transposition.TranspositionTable(0)
+
+
+def test_lookup__stored_entry():
+    # given:
+    table = transposition.TranspositionTable(16)
+    table.store(0x1234, 42.0, 2, types.SlideDirection.LEFT)
+
+    # when:
+    entry = table.lookup(0x1234, 2)
+
+    # then:
+    assert entry == transposition.TranspositionEntry(
+        key=0x1234, value=42.0, depth=2, best_move=types.SlideDirection.LEFT, generation=0
+    )
+    assert table.stats == transposition.TranspositionStats(hits=1, misses=0, evictions=0, size=1)
+
+
+@pytest.mark.parametrize(
+    ["key", "depth"],
+    [
+        pytest.param(0x4321, 2, id="unknown-position"),
+        pytest.param(0x1234, 3, id="shallower-entry"),
+    ],
+)
+def test_lookup__miss(key: int, depth: int):
+    # given:
+    table = transposition.TranspositionTable(16)
+    table.store(0x1234, 42.0, 2)
+
+    # when:
+    entry = table.lookup(key, depth)
+
+    # then:
+    assert entry is None
+    assert table.stats.misses == 1
+
+
+def test_store__never_exceeds_max_entries():
+    # given:
+    table = transposition.TranspositionTable(8)
+
+    # when:
+    for key in range(100):
+        table.store(key, float(key), 1)
+
+    # then:
+    assert len(table) == table.max_entries == 8
+    assert table.stats.evictions == 100 - 8
+
+
+def test_store__keeps_deeper_entry_of_same_generation():
+    # given: a table with a single slot
+    table = transposition.TranspositionTable(1)
+    table.store(1, 1.0, 3)
+
+    # when:
+    stored = table.store(2, 2.0, 2)
+
+    # then:
+    assert not stored
+    assert table.lookup(1, 3) is not None
+    assert table.stats.evictions == 0
+
+
+def test_store__replaces_entry_of_older_generation():
+    # given: a table with a single slot
+    table = transposition.TranspositionTable(1)
+    table.store(1, 1.0, 3)
+    table.new_generation()
+
+    # when:
+    stored = table.store(2, 2.0, 2)
+
+    # then:
+    assert stored
+    assert table.lookup(2, 2) == transposition.TranspositionEntry(2, 2.0, 2, None, 1)
+    assert table.stats.evictions == 1
+
+
+def test_store__same_position__updates_entry():
+    # given:
+    table = transposition.TranspositionTable(4)
+    table.store(((2, None), (None, 4)), 1.0, 1)
+
+    # when:
+    table.store(((2, None), (None, 4)), 2.0, 2)
+
+    # then:
+    assert table.lookup(((2, None), (None, 4)), 2).value == 2.0  # type: ignore
+    assert table.stats == transposition.TranspositionStats(hits=1, misses=0, evictions=0, size=1)
+
+
+def test_clear():
+    # given:
+    table = transposition.TranspositionTable(4)
+    table.store(1, 1.0, 1)
+    table.lookup(1, 1)
+
+    # when:
+    table.clear()
+
+    # then:
+    assert table.lookup(1, 1) is None
+    assert table.stats == transposition.TranspositionStats(hits=0, misses=1, evictions=0, size=0)